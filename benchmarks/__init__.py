@@ -0,0 +1,15 @@
+"""Benchmarks measuring the framework's own overhead."""
+
+from benchmarks.runner import (
+    BenchmarkEnv,
+    benchmark,
+    compare_results,
+    run_benchmarks,
+)
+
+__all__ = [
+    "BenchmarkEnv",
+    "benchmark",
+    "compare_results",
+    "run_benchmarks",
+]
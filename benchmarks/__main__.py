@@ -0,0 +1,7 @@
+"""Run framework benchmarks: python -m benchmarks."""
+
+import sys
+
+from benchmarks.runner import main
+
+sys.exit(main())
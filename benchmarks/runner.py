@@ -0,0 +1,268 @@
+"""Benchmark registry, runner and baseline comparison.
+
+Usage:
+    python -m benchmarks                                  # run and store results
+    python -m benchmarks --compare benchmarks/baseline.json
+    python -m benchmarks --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from tools.helpers import get_timestamp, read_json, write_json
+from tools.static_server import StaticServer, TODOMVC_DIR
+
+
+# Registered benchmarks in definition order
+BENCHMARKS: List[Dict[str, Any]] = []
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def benchmark(
+    name: str,
+    params: Optional[Iterable[Any]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    ops: int = 1,
+    tolerance: float = DEFAULT_TOLERANCE,
+    per_engine: bool = False
+) -> Callable:
+    """Register a benchmark.
+
+    The decorated generator receives the BenchmarkEnv (and a parameter when
+    params is given), performs setup, yields the operation to time and cleans
+    up after the yield. With ops > 1 the result is reported as operations per
+    second instead of milliseconds per call. With per_engine the params are
+    engine names and only the engines selected for the run are measured.
+    """
+    def decorator(func: Callable[..., Iterator[Callable[[], Any]]]) -> Callable:
+        for param in (list(params) if params is not None else [None]):
+            BENCHMARKS.append({
+                "name": name.format(param=param),
+                "func": func,
+                "param": param,
+                "repeat": repeat,
+                "warmup": warmup,
+                "ops": ops,
+                "tolerance": tolerance,
+                "per_engine": per_engine,
+            })
+        return func
+    return decorator
+
+
+class BenchmarkEnv:
+    """Shared Playwright instance, browsers and local server for benchmarks."""
+
+    def __init__(self, engines: List[str], headless: bool = True):
+        """Initialize benchmark environment."""
+        self.engines = engines
+        self.headless = headless
+        self.playwright = None
+        self.server: Optional[StaticServer] = None
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="benchmarks_"))
+        self._browsers: Dict[str, Any] = {}
+        self._manager = None
+
+    @property
+    def url(self) -> str:
+        """Get URL of the bundled TodoMVC app."""
+        return f"{self.server.url}/index.html"
+
+    def browser(self, engine: str = "chromium"):
+        """Get a browser for an engine, launched once."""
+        if engine not in self._browsers:
+            browser_type = getattr(self.playwright, engine)
+            self._browsers[engine] = browser_type.launch(headless=self.headless)
+        return self._browsers[engine]
+
+    def __enter__(self) -> "BenchmarkEnv":
+        """Start Playwright and the local server."""
+        from playwright.sync_api import sync_playwright
+
+        self._manager = sync_playwright()
+        self.playwright = self._manager.start()
+        self.server = StaticServer(TODOMVC_DIR).start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close browsers, server and Playwright."""
+        for browser in self._browsers.values():
+            browser.close()
+        self._browsers.clear()
+        if self.server:
+            self.server.stop()
+        if self._manager:
+            self._manager.stop()
+
+
+def measure(spec: Dict[str, Any], env: Any) -> Dict[str, Any]:
+    """Run one registered benchmark and summarize its samples."""
+    args = (env,) if spec["param"] is None else (env, spec["param"])
+    generator = spec["func"](*args)
+    operation = next(generator)
+    try:
+        for _ in range(spec["warmup"]):
+            operation()
+        samples = []
+        for _ in range(spec["repeat"]):
+            started = time.perf_counter()
+            operation()
+            samples.append(time.perf_counter() - started)
+    finally:
+        next(generator, None)
+
+    if spec["ops"] > 1:
+        values = [spec["ops"] / s for s in samples if s > 0]
+        unit, higher_is_better = "ops/s", True
+    else:
+        values = [s * 1000 for s in samples]
+        unit, higher_is_better = "ms", False
+
+    return {
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+        "median": round(statistics.median(values), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+        "repeat": spec["repeat"],
+        "tolerance": spec["tolerance"],
+    }
+
+
+def is_selected(
+    name: str,
+    selected: Optional[List[str]],
+    spec: Optional[Dict[str, Any]] = None,
+    engines: Iterable[str] = ()
+) -> bool:
+    """Check if a benchmark runs for the -k substrings and engines of this run."""
+    if selected and not any(s in name for s in selected):
+        return False
+    return not (spec and spec["per_engine"] and spec["param"] not in engines)
+
+
+def run_benchmarks(
+    env: Any,
+    selected: Optional[List[str]] = None,
+    specs: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Run benchmarks whose names contain any of the selected substrings."""
+    results = {}
+    for spec in BENCHMARKS if specs is None else specs:
+        if not is_selected(spec["name"], selected, spec, env.engines):
+            continue
+        try:
+            results[spec["name"]] = measure(spec, env)
+        except Exception as e:
+            results[spec["name"]] = {"error": f"{type(e).__name__}: {e}"}
+        print(f"{spec['name']:<45} {_format_result(results[spec['name']])}")
+    return results
+
+
+def compare_results(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    expected: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """Find benchmarks that regressed beyond their tolerance, errored or went missing.
+
+    Baseline benchmarks absent from the results count as missing when they
+    are in ``expected``, or always when ``expected`` is not given. Failures
+    other than regressions carry an ``error`` instead of medians.
+    """
+    failures = []
+    expected = set(baseline if expected is None else expected)
+    for name in baseline:
+        if name not in results and name in expected:
+            failures.append({"name": name, "error": "missing from results"})
+
+    for name, result in results.items():
+        if "error" in result:
+            failures.append({"name": name, "error": result["error"]})
+            continue
+        base = baseline.get(name)
+        if not base or "error" in base:
+            continue
+        tolerance = result.get("tolerance", DEFAULT_TOLERANCE)
+        if result["higher_is_better"]:
+            limit = base["median"] * (1 - tolerance)
+            regressed = result["median"] < limit
+        else:
+            limit = base["median"] * (1 + tolerance)
+            regressed = result["median"] > limit
+        if regressed:
+            change = result["median"] / base["median"] - 1 if base["median"] else None
+            failures.append({
+                "name": name,
+                "unit": result["unit"],
+                "baseline": base["median"],
+                "current": result["median"],
+                "change": round(change, 3) if change is not None else None,
+            })
+    return failures
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Format a result for console output."""
+    if "error" in result:
+        return f"ERROR {result['error']}"
+    return f"{result['median']:>12.3f} {result['unit']} (min {result['min']}, max {result['max']})"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    import benchmarks.scenarios  # noqa: F401 - registers benchmarks
+
+    parser = argparse.ArgumentParser(description="Framework overhead benchmarks")
+    parser.add_argument("-k", dest="selected", action="append", default=None,
+                        help="Run only benchmarks whose name contains this substring")
+    parser.add_argument("--engines", default="chromium",
+                        help="Comma-separated engines for browser launch benchmarks")
+    parser.add_argument("--output-dir", type=Path, default=Path("reports/benchmarks"))
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to compare")
+    parser.add_argument("--save-baseline", type=Path, default=None,
+                        help="Write results as the new baseline")
+    args = parser.parse_args(argv)
+
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    if args.compare and not args.compare.exists():
+        print(f"No baseline at {args.compare}; record one with 'make bench-baseline'", file=sys.stderr)
+        return 2
+
+    with BenchmarkEnv(engines) as env:
+        results = run_benchmarks(env, args.selected)
+
+    output = args.output_dir / f"benchmark_{get_timestamp()}.json"
+    write_json(output, results)
+    print(f"\nResults written to {output}")
+
+    if args.save_baseline:
+        write_json(args.save_baseline, results)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.compare:
+        baseline = read_json(args.compare)
+        specs = {spec["name"]: spec for spec in BENCHMARKS}
+        expected = [name for name in baseline if is_selected(name, args.selected, specs.get(name), engines)]
+        failures = compare_results(results, baseline, expected)
+        for f in failures:
+            if "error" in f:
+                print(f"FAILED {f['name']}: {f['error']}")
+            else:
+                print(f"REGRESSION {f['name']}: {f['baseline']} -> {f['current']} {f['unit']}")
+        if failures:
+            return 1
+        print("No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
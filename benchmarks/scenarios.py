@@ -0,0 +1,142 @@
+"""Framework overhead benchmarks against the bundled TodoMVC server."""
+
+import json
+
+from benchmarks.runner import benchmark
+from pages.todo_page import TodoPage
+from plugins.logging_plugin import StructuredLogger
+from tools.fake_tds import FakeTDS
+from tools.test_data_service import TestDataServiceClient
+
+ENGINES = ["chromium", "firefox", "webkit"]
+
+# localStorage key used by the bundled TodoMVC app
+TODO_STORAGE_KEY = "todos-local"
+
+
+def _seed_todos_script(count: int) -> str:
+    """Build an init script that preloads todos into localStorage."""
+    todos = [{"id": i + 1, "title": f"Todo {i + 1}", "completed": False} for i in range(count)]
+    return f"localStorage.setItem({json.dumps(TODO_STORAGE_KEY)}, {json.dumps(json.dumps(todos))});"
+
+
+@benchmark("browser_launch[{param}]", params=ENGINES, repeat=3, per_engine=True)
+def browser_launch(env, engine):
+    """Launch and close a browser."""
+    browser_type = getattr(env.playwright, engine)
+    yield lambda: browser_type.launch(headless=env.headless).close()
+
+
+@benchmark("new_context[{param}]", params=["plain", "tracing", "video"], repeat=10)
+def new_context(env, mode):
+    """Create and close a context with optional tracing or video recording."""
+    browser = env.browser()
+
+    def run():
+        if mode == "video":
+            context = browser.new_context(record_video_dir=str(env.tmp_dir / "videos"))
+        else:
+            context = browser.new_context()
+        if mode == "tracing":
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            context.tracing.stop(path=str(env.tmp_dir / "trace.zip"))
+        context.close()
+
+    yield run
+
+
+@benchmark("new_page", repeat=20)
+def new_page(env):
+    """Open and close a page in an existing context."""
+    context = env.browser().new_context()
+    yield lambda: context.new_page().close()
+    context.close()
+
+
+@benchmark("todo_add_todo", repeat=5, ops=20)
+def todo_add_todo(env):
+    """Add todos through the page object."""
+    context = env.browser().new_context()
+    todo_page = TodoPage(context.new_page())
+    todo_page.navigate(env.url, collect_metrics=False)
+
+    def run():
+        for i in range(20):
+            todo_page.add_todo(f"Benchmark todo {i}")
+
+    yield run
+    context.close()
+
+
+@benchmark("todo_get_all_todos[{param}]", params=[10, 100, 1000], repeat=5)
+def todo_get_all_todos(env, count):
+    """Read all todo texts from a preloaded list."""
+    context = env.browser().new_context()
+    context.add_init_script(_seed_todos_script(count))
+    todo_page = TodoPage(context.new_page())
+    todo_page.navigate(env.url, collect_metrics=False)
+    todo_page.expect_todo_count(count)
+    yield todo_page.get_all_todos
+    context.close()
+
+
+@benchmark("structured_logger_events", repeat=5, ops=1000)
+def structured_logger_events(env):
+    """Write structured log events."""
+    logger = StructuredLogger(env.tmp_dir / "bench_log.jsonl", "benchmark")
+
+    def run():
+        for i in range(1000):
+            logger.log_test_start(f"bench::test_{i}", f"test_{i}", ["smoke"])
+
+    yield run
+    for handler in list(logger.logger.handlers):
+        if getattr(handler, "baseFilename", None) == str(logger.log_path.resolve()):
+            logger.logger.removeHandler(handler)
+            handler.close()
+
+
+@benchmark("screenshot[{param}]", params=["viewport", "full_page"], repeat=10)
+def screenshot(env, mode):
+    """Capture and encode a PNG screenshot of a populated page."""
+    context = env.browser().new_context()
+    context.add_init_script(_seed_todos_script(50))
+    todo_page = TodoPage(context.new_page())
+    todo_page.navigate(env.url, collect_metrics=False)
+    yield lambda: todo_page.screenshot(full_page=mode == "full_page")
+    context.close()
+
+
+@benchmark("tds_get_data[{param}]", params=["cached", "uncached"], repeat=5, ops=100)
+def tds_get_data(env, mode):
+    """Read records from the fake TDS through the client."""
+    fake = FakeTDS.from_config({"seed": {"users": {"kind": "user", "count": 50}}}).start()
+    client = TestDataServiceClient(base_url=fake.url)
+    if mode == "uncached":
+        client.cache = None
+
+    def run():
+        for i in range(100):
+            client.get_data("users", {"role": str(i % 10)})
+
+    yield run
+    client.close()
+    fake.stop()
+
+
+@benchmark("tds_lock_release[{param}]", params=["bulk", "fan_out"], repeat=5, ops=50)
+def tds_lock_release(env, mode):
+    """Lock and release 50 records on the fake TDS."""
+    fake = FakeTDS(bulk=mode == "bulk")
+    fake.state.seed("users", [{"id": str(i)} for i in range(50)])
+    fake.start()
+    client = TestDataServiceClient(base_url=fake.url)
+    ids = [str(i) for i in range(50)]
+
+    def run():
+        client.lock_many("users", ids, "benchmark").raise_for_errors()
+        client.release_many("users", ids, "benchmark").raise_for_errors()
+
+    yield run
+    client.close()
+    fake.stop()
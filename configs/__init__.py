@@ -1,61 +1,18 @@
-"""Configuration management module."""
+"""Configuration management module.
+
+Settings and the YAML config are built on first use rather than at import, so
+importing fixtures and plugins stays cheap for collection and xdist workers.
+"""
 
-import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import yaml
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
-
-class Settings(BaseSettings):
-    """Global settings from environment variables."""
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="allow"
-    )
-
-    # Environment
-    env: str = Field(default="dev", alias="ENV")
-    base_url: str = Field(default="https://example.com", alias="BASE_URL")
-
-    # Browser
-    browser: str = Field(default="chromium", alias="BROWSER")
-    headless: bool = Field(default=True, alias="HEADLESS")
-    slow_mo: int = Field(default=0, alias="SLOW_MO")
-    timeout: int = Field(default=30000, alias="TIMEOUT")
-
-    # Test Execution
-    parallel_workers: int = Field(default=4, alias="PARALLEL_WORKERS")
-    retry_count: int = Field(default=2, alias="RETRY_COUNT")
-
-    # Reporting
-    report_type: str = Field(default="allure", alias="REPORT_TYPE")
-    screenshot_on_failure: bool = Field(default=True, alias="SCREENSHOT_ON_FAILURE")
-    video_on_failure: bool = Field(default=True, alias="VIDEO_ON_FAILURE")
-    trace_on_failure: bool = Field(default=True, alias="TRACE_ON_FAILURE")
 
-    # Test Data Service
-    tds_base_url: str = Field(default="http://localhost:8080/api/v1", alias="TDS_BASE_URL")
-    tds_api_key: str = Field(default="", alias="TDS_API_KEY")
-    tds_timeout: int = Field(default=10, alias="TDS_TIMEOUT")
+from configs.snapshot import ConfigSnapshot, build_snapshot, flatten, thaw
 
-    # Logging
-    log_level: str = Field(default="INFO", alias="LOG_LEVEL")
-    log_format: str = Field(default="json", alias="LOG_FORMAT")
-
-    # Artifacts
-    artifacts_path: str = Field(default="./artifacts", alias="ARTIFACTS_PATH")
-    reports_path: str = Field(default="./reports", alias="REPORTS_PATH")
-
-    # CI/CD
-    ci: bool = Field(default=False, alias="CI")
-    build_id: str = Field(default="local", alias="BUILD_ID")
-    run_id: str = Field(default="local-run", alias="RUN_ID")
+if TYPE_CHECKING:
+    from configs.env_settings import Settings
 
 
 class ConfigLoader:
@@ -67,23 +24,28 @@ class ConfigLoader:
             config_path = Path(__file__).parent / "config.yaml"
         self.config_path = config_path
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._load_config()
 
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "ConfigLoader":
+        """Create a loader from already parsed configuration."""
+        loader = cls.__new__(cls)
+        loader.config_path = None
+        loader._config = config
+        loader._flat = flatten(config)
+        return loader
+
     def _load_config(self) -> None:
         """Load configuration from YAML file."""
         if self.config_path.exists():
             with open(self.config_path, "r") as f:
                 self._config = yaml.safe_load(f) or {}
+        self._flat = flatten(self._config)
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        keys = key.split(".")
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        """Get configuration value by dotted key."""
+        value = self._flat.get(key)
         return value if value is not None else default
 
     def get_env_config(self, env: str) -> Dict[str, Any]:
@@ -100,35 +62,83 @@ class ConfigLoader:
         devices = self._config.get("devices", {})
         return devices.get(device, {})
 
+    def get_throttling_config(self, profile: Any) -> Dict[str, Any]:
+        """Resolve a throttling preset name or inline mapping."""
+        if isinstance(profile, dict):
+            return profile
+        presets = self._config.get("throttling", {})
+        if profile not in presets:
+            raise ValueError(
+                f"Unknown throttling profile '{profile}'. Available: {', '.join(presets)}"
+            )
+        return presets[profile]
+
     def get_execution_config(self) -> Dict[str, Any]:
         """Get execution configuration."""
         return self._config.get("execution", {})
 
 
-# Global instances
-settings = Settings()
-config_loader = ConfigLoader()
+# Global instances, created lazily by the accessors below
+_settings: Optional["Settings"] = None
+_config_loader: Optional[ConfigLoader] = None
 
 
-def get_settings() -> Settings:
+def get_settings() -> "Settings":
     """Get global settings instance."""
-    return settings
+    global _settings
+    if _settings is None:
+        from configs.env_settings import Settings
+        _settings = Settings()
+    return _settings
 
 
 def get_config_loader() -> ConfigLoader:
     """Get global config loader instance."""
-    return config_loader
+    global _config_loader
+    if _config_loader is None:
+        _config_loader = ConfigLoader()
+    return _config_loader
+
+
+def use_snapshot(snapshot: ConfigSnapshot) -> None:
+    """Serve settings and config from a resolved snapshot instead of .env and YAML."""
+    global _settings, _config_loader
+    from configs.env_settings import Settings
+    _settings = Settings.model_construct(**thaw(snapshot.settings))
+    _config_loader = ConfigLoader.from_dict(thaw(snapshot.config))
+
+
+def resolve_snapshot(options: Dict[str, Any]) -> ConfigSnapshot:
+    """Resolve the effective configuration for the given run options."""
+    return build_snapshot(
+        get_settings().model_dump(),
+        get_config_loader()._config,
+        options,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve settings, config_loader and Settings on first access."""
+    if name == "settings":
+        return get_settings()
+    if name == "config_loader":
+        return get_config_loader()
+    if name == "Settings":
+        from configs.env_settings import Settings
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_base_url(env: Optional[str] = None) -> str:
     """Get base URL for environment."""
+    settings = get_settings()
     env = env or settings.env
-    env_config = config_loader.get_env_config(env)
+    env_config = get_config_loader().get_env_config(env)
     return env_config.get("base_url", settings.base_url)
 
 
 def get_api_url(env: Optional[str] = None) -> str:
     """Get API URL for environment."""
-    env = env or settings.env
-    env_config = config_loader.get_env_config(env)
+    env = env or get_settings().env
+    env_config = get_config_loader().get_env_config(env)
     return env_config.get("api_url", "")
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""Global settings loaded from environment variables and .env."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Global settings from environment variables."""
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="allow"
+    )
+
+    # Environment
+    env: str = Field(default="dev", alias="ENV")
+    base_url: str = Field(default="https://example.com", alias="BASE_URL")
+
+    # Browser
+    browser: str = Field(default="chromium", alias="BROWSER")
+    headless: bool = Field(default=True, alias="HEADLESS")
+    slow_mo: int = Field(default=0, alias="SLOW_MO")
+    timeout: int = Field(default=30000, alias="TIMEOUT")
+
+    # Test Execution
+    parallel_workers: int = Field(default=4, alias="PARALLEL_WORKERS")
+    retry_count: int = Field(default=2, alias="RETRY_COUNT")
+
+    # Reporting
+    report_type: str = Field(default="allure", alias="REPORT_TYPE")
+    screenshot_on_failure: bool = Field(default=True, alias="SCREENSHOT_ON_FAILURE")
+    video_on_failure: bool = Field(default=True, alias="VIDEO_ON_FAILURE")
+    trace_on_failure: bool = Field(default=True, alias="TRACE_ON_FAILURE")
+
+    # Test Data Service
+    tds_base_url: str = Field(default="http://localhost:8080/api/v1", alias="TDS_BASE_URL")
+    tds_api_key: str = Field(default="", alias="TDS_API_KEY")
+    tds_timeout: int = Field(default=10, alias="TDS_TIMEOUT")
+
+    # Logging
+    log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    log_format: str = Field(default="json", alias="LOG_FORMAT")
+
+    # Artifacts
+    artifacts_path: str = Field(default="./artifacts", alias="ARTIFACTS_PATH")
+    reports_path: str = Field(default="./reports", alias="REPORTS_PATH")
+
+    # CI/CD
+    ci: bool = Field(default=False, alias="CI")
+    build_id: str = Field(default="local", alias="BUILD_ID")
+    run_id: str = Field(default="local-run", alias="RUN_ID")
@@ -1,8 +1,28 @@
 """Custom pytest command line options."""
 
+import os
+from typing import List, Optional
+
 import pytest
 
 
+ENGINES = ("chromium", "firefox", "webkit")
+
+
+def parse_browsers(value: Optional[str]) -> List[str]:
+    """Parse a --browsers value such as "chromium,firefox" into engine names."""
+    engines = []
+    for engine in (value or "").split(","):
+        engine = engine.strip().lower()
+        if not engine:
+            continue
+        if engine not in ENGINES:
+            raise pytest.UsageError(f"--browsers: unknown engine '{engine}', use {', '.join(ENGINES)}")
+        if engine not in engines:
+            engines.append(engine)
+    return engines
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     """Add custom command line options."""
     parser.addoption(
@@ -12,6 +32,12 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         help="Browser to use: chromium, firefox, webkit",
         choices=["chromium", "firefox", "webkit"]
     )
+    parser.addoption(
+        "--browsers",
+        action="store",
+        default=None,
+        help="Comma-separated engines to run every browser test on in one session, e.g. chromium,firefox,webkit"
+    )
     parser.addoption(
         "--headless",
         action="store",
@@ -28,7 +54,32 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         "--env",
         action="store",
         default="dev",
-        help="Environment: dev, staging, prod"
+        help="Environment: dev, staging, prod, local"
+    )
+    parser.addoption(
+        "--local-server",
+        action="store",
+        default=None,
+        help="Local TodoMVC server for --env=local: worker (per xdist worker), shared",
+        choices=["worker", "shared"]
+    )
+    parser.addoption(
+        "--fake-tds",
+        action="store_true",
+        default=False,
+        help="Point the TDS client at an in-process fake Test Data Service"
+    )
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="Attach to the persistent browser server instead of launching browsers"
+    )
+    parser.addoption(
+        "--profile-startup",
+        action="store_true",
+        default=False,
+        help="Report import and collection time per module"
     )
     parser.addoption(
         "--suite",
@@ -40,7 +91,7 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         "--parallel",
         action="store",
         default="1",
-        help="Number of parallel workers"
+        help="Number of parallel workers, or auto to size xdist workers to CPUs, memory and /dev/shm"
     )
     parser.addoption(
         "--report",
@@ -56,14 +107,52 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
 
 
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest based on command line options."""
     # Store config options for global access
     config.option.browser_name = config.getoption("--custom-browser")
+    engines = parse_browsers(config.getoption("--browsers"))
+    if engines:
+        # pytest-playwright parametrizes browser tests over its --browser list
+        config.option.browser = engines
+    config.option.browser_engines = list(config.getoption("--browser", None) or []) or [config.option.browser_name]
     config.option.headless_mode = config.getoption("--headless").lower() == "true"
     config.option.device_name = config.getoption("--custom-device")
     config.option.environment = config.getoption("--env")
     config.option.test_suite = config.getoption("--suite")
-    config.option.parallel_workers = int(config.getoption("--parallel"))
+    parallel = config.getoption("--parallel")
+    # "auto" was turned into a worker count by -n auto before configuration
+    config.option.parallel_workers = int(parallel) if parallel != "auto" else int(
+        config.getoption("numprocesses", None) or os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1)
+    )
     config.option.report_type = config.getoption("--report")
     config.option.run_id = config.getoption("--run-id")
+
+    # Resolve configuration once in the controller; workers use its snapshot
+    from configs import resolve_snapshot, use_snapshot
+    from configs.snapshot import ConfigSnapshot
+
+    workerinput = getattr(config, "workerinput", {})
+    if "config_snapshot" in workerinput:
+        snapshot = ConfigSnapshot(workerinput["config_snapshot"])
+    else:
+        snapshot = resolve_snapshot({
+            "browser_name": config.option.browser_name,
+            "browser_engines": config.option.browser_engines,
+            "headless": config.option.headless_mode,
+            "device_name": config.option.device_name,
+            "environment": config.option.environment,
+            "test_suite": config.option.test_suite,
+            "parallel_workers": config.option.parallel_workers,
+            "report_type": config.option.report_type,
+            "run_id": config.option.run_id,
+        })
+    use_snapshot(snapshot)
+    config._config_snapshot = snapshot
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """Send the resolved configuration snapshot to an xdist worker."""
+    node.workerinput["config_snapshot"] = node.config._config_snapshot.to_dict()
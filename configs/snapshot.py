@@ -0,0 +1,136 @@
+"""Immutable snapshot of the effective configuration for a test run.
+
+The controller resolves settings, the YAML config, the environment overlay,
+the browser/device profile and execution options once. xdist workers receive
+the snapshot through ``workerinput`` instead of re-reading ``.env`` and
+``config.yaml``, so every process of a run sees the same configuration.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+def flatten(mapping: Mapping[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested mappings into dotted keys, keeping intermediate nodes."""
+    flat: Dict[str, Any] = {}
+    for key, value in mapping.items():
+        dotted = f"{prefix}{key}"
+        flat[dotted] = value
+        if isinstance(value, Mapping):
+            flat.update(flatten(value, f"{dotted}."))
+    return flat
+
+
+def freeze(value: Any) -> Any:
+    """Make nested dicts and lists read-only."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Convert a frozen value back to plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+class ConfigSnapshot:
+    """Read-only, pre-flattened view of the resolved run configuration."""
+
+    def __init__(self, data: Mapping[str, Any]):
+        """Initialize config snapshot."""
+        self._data = freeze(data)
+        self._flat = MappingProxyType(flatten(self._data))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by dotted key, e.g. "settings.timeout" or "resolved.base_url"."""
+        value = self._flat.get(key)
+        return value if value is not None else default
+
+    def get_config(self, key: str, default: Any = None) -> Any:
+        """Get a value from config.yaml by dotted key."""
+        return self.get(f"config.{key}", default)
+
+    @property
+    def settings(self) -> Mapping[str, Any]:
+        """Get settings resolved from the environment and .env."""
+        return self._data["settings"]
+
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Get the parsed config.yaml."""
+        return self._data["config"]
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        """Get the effective command line options."""
+        return self._data["options"]
+
+    @property
+    def base_url(self) -> str:
+        """Get base URL of the selected environment."""
+        return self._data["resolved"]["base_url"]
+
+    @property
+    def api_url(self) -> str:
+        """Get API URL of the selected environment."""
+        return self._data["resolved"]["api_url"]
+
+    @property
+    def env_config(self) -> Mapping[str, Any]:
+        """Get the selected environment overlay."""
+        return self._data["resolved"]["env"]
+
+    @property
+    def browser(self) -> Mapping[str, Any]:
+        """Get the selected browser profile."""
+        return self._data["resolved"]["browser"]
+
+    def browser_profile(self, engine: str) -> Mapping[str, Any]:
+        """Get the browser profile of an engine, for runs over several engines."""
+        return self.get_config(f"browsers.{engine}", MappingProxyType({}))
+
+    @property
+    def device(self) -> Mapping[str, Any]:
+        """Get the selected device profile, empty without device emulation."""
+        return self._data["resolved"]["device"]
+
+    @property
+    def execution(self) -> Mapping[str, Any]:
+        """Get execution options."""
+        return self._data["resolved"]["execution"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain data that can be sent to xdist workers."""
+        return thaw(self._data)
+
+
+def build_snapshot(
+    settings: Mapping[str, Any],
+    config: Mapping[str, Any],
+    options: Mapping[str, Any]
+) -> ConfigSnapshot:
+    """Resolve the effective configuration for the selected env, browser and device."""
+    env = options.get("environment") or settings.get("env")
+    env_config = config.get(env, {}) or {}
+    browser_name = options.get("browser_name") or settings.get("browser")
+    device_name: Optional[str] = options.get("device_name")
+
+    return ConfigSnapshot({
+        "settings": dict(settings),
+        "config": dict(config),
+        "options": dict(options),
+        "resolved": {
+            "env": env_config,
+            "base_url": env_config.get("base_url", settings.get("base_url")),
+            "api_url": env_config.get("api_url", ""),
+            "browser": (config.get("browsers") or {}).get(browser_name, {}),
+            "device": (config.get("devices") or {}).get(device_name, {}) if device_name else {},
+            "execution": config.get("execution", {}) or {},
+        },
+    })
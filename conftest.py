@@ -3,45 +3,63 @@
 import pytest
 from pathlib import Path
 
-# Import fixtures
-from fixtures import *
-from plugins import *
+# Plugin and fixture modules import one another; marking the packages first lets
+# pytest rewrite their asserts whichever of them is imported first
+pytest.register_assert_rewrite("plugins", "fixtures")
 
-# Import custom CLI options
-from configs.pytest_cli import pytest_addoption, pytest_configure
+from plugins.startup_profiler_plugin import install_import_timer, profiling_requested
 
+# Time framework imports before the plugins below are loaded
+if profiling_requested():
+    install_import_timer()
 
-# Hook imports are handled by the plugin modules
+
+# CLI options, fixtures and hooks are registered as plugins instead of being
+# star-imported, so each module is imported once and hooks register once
 pytest_plugins = [
+    "configs.pytest_cli",
+    "fixtures.config_fixtures",
+    "fixtures.browser_fixtures",
+    "fixtures.server_fixtures",
+    "fixtures.data_fixtures",
+    "fixtures.tds_fixtures",
+    "plugins.startup_profiler_plugin",
     "plugins.artifacts_plugin",
+    "plugins.browser_matrix_plugin",
+    "plugins.device_plugin",
     "plugins.logging_plugin",
+    "plugins.performance_plugin",
+    "plugins.local_server_plugin",
+    "plugins.data_source_plugin",
+    "plugins.data_store_plugin",
+    "plugins.tds_plugin",
+    "plugins.worker_sizing_plugin",
 ]
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment(request):
+def setup_test_environment(config_snapshot):
     """Setup test environment before all tests."""
-    from configs import get_settings
-    
-    settings = get_settings()
+    settings = config_snapshot.settings
+    options = config_snapshot.options
     
     # Create required directories
-    artifacts_path = Path(settings.artifacts_path)
+    artifacts_path = Path(settings["artifacts_path"])
     artifacts_path.mkdir(parents=True, exist_ok=True)
     
-    reports_path = Path(settings.reports_path)
+    reports_path = Path(settings["reports_path"])
     reports_path.mkdir(parents=True, exist_ok=True)
     
     # Print configuration
     print("\n" + "="*80)
     print("Test Execution Configuration")
     print("="*80)
-    print(f"Environment: {settings.env}")
-    print(f"Browser: {request.config.option.browser_name}")
-    print(f"Headless: {request.config.option.headless_mode}")
-    print(f"Base URL: {settings.base_url}")
-    print(f"Artifacts Path: {settings.artifacts_path}")
-    print(f"Reports Path: {settings.reports_path}")
+    print(f"Environment: {options['environment']}")
+    print(f"Browser: {options['browser_name']}")
+    print(f"Headless: {options['headless']}")
+    print(f"Base URL: {config_snapshot.base_url}")
+    print(f"Artifacts Path: {settings['artifacts_path']}")
+    print(f"Reports Path: {settings['reports_path']}")
     print("="*80 + "\n")
     
     yield
@@ -1,34 +1,63 @@
-"""Shared fixtures - imported by conftest.py."""
-
-from fixtures.browser_fixtures import (
-    browser_type_launch_args,
-    browser_context_args,
-    context,
-    page,
-    authenticated_page,
-    base_url,
-    api_url,
-)
-
-from fixtures.data_fixtures import (
-    test_data_dir,
-    test_user,
-    admin_user,
-    load_test_data,
-    sample_todos,
-)
-
-__all__ = [
-    "browser_type_launch_args",
-    "browser_context_args",
-    "context",
-    "page",
-    "authenticated_page",
-    "base_url",
-    "api_url",
-    "test_data_dir",
-    "test_user",
-    "admin_user",
-    "load_test_data",
-    "sample_todos",
-]
+"""Shared fixtures, registered by conftest.py through pytest_plugins.
+
+Exports are resolved on first access so importing one fixture module does not
+load the others, and pytest can rewrite assertions in each module it registers.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "config_snapshot": "fixtures.config_fixtures",
+    "browser_type_launch_args": "fixtures.browser_fixtures",
+    "browser_context_args": "fixtures.browser_fixtures",
+    "device_descriptors": "fixtures.browser_fixtures",
+    "device_name": "fixtures.browser_fixtures",
+    "browser_server_client": "fixtures.browser_fixtures",
+    "browser_pool": "fixtures.browser_fixtures",
+    "browser": "fixtures.browser_fixtures",
+    "context": "fixtures.browser_fixtures",
+    "page": "fixtures.browser_fixtures",
+    "throttling_profile": "fixtures.browser_fixtures",
+    "heap_leak_detector": "fixtures.browser_fixtures",
+    "authenticated_page": "fixtures.browser_fixtures",
+    "base_url": "fixtures.browser_fixtures",
+    "api_url": "fixtures.browser_fixtures",
+    "local_todo_server": "fixtures.server_fixtures",
+    "route_latency": "fixtures.server_fixtures",
+    "fake_tds": "fixtures.tds_fixtures",
+    "tds_client": "fixtures.tds_fixtures",
+    "async_tds_client": "fixtures.tds_fixtures",
+    "tds_prefetch": "fixtures.tds_fixtures",
+    "tds_prefetch_at_start": "fixtures.tds_fixtures",
+    "tds_leases": "fixtures.tds_fixtures",
+    "tds_lease_pools": "fixtures.tds_fixtures",
+    "leased_record": "fixtures.tds_fixtures",
+    "test_data_dir": "fixtures.data_fixtures",
+    "data_registry": "fixtures.data_fixtures",
+    "data_store": "fixtures.data_fixtures",
+    "test_user": "fixtures.data_fixtures",
+    "admin_user": "fixtures.data_fixtures",
+    "load_test_data": "fixtures.data_fixtures",
+    "sample_todos": "fixtures.data_fixtures",
+    "record": "fixtures.data_fixtures",
+    "unique_identities": "fixtures.data_fixtures",
+    "data_generator": "fixtures.data_fixtures",
+    "data_pool": "fixtures.data_fixtures",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported fixture from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List exported names."""
+    return sorted(set(globals()) | set(__all__))
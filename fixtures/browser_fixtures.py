@@ -1,113 +1,229 @@
 """Core pytest fixtures for browser and context management."""
 
+import os
 import pytest
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Generator, Dict, Any
+from typing import Generator, Dict, Any, Optional
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright
 
-from configs import get_settings, get_config_loader
+from configs import get_config_loader
+from configs.snapshot import ConfigSnapshot, thaw
+from tools.helpers import sanitize_filename
+from tools.throttling import apply_throttling, supports_throttling
+from tools.leak_detector import HeapLeakDetector
+from tools.browser_pool import BrowserPool
+from tools.browser_server import BrowserServerClient
+from tools.devices import DEVICE_KEYS, DeviceDescriptors
 
 
 @pytest.fixture(scope="session")
-def browser_type_launch_args(pytestconfig: pytest.Config) -> Dict[str, Any]:
-    """Get browser launch arguments based on configuration."""
-    settings = get_settings()
-    config_loader = get_config_loader()
-    
-    browser_name = pytestconfig.option.browser_name
-    browser_config = config_loader.get_browser_config(browser_name)
-    
+def browser_type_launch_args(config_snapshot: ConfigSnapshot, browser_name: str) -> Dict[str, Any]:
+    """Get browser launch arguments of the test's engine based on configuration."""
     launch_args = {
-        "headless": pytestconfig.option.headless_mode,
-        "slow_mo": settings.slow_mo,
+        "headless": config_snapshot.options["headless"],
+        "slow_mo": config_snapshot.settings["slow_mo"],
     }
-    
-    if browser_config.get("args"):
-        launch_args["args"] = browser_config["args"]
-    
+
+    browser_profile = config_snapshot.browser_profile(browser_name)
+    if browser_profile.get("args"):
+        launch_args["args"] = list(browser_profile["args"])
+
     return launch_args
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(pytestconfig: pytest.Config) -> Dict[str, Any]:
-    """Get browser context arguments based on configuration."""
-    settings = get_settings()
-    config_loader = get_config_loader()
-    
+def browser_context_args(config_snapshot: ConfigSnapshot, browser_name: str) -> Dict[str, Any]:
+    """Get browser context arguments of the test's engine based on configuration."""
+    settings = config_snapshot.settings
+    browser_profile = config_snapshot.browser_profile(browser_name)
+
     context_args = {
         "viewport": {"width": 1920, "height": 1080},
         "ignore_https_errors": True,
         "record_video_dir": None,
         "record_har_path": None,
     }
-    
-    # Device emulation
-    device_name = pytestconfig.option.device_name
-    if device_name:
-        device_config = config_loader.get_device_config(device_name)
-        if device_config:
-            if "viewport" in device_config:
-                context_args["viewport"] = device_config["viewport"]
-            if "user_agent" in device_config:
-                context_args["user_agent"] = device_config["user_agent"]
-            if "device_scale_factor" in device_config:
-                context_args["device_scale_factor"] = device_config["device_scale_factor"]
-            if "is_mobile" in device_config:
-                context_args["is_mobile"] = device_config["is_mobile"]
-            if "has_touch" in device_config:
-                context_args["has_touch"] = device_config["has_touch"]
-    else:
-        # Browser-specific viewport
-        browser_name = pytestconfig.option.browser_name
-        browser_config = config_loader.get_browser_config(browser_name)
-        if "viewport" in browser_config:
-            context_args["viewport"] = browser_config["viewport"]
-    
+
+    # Browser-specific viewport; the context fixture applies device emulation per test
+    if "viewport" in browser_profile:
+        context_args["viewport"] = thaw(browser_profile["viewport"])
+
     # Video recording on failure
-    if settings.video_on_failure:
-        artifacts_path = Path(settings.artifacts_path)
+    if settings["video_on_failure"]:
+        artifacts_path = Path(settings["artifacts_path"])
         artifacts_path.mkdir(parents=True, exist_ok=True)
         context_args["record_video_dir"] = str(artifacts_path / "videos")
     
     return context_args
 
 
+@pytest.fixture(scope="session")
+def device_descriptors(config_snapshot: ConfigSnapshot, playwright: Playwright) -> DeviceDescriptors:
+    """Get device profiles from config.yaml and Playwright, each resolved once per session."""
+    return DeviceDescriptors(thaw(config_snapshot.get_config("devices", {})), playwright.devices)
+
+
+@pytest.fixture(scope="function")
+def device_name(request: pytest.FixtureRequest, config_snapshot: ConfigSnapshot) -> Optional[str]:
+    """Get the device the test emulates: its device parameter or marker, --device, else --custom-device."""
+    return request.getfixturevalue("device") or config_snapshot.options["device_name"]
+
+
+@pytest.fixture(scope="session")
+def browser_server_client(
+    browser_type,
+    pytestconfig: pytest.Config
+) -> Optional[BrowserServerClient]:
+    """Get a client for the persistent browser server when --browser-server is set."""
+    if not pytestconfig.getoption("--browser-server"):
+        return None
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    client = BrowserServerClient(browser_type, worker_index=int(worker_id.lstrip("gw") or 0))
+    if not client.available():
+        pytest.exit(
+            f"--browser-server is set but no {browser_type.name} browser server is running. "
+            f"Start one with: make browser-server-start",
+            returncode=4,
+        )
+    return client
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright: Playwright) -> Generator[BrowserPool, None, None]:
+    """Get the worker's launched browsers, one per engine, closed at session end."""
+    pool = BrowserPool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser(
+    launch_browser,
+    browser_type,
+    browser_pool: BrowserPool,
+    browser_server_client: Optional[BrowserServerClient]
+) -> Generator[Browser, None, None]:
+    """Attach to the persistent browser server or take the engine's browser from the pool."""
+    if browser_server_client:
+        yield browser_server_client.browser()
+        browser_server_client.close()
+        return
+    yield browser_pool.get(browser_type.name, launch_browser)
+
+
 @pytest.fixture(scope="function")
 def context(
     browser: Browser,
     browser_context_args: Dict[str, Any],
-    pytestconfig: pytest.Config
+    browser_server_client: Optional[BrowserServerClient],
+    device_name: Optional[str],
+    device_descriptors: DeviceDescriptors,
+    config_snapshot: ConfigSnapshot,
+    request: pytest.FixtureRequest
 ) -> Generator[BrowserContext, None, None]:
-    """Create a new browser context for each test."""
-    settings = get_settings()
-    
-    # Add tracing if enabled
-    ctx = browser.new_context(**browser_context_args)
-    
-    if settings.trace_on_failure:
-        ctx.tracing.start(screenshots=True, snapshots=True, sources=True)
-    
-    yield ctx
-    
-    # Save trace on failure
-    if settings.trace_on_failure:
-        artifacts_path = Path(settings.artifacts_path)
-        artifacts_path.mkdir(parents=True, exist_ok=True)
-        trace_path = artifacts_path / "traces" / f"{pytestconfig.option.run_id}_trace.zip"
-        trace_path.parent.mkdir(parents=True, exist_ok=True)
-        ctx.tracing.stop(path=str(trace_path))
-    
-    ctx.close()
+    """Create a new browser context for each test, emulating the test's device."""
+    settings = config_snapshot.settings
+
+    context_args = dict(browser_context_args)
+    if device_name:
+        for key in DEVICE_KEYS:
+            context_args.pop(key, None)
+        context_args.update(device_descriptors.context_args(device_name, browser.browser_type.name))
+
+    slot = nullcontext()
+    if browser_server_client:
+        # Reconnect if the server was restarted and hold a context slot on it
+        browser = browser_server_client.browser()
+        slot = browser_server_client.context_slot()
+
+    with slot:
+        # Add tracing if enabled
+        ctx = browser.new_context(**context_args)
+
+        if settings["trace_on_failure"]:
+            ctx.tracing.start(screenshots=True, snapshots=True, sources=True)
+
+        yield ctx
+
+        # Save trace on failure
+        if settings["trace_on_failure"]:
+            artifacts_path = Path(settings["artifacts_path"])
+            artifacts_path.mkdir(parents=True, exist_ok=True)
+            test_name = sanitize_filename(request.node.nodeid.replace("::", "_"))
+            trace_name = f"{config_snapshot.options['run_id']}_{test_name}_trace.zip"
+            trace_path = artifacts_path / "traces" / trace_name
+            trace_path.parent.mkdir(parents=True, exist_ok=True)
+            ctx.tracing.stop(path=str(trace_path))
+
+        ctx.close()
 
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Generator[Page, None, None]:
+def page(
+    context: BrowserContext,
+    throttling_profile: Optional[Dict[str, Any]]
+) -> Generator[Page, None, None]:
     """Create a new page for each test."""
     page = context.new_page()
+    if throttling_profile:
+        browser_name = context.browser.browser_type.name if context.browser else ""
+        if not supports_throttling(browser_name):
+            page.close()
+            pytest.skip(f"CPU/network throttling requires Chromium (CDP), not {browser_name}")
+        apply_throttling(context, page, throttling_profile)
     yield page
     page.close()
 
 
+@pytest.fixture(scope="function")
+def throttling_profile(
+    request: pytest.FixtureRequest,
+    device_name: Optional[str],
+    device_descriptors: DeviceDescriptors
+) -> Optional[Dict[str, Any]]:
+    """Resolve throttling from the throttle marker or the emulated device profile."""
+    config_loader = get_config_loader()
+
+    marker = request.node.get_closest_marker("throttle")
+    if marker and marker.args:
+        return config_loader.get_throttling_config(marker.args[0])
+
+    device_throttling = device_descriptors.throttling(device_name) if device_name else None
+    if device_throttling:
+        return config_loader.get_throttling_config(device_throttling)
+
+    return None
+
+
+@pytest.fixture(scope="function")
+def heap_leak_detector(
+    page: Page,
+    config_snapshot: ConfigSnapshot,
+    request: pytest.FixtureRequest
+) -> Generator[HeapLeakDetector, None, None]:
+    """Provide a JS heap leak detector; saves a heap snapshot if the test fails."""
+    browser_name = page.context.browser.browser_type.name if page.context.browser else ""
+    if browser_name != "chromium":
+        pytest.skip(f"JS heap leak detection requires Chromium (CDP), not {browser_name}")
+
+    leak_config = config_snapshot.get_config("leak_detection", {})
+    detector = HeapLeakDetector.for_page(
+        page,
+        iterations=leak_config.get("iterations", 20),
+        warmup=leak_config.get("warmup", 3),
+        max_growth_bytes=leak_config.get("max_growth_kb", 1024) * 1024,
+    )
+
+    yield detector
+
+    report = getattr(request.node, "report_call", None)
+    if report and report.failed:
+        test_name = sanitize_filename(request.node.nodeid.replace("::", "_"))
+        snapshot_path = Path(config_snapshot.settings["artifacts_path"]) / "heap" / f"{test_name}.heapsnapshot"
+        detector.save_heap_snapshot(snapshot_path)
+
+
 @pytest.fixture(scope="function")
 def authenticated_page(page: Page) -> Generator[Page, None, None]:
     """Create an authenticated page session."""
@@ -118,16 +234,14 @@ def authenticated_page(page: Page) -> Generator[Page, None, None]:
 
 
 @pytest.fixture(scope="session")
-def base_url(pytestconfig: pytest.Config) -> str:
+def base_url(config_snapshot: ConfigSnapshot, request: pytest.FixtureRequest) -> str:
     """Get base URL for the current environment."""
-    from configs import get_base_url
-    env = pytestconfig.option.environment
-    return get_base_url(env)
+    if config_snapshot.options["environment"] == "local":
+        return request.getfixturevalue("local_todo_server").url
+    return config_snapshot.base_url
 
 
 @pytest.fixture(scope="session")
-def api_url(pytestconfig: pytest.Config) -> str:
+def api_url(config_snapshot: ConfigSnapshot) -> str:
     """Get API URL for the current environment."""
-    from configs import get_api_url
-    env = pytestconfig.option.environment
-    return get_api_url(env)
+    return config_snapshot.api_url
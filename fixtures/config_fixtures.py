@@ -0,0 +1,11 @@
+"""Fixtures exposing the resolved configuration snapshot."""
+
+import pytest
+
+from configs.snapshot import ConfigSnapshot
+
+
+@pytest.fixture(scope="session")
+def config_snapshot(pytestconfig: pytest.Config) -> ConfigSnapshot:
+    """Get the configuration resolved once by the controller for this run."""
+    return pytestconfig._config_snapshot
@@ -1,9 +1,16 @@
 """Test data fixtures and utilities."""
 
 import pytest
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Generator, Mapping, Optional, Sequence
 from pathlib import Path
-import json
+
+from configs import get_settings
+from configs.snapshot import ConfigSnapshot, thaw
+from tools.data_generator import DataGenerator, GeneratedPool, seed_for
+from tools.data_uniqueness import TDSIdentityCheck, UniqueIdentities, worker_partition
+from tools.data_registry import DataRegistry
+from tools.data_store import DataStoreSet
+from plugins.data_source_plugin import data_source_for
 
 
 @pytest.fixture(scope="session")
@@ -12,11 +19,24 @@ def test_data_dir() -> Path:
     return Path(__file__).parent.parent / "tests" / "data"
 
 
+@pytest.fixture(scope="session")
+def data_registry(test_data_dir: Path, config_snapshot: ConfigSnapshot) -> DataRegistry:
+    """Get the session registry of parsed and indexed test data files."""
+    return DataRegistry(test_data_dir, thaw(config_snapshot.get_config("test_data", {})))
+
+
+@pytest.fixture(scope="session")
+def data_store(pytestconfig: pytest.Config) -> Generator[DataStoreSet, None, None]:
+    """Get memory-mapped stores compiled from test data files for this run."""
+    stores = DataStoreSet(pytestconfig._data_store_paths)
+    yield stores
+    stores.close()
+
+
 @pytest.fixture(scope="function")
-def test_user(load_test_data) -> Dict[str, Any]:
+def test_user(data_store: DataStoreSet) -> Mapping[str, Any]:
     """Provide a test user data from JSON."""
-    data = load_test_data("users.json")
-    users = data.get("users", [])
+    users = data_store("users.json").collection("users")
     if not users:
         raise ValueError("No users found in users.json")
     # Return the first user
@@ -24,33 +44,70 @@ def test_user(load_test_data) -> Dict[str, Any]:
 
 
 @pytest.fixture(scope="function")
-def admin_user(load_test_data) -> Dict[str, Any]:
+def admin_user(data_store: DataStoreSet) -> Mapping[str, Any]:
     """Provide an admin user data from JSON."""
-    data = load_test_data("users.json")
-    users = data.get("users", [])
-    admin_users = [u for u in users if u.get("role") == "admin"]
+    admin_users = data_store("users.json").collection("users").find("role", "admin")
     if not admin_users:
         raise ValueError("No admin users found in users.json")
     return admin_users[0]
 
 
-@pytest.fixture(scope="function")
-def load_test_data(test_data_dir: Path):
-    """Factory fixture to load test data from JSON files."""
-    def _load(filename: str) -> Dict[str, Any]:
-        """Load test data from JSON file."""
-        file_path = test_data_dir / filename
-        if not file_path.exists():
-            raise FileNotFoundError(f"Test data file not found: {file_path}")
-        
-        with open(file_path, "r") as f:
-            return json.load(f)
-    
-    return _load
+@pytest.fixture(scope="session")
+def load_test_data(data_registry: DataRegistry) -> Callable[[str], Mapping[str, Any]]:
+    """Factory fixture to load read-only test data from JSON files."""
+    return data_registry.load
 
 
 @pytest.fixture(scope="function")
-def sample_todos(load_test_data) -> list:
+def sample_todos(data_store: DataStoreSet) -> Sequence[Mapping[str, Any]]:
     """Provide sample todo data from JSON."""
-    data = load_test_data("todos.json")
-    return data.get("todos", [])
+    return data_store("todos.json").collection("todos")
+
+
+@pytest.fixture(scope="function")
+def record(request: pytest.FixtureRequest) -> Mapping[str, Any]:
+    """Provide one dataset record selected by the data_source marker."""
+    marker = request.node.get_closest_marker("data_source")
+    if marker is None or not hasattr(request, "param"):
+        raise pytest.UsageError("The record fixture requires @pytest.mark.data_source")
+    return data_source_for(marker).read(request.param)
+
+
+@pytest.fixture(scope="session")
+def unique_identities(request: pytest.FixtureRequest, config_snapshot: ConfigSnapshot) -> UniqueIdentities:
+    """Get this worker's issuer of usernames and emails unique across workers."""
+    unique_config = thaw(config_snapshot.get_config("data_generator.unique", {}))
+    verify = None
+    if unique_config.get("verify"):
+        verify = TDSIdentityCheck(request.getfixturevalue("tds_client"), unique_config.get("data_type", "users"))
+    return UniqueIdentities.for_worker(unique_config.get("namespace"), verify=verify)
+
+
+@pytest.fixture(scope="function")
+def data_generator(
+    request: pytest.FixtureRequest,
+    config_snapshot: ConfigSnapshot,
+    unique_identities: UniqueIdentities
+) -> DataGenerator:
+    """Provide a Faker data generator seeded from the test's node id, so failures reproduce."""
+    seed = seed_for(request.node.nodeid, config_snapshot.get_config("data_generator.seed", 0))
+    request.node.user_properties.append(("data_seed", seed))
+    return DataGenerator(seed, unique_identities)
+
+
+@pytest.fixture(scope="session")
+def data_pool(config_snapshot: ConfigSnapshot) -> Callable[..., GeneratedPool]:
+    """Factory fixture for pre-generated record pools, built once per run and shared by workers."""
+    generator_config = thaw(config_snapshot.get_config("data_generator", {}))
+    pool_dir = Path(get_settings().artifacts_path) / "data_pools"
+    pools: Dict[tuple, GeneratedPool] = {}
+
+    def get_pool(kind: str, size: Optional[int] = None) -> GeneratedPool:
+        key = (kind, size or generator_config.get("pool_size", 10000))
+        if key not in pools:
+            pools[key] = GeneratedPool(
+                pool_dir, kind, key[1], generator_config.get("seed", 0), partition=worker_partition()
+            )
+        return pools[key]
+
+    return get_pool
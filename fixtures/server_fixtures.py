@@ -0,0 +1,58 @@
+"""Fixtures serving the bundled TodoMVC app from a local server."""
+
+import pytest
+from typing import Callable, Generator, List, Union
+
+from configs.snapshot import ConfigSnapshot, thaw
+from tools.static_server import StaticServer, StaticServerClient, TODOMVC_DIR
+
+
+@pytest.fixture(scope="session")
+def local_todo_server(
+    pytestconfig: pytest.Config,
+    config_snapshot: ConfigSnapshot
+) -> Generator[Union[StaticServer, StaticServerClient], None, None]:
+    """Serve the vendored TodoMVC app on an ephemeral port.
+
+    In "worker" mode every xdist worker starts its own server; in "shared" mode
+    workers get a handle to the controller's server, without per-test latency.
+    """
+    workerinput = getattr(pytestconfig, "workerinput", {})
+    shared = getattr(pytestconfig, "_local_todo_server", None)
+    if shared:
+        yield shared
+    elif "local_todo_server_url" in workerinput:
+        yield StaticServerClient(workerinput["local_todo_server_url"])
+    else:
+        latency = thaw(config_snapshot.get_config("local_server.latency", {}))
+        server = StaticServer(TODOMVC_DIR, latency=latency).start()
+        yield server
+        server.stop()
+
+
+@pytest.fixture(scope="function")
+def route_latency(
+    local_todo_server: Union[StaticServer, StaticServerClient]
+) -> Generator[Callable[[str, int], None], None, None]:
+    """Factory fixture to inject per-route latency for a single test.
+
+    Fails on a server shared by xdist workers, where the latency would also
+    slow tests running concurrently on other workers.
+    """
+    if isinstance(local_todo_server, StaticServerClient):
+        pytest.fail(
+            "route_latency needs a server of its own; run with --local-server=worker "
+            "instead of the server shared by all xdist workers",
+            pytrace=False,
+        )
+    routes: List[str] = []
+
+    def _set(route: str, delay_ms: int) -> None:
+        """Delay responses for paths matching route by delay_ms."""
+        local_todo_server.set_latency(route, delay_ms)
+        routes.append(route)
+
+    yield _set
+
+    for route in routes:
+        local_todo_server.remove_latency(route)
@@ -0,0 +1,149 @@
+"""Fixtures for the Test Data Service client."""
+
+import pytest
+from typing import Callable, Dict, Generator, List, Optional, Union
+
+from configs.snapshot import thaw
+from tools.async_test_data_service import AsyncTestDataServiceClient, TDSPrefetcher
+from tools.fake_tds import FakeTDS, FakeTDSClient
+from tools.tds_cache import merge_stats
+from tools.tds_leases import Lease, LeaseManager, LeasePool
+from tools.test_data_service import TestDataServiceClient
+
+
+@pytest.fixture(scope="session")
+def fake_tds(
+    pytestconfig: pytest.Config,
+    config_snapshot
+) -> Generator[Union[FakeTDS, FakeTDSClient], None, None]:
+    """Get the fake Test Data Service.
+
+    With --fake-tds this is the controller's service shared by all workers,
+    otherwise a service started for this worker.
+    """
+    shared = getattr(pytestconfig, "_fake_tds", None)
+    if shared:
+        yield shared
+    elif getattr(pytestconfig, "_fake_tds_url", None):
+        yield FakeTDSClient(pytestconfig._fake_tds_url)
+    else:
+        fake = FakeTDS.from_config(thaw(config_snapshot.get_config("test_data_service.fake", {}))).start()
+        yield fake
+        fake.stop()
+
+
+@pytest.fixture(scope="session")
+def tds_client(pytestconfig: pytest.Config) -> Generator[TestDataServiceClient, None, None]:
+    """Get a pooled, retrying TDS client shared by the session, on the fake service with --fake-tds."""
+    structured_logger = getattr(pytestconfig, "_structured_logger", None)
+    client = TestDataServiceClient(
+        base_url=getattr(pytestconfig, "_fake_tds_url", None),
+        structured_logger=structured_logger,
+    )
+
+    yield client
+
+    if structured_logger and client.metrics:
+        structured_logger.log_event("tds_latency_summary", {"endpoints": client.latency_summary()})
+    if client.cache is not None and hasattr(pytestconfig, "_tds_cache_stats"):
+        merge_stats(pytestconfig._tds_cache_stats, client.cache.stats)
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def async_tds_client(tds_client: TestDataServiceClient) -> AsyncTestDataServiceClient:
+    """Get an asyncio TDS client sharing the session's connection pool."""
+    return AsyncTestDataServiceClient(tds_client)
+
+
+@pytest.fixture(scope="session")
+def tds_prefetch(
+    async_tds_client: AsyncTestDataServiceClient,
+    config_snapshot,
+    pytestconfig: pytest.Config
+) -> Generator[TDSPrefetcher, None, None]:
+    """Get generated TDS records from per-worker queues refilled in the background."""
+    prefetch_config = config_snapshot.get_config("test_data_service.prefetch", {})
+    prefetcher = TDSPrefetcher(
+        async_tds_client,
+        dict(prefetch_config.get("sizes", {})),
+        refill_below=prefetch_config.get("refill_below", 0.5),
+    ).start(wait=prefetch_config.get("initial_fill_timeout", 10))
+
+    yield prefetcher
+
+    prefetcher.stop()
+    structured_logger = getattr(pytestconfig, "_structured_logger", None)
+    if structured_logger:
+        structured_logger.log_event("tds_prefetch_summary", {"kinds": prefetcher.stats})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def tds_prefetch_at_start(request: pytest.FixtureRequest) -> None:
+    """Start prefetching before the first test when any collected test takes tds_prefetch."""
+    if any("tds_prefetch" in getattr(item, "fixturenames", ()) for item in request.session.items):
+        request.getfixturevalue("tds_prefetch")
+
+
+@pytest.fixture(scope="session")
+def tds_leases(
+    tds_client: TestDataServiceClient,
+    config_snapshot,
+    pytestconfig: pytest.Config
+) -> Generator[LeaseManager, None, None]:
+    """Get the worker's lease manager; every lease is released at session end."""
+    lease_config = config_snapshot.get_config("test_data_service.leases", {})
+    manager = LeaseManager(
+        tds_client,
+        ttl=lease_config.get("ttl", 60),
+        heartbeat_interval=lease_config.get("heartbeat"),
+    ).start()
+    # Released by the TDS plugin as well when the session is interrupted
+    pytestconfig._tds_lease_manager = manager
+
+    yield manager
+
+    manager.stop()
+
+
+@pytest.fixture(scope="session")
+def tds_lease_pools(tds_leases: LeaseManager, config_snapshot) -> Dict[str, LeasePool]:
+    """Get per-worker pools of pre-leased records, filled for configured types."""
+    pools = {}
+    for data_type, pool_config in config_snapshot.get_config("test_data_service.leases.pools", {}).items():
+        pools[data_type] = LeasePool(
+            tds_leases,
+            data_type,
+            size=pool_config.get("size", 5),
+            filters=dict(pool_config.get("filters") or {}) or None,
+        )
+        pools[data_type].fill()
+    return pools
+
+
+@pytest.fixture
+def leased_record(
+    tds_leases: LeaseManager,
+    tds_lease_pools: Dict[str, LeasePool]
+) -> Generator[Callable[..., Lease], None, None]:
+    """Lease a TDS record for the test: from the worker's pool, or a given id."""
+    taken: List[tuple] = []
+
+    def _lease(data_type: str, data_id: Optional[str] = None) -> Lease:
+        if data_id is None:
+            if data_type not in tds_lease_pools:
+                tds_lease_pools[data_type] = LeasePool(tds_leases, data_type)
+            lease = tds_lease_pools[data_type].checkout()
+            taken.append((tds_lease_pools[data_type], lease))
+        else:
+            lease = tds_leases.acquire(data_type, data_id)
+            taken.append((None, lease))
+        return lease
+
+    yield _lease
+
+    for pool, lease in taken:
+        if pool is not None:
+            pool.checkin(lease)
+        else:
+            tds_leases.release(lease)
@@ -1,9 +1,18 @@
 """Base Page Object class with common methods."""
 
-from typing import Optional, List
-from playwright.sync_api import Page, Locator, expect
+from typing import Optional, List, Dict, Any
+from playwright.sync_api import Page, Locator, Error, expect
 from pathlib import Path
 
+from tools.web_metrics import (
+    COLLECT_METRICS_SCRIPT,
+    check_budgets,
+    enforce_budgets,
+    get_budgets,
+    get_metrics_recorder,
+    install_performance_observer,
+)
+
 
 class BasePage:
     """Base class for all Page Objects."""
@@ -12,10 +21,29 @@ class BasePage:
         """Initialize base page."""
         self.page = page
         self.timeout = 30000
+        self.last_metrics: Dict[str, Any] = {}
 
-    def navigate(self, url: str) -> None:
-        """Navigate to URL."""
+    def navigate(self, url: str, collect_metrics: bool = True) -> None:
+        """Navigate to URL and record page performance metrics."""
+        install_performance_observer(self.page)
         self.page.goto(url, timeout=self.timeout)
+        if collect_metrics:
+            self.collect_metrics(url)
+
+    def collect_metrics(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """Collect browser-side timings and check them against budgets."""
+        try:
+            metrics = self.page.evaluate(COLLECT_METRICS_SCRIPT)
+        except Error:
+            metrics = {}
+        self.last_metrics = metrics
+
+        recorder = get_metrics_recorder()
+        url = url or self.page.url
+        breaches = check_budgets(url, metrics, get_budgets(recorder.environment))
+        recorder.record(url, metrics, breaches)
+        enforce_budgets(url, recorder.environment, breaches)
+        return metrics
 
     def wait_for_load_state(self, state: str = "load") -> None:
         """Wait for page load state."""
@@ -172,3 +200,25 @@ class BasePage:
     def expect_title(self, title: str) -> None:
         """Assert page title."""
         expect(self.page).to_have_title(title)
+
+    def expect_metric_within(self, metric: str, limit: float) -> None:
+        """Assert a metric of the last navigation is within a limit."""
+        value = self.last_metrics.get(metric)
+        assert value is not None, f"Metric '{metric}' was not reported for {self.page.url}"
+        assert value <= limit, f"{metric} {value} exceeds {limit} for {self.page.url}"
+
+    def expect_load_within(self, ms: float) -> None:
+        """Assert the last navigation finished its load event within ms."""
+        self.expect_metric_within("load", ms)
+
+    def expect_ttfb_within(self, ms: float) -> None:
+        """Assert time to first byte of the last navigation is within ms."""
+        self.expect_metric_within("ttfb", ms)
+
+    def expect_lcp_within(self, ms: float) -> None:
+        """Assert largest contentful paint of the last navigation is within ms."""
+        self.expect_metric_within("lcp", ms)
+
+    def expect_no_long_tasks_over(self, ms: float) -> None:
+        """Assert no long task of the last navigation took longer than ms."""
+        self.expect_metric_within("long_task_max_ms", ms)
@@ -32,8 +32,9 @@ class TodoPage(BasePage):
     def navigate_to_todo_app(self, base_url: str = None) -> None:
         """Navigate to TodoMVC page."""
         url = base_url if base_url else "https://demo.playwright.dev/todomvc"
-        self.navigate(url)
+        self.navigate(url, collect_metrics=False)
         self.wait_for_load_state("networkidle")
+        self.collect_metrics(url)
 
     def add_todo(self, text: str) -> None:
         """Add a new todo item."""
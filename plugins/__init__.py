@@ -1,11 +1,24 @@
-"""Custom pytest plugins for the framework."""
+"""Custom pytest plugins for the framework.
 
-from plugins.artifacts_plugin import artifact_manager, pytest_runtest_makereport
-from plugins.logging_plugin import structured_logger, console_logger
+Plugins are registered through ``pytest_plugins`` in conftest.py; the names
+below are resolved on first access so importing one plugin stays cheap.
+"""
 
-__all__ = [
-    "artifact_manager",
-    "pytest_runtest_makereport",
-    "structured_logger",
-    "console_logger",
-]
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "artifact_manager": "plugins.artifacts_plugin",
+    "pytest_runtest_makereport": "plugins.artifacts_plugin",
+    "structured_logger": "plugins.logging_plugin",
+    "console_logger": "plugins.logging_plugin",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its plugin module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name]), name)
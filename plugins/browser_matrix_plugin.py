@@ -0,0 +1,86 @@
+"""Pytest plugin for cross-browser runs in one session: test order and results per engine.
+
+With ``--browsers=chromium,firefox,webkit`` pytest-playwright parametrizes
+every browser test over the engines. Tests are then ordered in alternating
+blocks per engine, so xdist workers pick up blocks of different engines and
+the engines run concurrently. Each worker keeps its browsers in the
+``browser_pool`` fixture. Results are tagged with their engine for reports
+and logs, and summarized per engine at the end of the run.
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from configs import get_config_loader
+
+
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+
+
+def item_engine(item: pytest.Item) -> Optional[str]:
+    """Get the browser engine a test item is parametrized with, if any."""
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser_name") if callspec else None
+
+
+def interleave(items: List[pytest.Item], engines: List[str], block_size: int) -> List[pytest.Item]:
+    """Order items in alternating blocks per engine, keeping tests without a browser first."""
+    queues: Dict[str, List[pytest.Item]] = {engine: [] for engine in engines}
+    ordered = []
+    for item in items:
+        engine = item_engine(item)
+        if engine in queues:
+            queues[engine].append(item)
+        else:
+            ordered.append(item)
+    while any(queues.values()):
+        for engine in engines:
+            ordered.extend(queues[engine][:block_size])
+            del queues[engine][:block_size]
+    return ordered
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Tag tests with their engine and spread the engines over the run."""
+    for item in items:
+        engine = item_engine(item)
+        if engine:
+            item.user_properties.append(("browser", engine))
+
+    engines = list(config.getoption("--browser", None) or [])
+    if len(engines) > 1:
+        block_size = get_config_loader().get("browser_matrix.block_size", 8)
+        items[:] = interleave(items, engines, block_size)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    """Group the test under its engine in the Allure report."""
+    engine = item_engine(item)
+    if engine is None:
+        return
+    try:
+        import allure
+        allure.dynamic.parent_suite(engine)
+    except ImportError:
+        pass
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show test outcomes per engine when tests ran on several engines."""
+    counts: Dict[str, Dict[str, int]] = {}
+    for outcome in OUTCOMES:
+        for report in terminalreporter.stats.get(outcome, []):
+            engine = dict(getattr(report, "user_properties", ())).get("browser")
+            if engine:
+                engine_counts = counts.setdefault(engine, {})
+                engine_counts[outcome] = engine_counts.get(outcome, 0) + 1
+    if len(counts) < 2:
+        return
+
+    terminalreporter.section("Results per browser")
+    for engine, engine_counts in sorted(counts.items()):
+        summary = ", ".join(f"{engine_counts[outcome]} {outcome}" for outcome in OUTCOMES if outcome in engine_counts)
+        terminalreporter.write_line(f"  {engine}: {summary}")
@@ -0,0 +1,40 @@
+"""Pytest plugin parametrizing tests over records of large JSONL/CSV datasets.
+
+Usage:
+    @pytest.mark.data_source("todos.jsonl.gz", filter={"completed": False},
+                             shard="0/4", limit=500, id_field="id")
+    def test_add_todo(page, record):
+        ...
+
+Paths are relative to tests/data. Only record positions and ids are kept at
+collection time; each record is read from disk when its test sets up.
+"""
+
+from pathlib import Path
+
+from configs import get_settings
+from tools.data_source import DataSource, get_data_source
+
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def data_source_for(marker) -> DataSource:
+    """Get the dataset referenced by a data_source marker."""
+    index_dir = Path(get_settings().artifacts_path) / "data_index"
+    return get_data_source(DATA_DIR / marker.args[0], index_dir)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the record fixture from the data_source marker."""
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None or "record" not in metafunc.fixturenames:
+        return
+
+    positions, ids = data_source_for(marker).select(
+        record_filter=marker.kwargs.get("filter"),
+        shard=marker.kwargs.get("shard"),
+        limit=marker.kwargs.get("limit"),
+        id_field=marker.kwargs.get("id_field"),
+    )
+    metafunc.parametrize("record", positions, ids=ids, indirect=True)
@@ -0,0 +1,27 @@
+"""Pytest plugin compiling test data into memory-mapped stores once per run."""
+
+from pathlib import Path
+
+import pytest
+
+from configs import get_settings
+from configs.snapshot import thaw
+from plugins.data_source_plugin import DATA_DIR
+from tools.data_store import build_stores
+
+
+def pytest_configure(config):
+    """Compile declared data files in the controller; workers reuse them."""
+    if hasattr(config, "workerinput"):
+        config._data_store_paths = config.workerinput.get("data_store_paths", {})
+        return
+
+    declared = thaw(config._config_snapshot.get_config("test_data", {}))
+    store_dir = Path(get_settings().artifacts_path) / "data_store"
+    config._data_store_paths = build_stores(DATA_DIR, store_dir, declared)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand compiled store paths to xdist workers."""
+    node.workerinput["data_store_paths"] = node.config._data_store_paths
@@ -0,0 +1,28 @@
+"""Pytest plugin running tests on the devices named by the device marker."""
+
+import pytest
+
+
+def _parametrizes_device(metafunc: pytest.Metafunc) -> bool:
+    """Check if the test is also parametrized over ``device`` directly."""
+    for marker in metafunc.definition.iter_markers("parametrize"):
+        argnames = marker.args[0] if marker.args else marker.kwargs.get("argnames", "")
+        if isinstance(argnames, str):
+            argnames = [name.strip() for name in argnames.split(",")]
+        if "device" in argnames:
+            return True
+    return False
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize ``device`` over @pytest.mark.device("iPhone_13", "Pixel_5")."""
+    marker = metafunc.definition.get_closest_marker("device")
+    if marker is None or not marker.args:
+        return
+    if _parametrizes_device(metafunc):
+        raise pytest.UsageError(
+            f"{metafunc.definition.nodeid}: select devices with the device marker or a device parameter, not both"
+        )
+    if "device" not in metafunc.fixturenames:
+        metafunc.fixturenames.append("device")
+    metafunc.parametrize("device", list(marker.args))
@@ -0,0 +1,43 @@
+"""Pytest plugin running a shared local TodoMVC server for --env=local."""
+
+import pytest
+
+from configs import get_config_loader
+from tools.static_server import StaticServer, TODOMVC_DIR
+
+LOCAL_ENV = "local"
+
+
+def get_local_server_mode(config: pytest.Config) -> str:
+    """Get local server mode from the CLI or config.yaml."""
+    return (
+        config.getoption("--local-server")
+        or get_config_loader().get("local_server.mode", "worker")
+    )
+
+
+def pytest_configure(config):
+    """Start the shared server in the controller process."""
+    if config.getoption("--env") != LOCAL_ENV or hasattr(config, "workerinput"):
+        return
+    if get_local_server_mode(config) != "shared":
+        return
+
+    latency = get_config_loader().get("local_server.latency", {})
+    config._local_todo_server = StaticServer(TODOMVC_DIR, latency=latency).start()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the shared server URL to xdist workers."""
+    server = getattr(node.config, "_local_todo_server", None)
+    if server:
+        node.workerinput["local_todo_server_url"] = server.url
+
+
+def pytest_unconfigure(config):
+    """Stop the shared server."""
+    server = getattr(config, "_local_todo_server", None)
+    if server:
+        server.stop()
+        config._local_todo_server = None
@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 import pytest
 
 from configs import get_settings
+from plugins.browser_matrix_plugin import item_engine
 
 
 class StructuredLogger:
@@ -39,21 +40,30 @@ class StructuredLogger:
         }
         self.logger.info(json.dumps(log_entry))
 
-    def log_test_start(self, test_id: str, test_name: str, markers: list) -> None:
+    def log_test_start(self, test_id: str, test_name: str, markers: list, browser: Optional[str] = None) -> None:
         """Log test start event."""
         self.log_event("test_start", {
             "test_id": test_id,
             "test_name": test_name,
-            "markers": markers
+            "markers": markers,
+            "browser": browser
         })
 
-    def log_test_end(self, test_id: str, test_name: str, outcome: str, duration: float) -> None:
+    def log_test_end(
+        self,
+        test_id: str,
+        test_name: str,
+        outcome: str,
+        duration: float,
+        browser: Optional[str] = None
+    ) -> None:
         """Log test end event."""
         self.log_event("test_end", {
             "test_id": test_id,
             "test_name": test_name,
             "outcome": outcome,
-            "duration": duration
+            "duration": duration,
+            "browser": browser
         })
 
     def log_browser_console(self, test_id: str, message: Dict[str, Any]) -> None:
@@ -70,6 +80,30 @@ class StructuredLogger:
             **event
         })
 
+    def log_page_metrics(self, test_id: str, entry: Dict[str, Any]) -> None:
+        """Log performance metrics of a page navigation."""
+        self.log_event("page_metrics", {
+            "test_id": test_id,
+            "url": entry["url"],
+            "env": entry["env"],
+            "budget_breaches": entry.get("budget_breaches", []),
+            **entry["metrics"]
+        })
+
+    def log_tds_request(self, endpoint: str, data: Dict[str, Any]) -> None:
+        """Log latency and outcome of a Test Data Service call."""
+        self.log_event("tds_request", {
+            "endpoint": endpoint,
+            **data
+        })
+
+    def log_trace_summary(self, test_id: str, summary: Dict[str, Any]) -> None:
+        """Log a trace analyzer summary."""
+        self.log_event("trace_summary", {
+            "test_id": test_id,
+            **summary
+        })
+
 
 @pytest.fixture(scope="session")
 def structured_logger() -> StructuredLogger:
@@ -99,7 +133,7 @@ def pytest_runtest_protocol(item, nextitem):
         test_id = item.nodeid
         test_name = item.name
         markers = [marker.name for marker in item.iter_markers()]
-        structured_logger.log_test_start(test_id, test_name, markers)
+        structured_logger.log_test_start(test_id, test_name, markers, item_engine(item))
     
     # Run test
     start_time = datetime.now()
@@ -121,7 +155,7 @@ def pytest_runtest_protocol(item, nextitem):
             elif report.skipped:
                 outcome_str = "skipped"
         
-        structured_logger.log_test_end(test_id, test_name, outcome_str, duration)
+        structured_logger.log_test_end(test_id, test_name, outcome_str, duration, item_engine(item))
 
 
 def pytest_configure(config):
@@ -0,0 +1,60 @@
+"""Pytest plugin for web performance metrics collected during navigations."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from configs import get_settings
+from tools.web_metrics import get_metrics_recorder
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Hook to attach navigation metrics to the test's structured-log events."""
+    recorder = get_metrics_recorder()
+    recorder.start_test(item.nodeid)
+
+    yield
+
+    records = recorder.finish_test()
+    structured_logger = getattr(item.config, "_structured_logger", None)
+    if structured_logger:
+        for entry in records:
+            structured_logger.log_page_metrics(item.nodeid, entry)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect metrics recorded by an xdist worker."""
+    records = getattr(node, "workeroutput", {}).get("page_metrics", [])
+    get_metrics_recorder().records.extend(records)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Aggregate metrics per URL and env at session end."""
+    config = session.config
+    recorder = get_metrics_recorder()
+
+    # Workers hand their records to the controller, which aggregates once
+    if hasattr(config, "workerinput"):
+        config.workeroutput["page_metrics"] = recorder.records
+        return
+
+    if not recorder.records:
+        return
+
+    summary = recorder.aggregate()
+    structured_logger = getattr(config, "_structured_logger", None)
+    if structured_logger:
+        structured_logger.log_event("performance_summary", {"summary": summary})
+
+    reports_path = Path(get_settings().reports_path)
+    reports_path.mkdir(parents=True, exist_ok=True)
+    with open(reports_path / "performance_summary.json", "w") as f:
+        json.dump(summary, f, indent=2)
+
+
+def pytest_configure(config):
+    """Configure performance plugin."""
+    get_metrics_recorder().environment = config.getoption("--env", default="dev")
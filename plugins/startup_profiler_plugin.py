@@ -0,0 +1,214 @@
+"""Pytest plugin reporting import and collection cost per module (--profile-startup).
+
+The import timer has to be installed before the framework modules are imported,
+so conftest.py calls install_import_timer() when the flag is on the command line
+or in PYTEST_ADDOPTS. Imports done earlier by pytest itself and third-party
+plugins are not covered; use ``python -X importtime -m pytest`` for those.
+"""
+
+import json
+import os
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+
+PROFILE_FLAG = "--profile-startup"
+
+# Rows shown per table in the terminal summary
+TOP_N = 15
+
+
+class _TimedLoader:
+    """Loader proxy that times module execution."""
+
+    def __init__(self, loader: Any, timer: "ImportTimer"):
+        """Initialize timed loader."""
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped loader."""
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        """Create the module with the wrapped loader."""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        """Execute the module and record inclusive and self time."""
+        self._timer.stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self._timer.stack.pop()
+            if self._timer.stack:
+                self._timer.stack[-1] += elapsed
+            self._timer.records[module.__name__] = {
+                "cumulative_ms": round(elapsed * 1000, 2),
+                "self_ms": round((elapsed - children) * 1000, 2),
+                "root": not self._timer.stack,
+            }
+
+
+class ImportTimer(MetaPathFinder):
+    """Meta path finder that wraps loaders of newly imported modules in a timer."""
+
+    def __init__(self):
+        """Initialize import timer."""
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.stack: List[float] = []
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the spec with the remaining finders and time its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def install(self) -> "ImportTimer":
+        """Put the timer first on sys.meta_path."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self) -> None:
+        """Remove the timer from sys.meta_path."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+_import_timer: Optional[ImportTimer] = None
+
+
+def profiling_requested(argv: Optional[List[str]] = None) -> bool:
+    """Check if --profile-startup was passed before option parsing."""
+    args = list(sys.argv if argv is None else argv)
+    args += os.environ.get("PYTEST_ADDOPTS", "").split()
+    return PROFILE_FLAG in args
+
+
+def install_import_timer() -> ImportTimer:
+    """Start timing imports of the framework modules."""
+    global _import_timer
+    if _import_timer is None:
+        _import_timer = ImportTimer().install()
+    return _import_timer
+
+
+def build_profile(
+    imports: Dict[str, Dict[str, Any]],
+    collection: Dict[str, float],
+    collection_total_ms: float,
+    test_count: int
+) -> Dict[str, Any]:
+    """Summarize import and collection timings, slowest first."""
+    slowest_imports = sorted(imports.items(), key=lambda kv: kv[1]["self_ms"], reverse=True)
+    slowest_modules = sorted(collection.items(), key=lambda kv: kv[1], reverse=True)
+    roots = [r for r in imports.values() if r.get("root")]
+    return {
+        "imports": {
+            "modules": len(imports),
+            "total_ms": round(sum(r["cumulative_ms"] for r in roots), 2),
+            "slowest": [{"module": name, **record} for name, record in slowest_imports],
+        },
+        "collection": {
+            "total_ms": round(collection_total_ms, 2),
+            "tests": test_count,
+            "slowest": [
+                {"module": nodeid, "ms": round(ms, 2)} for nodeid, ms in slowest_modules
+            ],
+        },
+    }
+
+
+def _enabled(config: pytest.Config) -> bool:
+    """Check if profiling is enabled in this process."""
+    return config.getoption(PROFILE_FLAG, default=False) and not hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    """Start collection timing when profiling is enabled."""
+    if _enabled(config):
+        config._startup_collection_times = {}
+        config._startup_collection_total_ms = 0.0
+        config._startup_test_count = 0
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """Time the whole collection phase."""
+    started = time.perf_counter()
+    yield
+    if _enabled(session.config):
+        session.config._startup_collection_total_ms = (time.perf_counter() - started) * 1000
+        if _import_timer:
+            _import_timer.uninstall()
+
+
+def pytest_collection_finish(session):
+    """Remember how many tests were collected."""
+    if _enabled(session.config):
+        session.config._startup_test_count = len(session.items)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    """Time collection of each test module, including its import."""
+    started = time.perf_counter()
+    yield
+    if isinstance(collector, pytest.Module) and _enabled(collector.config):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        collector.config._startup_collection_times[collector.nodeid] = elapsed_ms
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the slowest imports and test modules and save the full profile."""
+    if not _enabled(config):
+        return
+
+    profile = build_profile(
+        _import_timer.records if _import_timer else {},
+        config._startup_collection_times,
+        config._startup_collection_total_ms,
+        config._startup_test_count,
+    )
+
+    terminalreporter.section("startup profile")
+    imports = profile["imports"]
+    terminalreporter.write_line(
+        f"imports: {imports['modules']} modules, {imports['total_ms']:.1f} ms "
+        f"(timed from conftest.py)"
+    )
+    for row in imports["slowest"][:TOP_N]:
+        terminalreporter.write_line(
+            f"  {row['self_ms']:>9.2f} ms self {row['cumulative_ms']:>9.2f} ms cumulative  "
+            f"{row['module']}"
+        )
+
+    collection = profile["collection"]
+    terminalreporter.write_line(
+        f"collection: {collection['tests']} tests in {collection['total_ms']:.1f} ms"
+    )
+    for row in collection["slowest"][:TOP_N]:
+        terminalreporter.write_line(f"  {row['ms']:>9.2f} ms  {row['module']}")
+
+    from configs import get_settings
+
+    reports_path = Path(get_settings().reports_path)
+    reports_path.mkdir(parents=True, exist_ok=True)
+    with open(reports_path / "startup_profile.json", "w") as f:
+        json.dump(profile, f, indent=2)
@@ -0,0 +1,76 @@
+"""Pytest plugin for the Test Data Service: fake service, leases and cache statistics."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from configs import get_settings
+from configs.snapshot import thaw
+from tools.tds_cache import merge_stats
+
+
+def pytest_configure(config):
+    """Start each run with an empty shared cache and, with --fake-tds, one fake service."""
+    config._tds_cache_stats = {}
+    if hasattr(config, "workerinput"):
+        config._fake_tds_url = config.workerinput.get("fake_tds_url")
+        return
+
+    shutil.rmtree(Path(get_settings().artifacts_path) / "tds_cache", ignore_errors=True)
+    config._fake_tds_url = None
+    if config.getoption("--fake-tds"):
+        from tools.fake_tds import FakeTDS
+
+        fake_config = thaw(config._config_snapshot.get_config("test_data_service.fake", {}))
+        config._fake_tds = FakeTDS.from_config(fake_config).start()
+        config._fake_tds_url = config._fake_tds.url
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the fake service URL to xdist workers."""
+    if node.config._fake_tds_url:
+        node.workerinput["fake_tds_url"] = node.config._fake_tds_url
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect cache statistics of an xdist worker."""
+    stats = getattr(node, "workeroutput", {}).get("tds_cache_stats", {})
+    merge_stats(node.config._tds_cache_stats, stats)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Release leases left by an interrupted session and hand worker cache statistics to the controller."""
+    lease_manager = getattr(session.config, "_tds_lease_manager", None)
+    if lease_manager is not None:
+        lease_manager.stop()
+
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["tds_cache_stats"] = session.config._tds_cache_stats
+
+
+def pytest_unconfigure(config):
+    """Stop the fake service."""
+    fake_tds = getattr(config, "_fake_tds", None)
+    if fake_tds:
+        fake_tds.stop()
+        config._fake_tds = None
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show cache hits and misses per data type."""
+    stats = getattr(config, "_tds_cache_stats", {})
+    if not stats:
+        return
+
+    terminalreporter.section("TDS cache")
+    for data_type, counts in sorted(stats.items()):
+        hits = counts.get("hits", 0) + counts.get("disk_hits", 0)
+        lookups = hits + counts.get("misses", 0)
+        rate = hits / lookups * 100 if lookups else 0.0
+        terminalreporter.write_line(
+            f"  {data_type}: {hits}/{lookups} hits ({rate:.0f}%, {counts.get('disk_hits', 0)} from disk), "
+            f"{counts.get('invalidations', 0)} invalidations, {counts.get('evictions', 0)} evictions"
+        )
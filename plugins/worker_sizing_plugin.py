@@ -0,0 +1,201 @@
+"""Pytest plugin sizing xdist workers to the host and throttling test starts under memory pressure."""
+
+import os
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+
+from configs import get_config_loader
+from configs.pytest_cli import ENGINES, parse_browsers
+from plugins.browser_matrix_plugin import item_engine
+from tools.worker_sizing import MB, HostResources, MemoryThrottle, auto_worker_count
+
+
+# pytest cache keys of peak memory measured in earlier runs: browser trees per engine
+# and the worker's own base (Python and the Playwright driver)
+FOOTPRINT_CACHE_KEY = "worker_sizing/browser_mb"
+BASE_CACHE_KEY = "worker_sizing/base_mb"
+
+
+def _engines(config: pytest.Config) -> List[str]:
+    """Get the browser engines each worker runs; called before pytest_configure resolves them."""
+    return (
+        parse_browsers(config.getoption("--browsers"))
+        or list(config.getoption("--browser", None) or [])
+        or [config.getoption("--custom-browser")]
+    )
+
+
+def _footprints(config: pytest.Config, sizing_config: Dict) -> Tuple[float, Dict[str, float]]:
+    """Get the worker base and per-engine browser memory, measured ones over configured defaults."""
+    base_mb = sizing_config.get("base_mb", 0)
+    footprints = dict(sizing_config.get("footprint_mb", {}))
+    if config.pluginmanager.hasplugin("cacheprovider"):
+        # config.cache is set up after xdist sizes the workers
+        cache = getattr(config, "cache", None) or pytest.Cache.for_config(config, _ispytest=True)
+        footprints.update(cache.get(FOOTPRINT_CACHE_KEY, {}))
+        base_mb = cache.get(BASE_CACHE_KEY, base_mb)
+    return base_mb, footprints
+
+
+def _shm_per_worker(sizing_config: Dict) -> Dict[str, float]:
+    """Get /dev/shm use per engine; Chromium uses none with --disable-dev-shm-usage."""
+    shm_mb = dict(sizing_config.get("shm_mb", {}))
+    if "--disable-dev-shm-usage" in get_config_loader().get_browser_config("chromium").get("args", []):
+        shm_mb["chromium"] = 0
+    return shm_mb
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Let --parallel=auto start xdist with an automatic worker count."""
+    if hasattr(config, "workerinput") or not config.pluginmanager.hasplugin("xdist"):
+        return
+    if config.getoption("--parallel") == "auto" and config.getoption("numprocesses", None) is None:
+        config.option.numprocesses = "auto"
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size -n auto to the CPUs, memory and /dev/shm available for the engines in use."""
+    if os.environ.get("PYTEST_XDIST_AUTO_NUM_WORKERS"):
+        return None
+    sizing_config = get_config_loader().get("worker_sizing", {})
+    base_mb, footprints = _footprints(config, sizing_config)
+    shm_mb = _shm_per_worker(sizing_config)
+    if config.getoption("--browser-server", False):
+        # Browsers run in the persistent servers, outside the workers
+        footprints, shm_mb = {}, {}
+    count, limits = auto_worker_count(
+        HostResources(),
+        _engines(config),
+        footprints,
+        shm_mb,
+        reserve_mb=sizing_config.get("reserve_mb", 1024),
+        max_workers=sizing_config.get("max_workers"),
+        base_mb=base_mb,
+    )
+    config._worker_sizing = {"workers": count, "limits": limits}
+    return count
+
+
+def pytest_configure(config):
+    """Set up the memory throttle and footprint tracking."""
+    throttle_config = get_config_loader().get("worker_sizing.throttle", {})
+    config._memory_throttle = None
+    if throttle_config.get("enabled", True):
+        config._memory_throttle = MemoryThrottle(
+            HostResources(),
+            max_used=throttle_config.get("max_memory_used", 0.9),
+            poll_interval=throttle_config.get("poll_interval", 0.5),
+            max_wait=throttle_config.get("max_wait", 60),
+        )
+    config._worker_footprint_mb = {}
+    config._worker_base_mb = 0
+    config._worker_throttle_stats = {"throttled": 0, "waited": 0.0}
+    config._footprint_sampled_at = 0.0
+
+
+def pytest_report_header(config):
+    """Show how -n auto sized the workers."""
+    sizing = getattr(config, "_worker_sizing", None)
+    if sizing:
+        limits = ", ".join(f"{name} {limit}" for name, limit in sizing["limits"].items())
+        return f"auto workers: {sizing['workers']} (limits: {limits})"
+    return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Hold the test back while memory or /dev/shm is close to full."""
+    throttle = item.config._memory_throttle
+    if throttle is not None:
+        throttle.wait()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Sample the worker's and its browser's memory while a browser test still holds its page."""
+    yield
+    config = item.config
+    interval = get_config_loader().get("worker_sizing.sample_interval", 5)
+    if "browser" not in item.fixturenames or time.monotonic() - config._footprint_sampled_at < interval:
+        return
+    config._footprint_sampled_at = time.monotonic()
+
+    engine = item_engine(item) or _engines(config)[0]
+    resources = HostResources()
+    # Every engine is split off, so pooled browsers of other engines do not count towards the base
+    base, browsers = resources.footprint(os.getpid(), ENGINES)
+    server_client = item.funcargs.get("browser_server_client")
+    server_pid = (server_client.server or {}).get("pid") if server_client else None
+    if server_pid:
+        # The browser runs under the persistent launch server, not this worker
+        browsers = resources.footprint(server_pid, [engine])[1]
+    _merge(config, round(base / MB), {engine: round(browsers[engine] / MB)} if browsers[engine] else {}, {})
+
+
+def _merge(
+    config: pytest.Config,
+    base_mb: float,
+    footprints: Dict[str, float],
+    throttle_stats: Dict[str, float]
+) -> None:
+    """Add one process's peak base and browser footprints and throttle waits to the totals."""
+    config._worker_base_mb = max(config._worker_base_mb, base_mb)
+    for engine, footprint_mb in footprints.items():
+        config._worker_footprint_mb[engine] = max(config._worker_footprint_mb.get(engine, 0), footprint_mb)
+    for name, value in throttle_stats.items():
+        config._worker_throttle_stats[name] += value
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect footprints and throttle waits of an xdist worker."""
+    output = getattr(node, "workeroutput", {})
+    _merge(
+        node.config,
+        output.get("worker_base_mb", 0),
+        output.get("worker_footprint_mb", {}),
+        output.get("memory_throttle", {}),
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Hand worker measurements to the controller, which keeps footprints for the next run."""
+    config = session.config
+    throttle = config._memory_throttle
+    if hasattr(config, "workerinput"):
+        config.workeroutput["worker_base_mb"] = config._worker_base_mb
+        config.workeroutput["worker_footprint_mb"] = config._worker_footprint_mb
+        config.workeroutput["memory_throttle"] = throttle.stats if throttle else {}
+        return
+
+    if throttle:
+        _merge(config, 0, {}, throttle.stats)
+    cache = getattr(config, "cache", None)
+    if cache is not None and config._worker_footprint_mb:
+        cache.set(FOOTPRINT_CACHE_KEY, {**cache.get(FOOTPRINT_CACHE_KEY, {}), **config._worker_footprint_mb})
+    if cache is not None and config._worker_base_mb:
+        cache.set(BASE_CACHE_KEY, config._worker_base_mb)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Show measured per-worker footprints and time spent throttled."""
+    footprints = getattr(config, "_worker_footprint_mb", {})
+    throttle_stats = getattr(config, "_worker_throttle_stats", {})
+    if not footprints and not throttle_stats.get("throttled"):
+        return
+
+    terminalreporter.section("Worker sizing")
+    base_mb = getattr(config, "_worker_base_mb", 0)
+    if base_mb:
+        terminalreporter.write_line(f"  worker and driver: peak {base_mb} MB per worker")
+    for engine, footprint_mb in sorted(footprints.items()):
+        terminalreporter.write_line(f"  {engine} browser: peak {footprint_mb} MB per worker")
+    if throttle_stats.get("throttled"):
+        terminalreporter.write_line(
+            f"  memory pressure held back {throttle_stats['throttled']} test starts "
+            f"for {throttle_stats['waited']:.1f}s"
+        )
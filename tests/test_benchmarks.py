@@ -0,0 +1,93 @@
+"""Unit tests for the benchmark runner."""
+
+import pytest
+
+from benchmarks.runner import compare_results, main, run_benchmarks
+
+
+class FakeEnv:
+    """Benchmark environment stand-in without browsers."""
+
+    engines = ["chromium"]
+
+
+def noop_benchmark(env):
+    """Benchmark yielding a no-op operation."""
+    calls = []
+    yield lambda: calls.append(1)
+    env.calls = len(calls)
+
+
+def failing_benchmark(env):
+    """Benchmark failing during setup."""
+    raise RuntimeError("no browser")
+    yield
+
+
+def spec(name, func, **overrides):
+    """Build a benchmark spec like the benchmark decorator does."""
+    return {"name": name, "func": func, "param": None, "repeat": 3, "warmup": 1,
+            "ops": 1, "tolerance": 0.25, "per_engine": False, **overrides}
+
+
+@pytest.mark.unit
+class TestBenchmarkRunner:
+    """Tests for running and comparing benchmarks."""
+
+    def test_run_benchmarks(self):
+        """Test timing, ops/s conversion, teardown and error reporting."""
+        env = FakeEnv()
+        specs = [
+            spec("noop", noop_benchmark),
+            spec("noop_ops", noop_benchmark, ops=100),
+            spec("failing", failing_benchmark),
+            spec("launch[webkit]", noop_benchmark, param="webkit", per_engine=True),
+        ]
+
+        results = run_benchmarks(env, specs=specs)
+
+        assert results["noop"]["unit"] == "ms"
+        assert results["noop_ops"]["unit"] == "ops/s"
+        assert results["noop_ops"]["higher_is_better"]
+        assert results["failing"] == {"error": "RuntimeError: no browser"}
+        assert "launch[webkit]" not in results
+        assert env.calls == 4
+
+    def test_compare_results(self):
+        """Test regressions respect direction and tolerance."""
+        baseline = {
+            "latency": {"median": 100.0},
+            "throughput": {"median": 1000.0},
+            "stable": {"median": 100.0},
+        }
+        results = {
+            "latency": {"median": 130.0, "unit": "ms", "higher_is_better": False,
+                        "tolerance": 0.25},
+            "throughput": {"median": 700.0, "unit": "ops/s", "higher_is_better": True,
+                           "tolerance": 0.25},
+            "stable": {"median": 120.0, "unit": "ms", "higher_is_better": False,
+                       "tolerance": 0.25},
+            "new": {"median": 1.0, "unit": "ms", "higher_is_better": False},
+        }
+
+        regressions = compare_results(results, baseline)
+
+        assert [r["name"] for r in regressions] == ["latency", "throughput"]
+        assert regressions[0]["change"] == 0.3
+
+    def test_compare_errors_and_missing(self):
+        """Test errored and missing benchmarks fail the comparison."""
+        baseline = {"crashed": {"median": 1.0}, "removed": {"median": 1.0}, "launch[webkit]": {"median": 1.0}}
+        results = {"crashed": {"error": "RuntimeError: boom"}}
+
+        failures = compare_results(results, baseline, expected=["crashed", "removed"])
+
+        assert failures == [
+            {"name": "removed", "error": "missing from results"},
+            {"name": "crashed", "error": "RuntimeError: boom"},
+        ]
+
+    def test_missing_baseline(self, tmp_path, capsys):
+        """Test comparing against a missing baseline exits non-zero with a hint."""
+        assert main(["--compare", str(tmp_path / "baseline.json")]) == 2
+        assert "make bench-baseline" in capsys.readouterr().err
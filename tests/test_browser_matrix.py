@@ -0,0 +1,71 @@
+"""Unit tests for cross-browser runs in one session."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from configs.pytest_cli import parse_browsers
+from plugins.browser_matrix_plugin import interleave, item_engine
+from tools.browser_pool import BrowserPool
+
+
+def _item(name, engine=None):
+    """Make a stand-in test item parametrized with an engine."""
+    callspec = SimpleNamespace(params={"browser_name": engine}) if engine else None
+    return SimpleNamespace(name=name, callspec=callspec)
+
+
+class StubBrowser:
+    """Browser that records being closed."""
+
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def close(self):
+        self.connected = False
+
+
+@pytest.mark.unit
+class TestBrowserMatrix:
+    """Tests for --browsers parsing, test order and the browser pool."""
+
+    def test_parse_browsers(self):
+        """Test engines are normalized, deduplicated and validated."""
+        assert parse_browsers("chromium, Firefox,webkit,chromium") == ["chromium", "firefox", "webkit"]
+        assert parse_browsers(None) == []
+        with pytest.raises(pytest.UsageError, match="opera"):
+            parse_browsers("chromium,opera")
+
+    def test_engines_alternate_in_blocks(self):
+        """Test tests without a browser run first, then blocks of each engine in turn."""
+        items = [_item(f"c{i}", "chromium") for i in range(3)] + [_item("api")] + \
+            [_item(f"f{i}", "firefox") for i in range(3)]
+
+        ordered = interleave(items, ["chromium", "firefox"], block_size=2)
+
+        assert [item.name for item in ordered] == ["api", "c0", "c1", "f0", "f1", "c2", "f2"]
+        assert item_engine(ordered[-1]) == "firefox" and item_engine(ordered[0]) is None
+
+    def test_pool_launches_each_engine_once(self):
+        """Test the pool reuses browsers per engine and relaunches crashed ones."""
+        launched = []
+
+        def launch():
+            launched.append(StubBrowser())
+            return launched[-1]
+
+        pool = BrowserPool()
+        chromium = pool.get("chromium", launch)
+        firefox = pool.get("firefox", launch)
+        assert pool.get("chromium", launch) is chromium
+        assert pool.engines == ["chromium", "firefox"]
+
+        chromium.connected = False
+        assert pool.get("chromium", launch) is not chromium
+        assert len(launched) == 3
+
+        pool.close()
+        assert not firefox.is_connected() and pool.engines == []
@@ -0,0 +1,77 @@
+"""Unit tests for persistent browser server state and context slots."""
+
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import tools.browser_server as browser_server
+from tools.browser_server import BrowserServerClient, read_state
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Point browser server state at a temporary directory."""
+    monkeypatch.setattr(browser_server, "STATE_DIR", tmp_path)
+    return tmp_path
+
+
+def write_state(state_dir, supervisor_pid):
+    """Write a chromium supervisor state file."""
+    state = {
+        "engine": "chromium",
+        "supervisor_pid": supervisor_pid,
+        "max_contexts": 1,
+        "servers": [{"ws_endpoint": "ws://127.0.0.1:1/chromium", "port": 1, "healthy": True}],
+    }
+    (state_dir / "chromium.json").write_text(json.dumps(state))
+
+
+@pytest.mark.unit
+class TestBrowserServer:
+    """Tests for browser server state and context slots."""
+
+    def test_state_of_dead_supervisor_is_ignored(self, state_dir):
+        """Test a stale state file left by a crashed supervisor is ignored."""
+        write_state(state_dir, supervisor_pid=2 ** 22 + 1)
+        assert read_state("chromium") is None
+
+        write_state(state_dir, supervisor_pid=os.getpid())
+        assert read_state("chromium")["max_contexts"] == 1
+
+    def test_context_slots_cap_open_contexts(self, state_dir):
+        """Test a second context waits until the only slot is released."""
+        browser_type = SimpleNamespace(name="chromium")
+        first = BrowserServerClient(browser_type)
+        second = BrowserServerClient(browser_type, slot_timeout=5)
+        first.server = second.server = {"port": 1, "max_contexts": 1, "ws_endpoint": "ws://x"}
+        acquired = []
+
+        def open_second():
+            with second.context_slot():
+                acquired.append(time.monotonic())
+
+        with first.context_slot():
+            thread = threading.Thread(target=open_second)
+            thread.start()
+            time.sleep(0.3)
+            assert acquired == []
+            released = time.monotonic()
+        thread.join()
+
+        assert acquired and acquired[0] >= released
+
+    def test_context_slot_timeout(self, state_dir):
+        """Test waiting for a slot gives up after the timeout."""
+        browser_type = SimpleNamespace(name="chromium")
+        holder = BrowserServerClient(browser_type)
+        waiter = BrowserServerClient(browser_type, slot_timeout=0.2)
+        holder.server = waiter.server = {"port": 1, "max_contexts": 1, "ws_endpoint": "ws://x"}
+
+        with holder.context_slot():
+            with pytest.raises(TimeoutError):
+                with waiter.context_slot():
+                    pass
@@ -0,0 +1,75 @@
+"""Unit tests for the resolved configuration snapshot."""
+
+import pytest
+
+from configs import ConfigLoader, get_config_loader, get_settings
+from configs.snapshot import ConfigSnapshot, build_snapshot, flatten
+
+
+CONFIG = {
+    "dev": {"base_url": "https://dev.example", "api_url": "https://dev.example/api"},
+    "browsers": {"chromium": {"args": ["--no-sandbox"], "viewport": {"width": 800}}},
+    "devices": {"Pixel_5": {"viewport": {"width": 393}, "is_mobile": True}},
+    "execution": {"retries": 2, "timeout": None},
+}
+
+OPTIONS = {"environment": "dev", "browser_name": "chromium", "device_name": "Pixel_5"}
+
+
+@pytest.mark.unit
+class TestConfigSnapshot:
+    """Tests for flattening, immutability and resolution."""
+
+    def test_flatten_keeps_intermediate_nodes(self):
+        """Test both leaves and parent mappings are addressable."""
+        flat = flatten(CONFIG)
+
+        assert flat["browsers.chromium.viewport.width"] == 800
+        assert flat["browsers.chromium"]["args"] == ["--no-sandbox"]
+        assert "execution.timeout" in flat
+
+    def test_config_loader_get(self):
+        """Test dotted lookups, missing keys and None values fall back to the default."""
+        loader = ConfigLoader.from_dict(CONFIG)
+
+        assert loader.get("execution.retries") == 2
+        assert loader.get("execution.timeout", 30) == 30
+        assert loader.get("browsers.firefox.args", []) == []
+        assert loader.get("browsers.chromium.args.0", "x") == "x"
+        assert loader.get_browser_config("chromium")["viewport"] == {"width": 800}
+
+    def test_snapshot_is_read_only(self):
+        """Test nested values of a snapshot cannot be changed."""
+        snapshot = build_snapshot({"env": "dev", "base_url": ""}, CONFIG, OPTIONS)
+
+        with pytest.raises(TypeError):
+            snapshot.browser["args"] = []
+        with pytest.raises(TypeError):
+            snapshot.device["viewport"]["width"] = 1
+        assert snapshot.browser["args"] == ("--no-sandbox",)
+
+    def test_resolves_env_browser_and_device(self):
+        """Test the env overlay and selected profiles are resolved once."""
+        snapshot = build_snapshot({"env": "prod", "base_url": "https://fallback"}, CONFIG, OPTIONS)
+
+        assert snapshot.base_url == "https://dev.example"
+        assert snapshot.api_url == "https://dev.example/api"
+        assert snapshot.get("resolved.browser.viewport.width") == 800
+        assert snapshot.device["is_mobile"] is True
+        assert snapshot.get_config("execution.retries") == 2
+        assert snapshot.browser_profile("chromium")["args"] == ("--no-sandbox",)
+        assert snapshot.browser_profile("webkit") == {}
+
+    def test_round_trip_through_plain_data(self):
+        """Test a snapshot survives the trip to xdist workers."""
+        snapshot = build_snapshot({"env": "dev", "base_url": ""}, CONFIG, OPTIONS)
+        restored = ConfigSnapshot(snapshot.to_dict())
+
+        assert restored.to_dict() == snapshot.to_dict()
+        assert isinstance(snapshot.to_dict()["config"]["browsers"]["chromium"]["args"], list)
+
+    def test_process_config_comes_from_snapshot(self, config_snapshot, pytestconfig):
+        """Test settings and config accessors serve the run's snapshot."""
+        assert config_snapshot.options["environment"] == pytestconfig.option.environment
+        assert get_settings().artifacts_path == config_snapshot.settings["artifacts_path"]
+        assert get_config_loader().get("execution") == dict(config_snapshot.execution)
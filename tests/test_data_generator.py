@@ -0,0 +1,76 @@
+"""Unit tests for seeded, bulk Faker data generation and generated pools."""
+
+import random
+
+import pytest
+
+from tools.data_generator import DataGenerator, GeneratedPool, seed_for, shared_faker
+
+
+@pytest.mark.unit
+class TestDataGenerator:
+    """Tests for the shared Faker instance, seeding and batch generation."""
+
+    def test_generators_share_one_faker(self):
+        """Test generators reuse the process-wide Faker instance."""
+        assert DataGenerator().fake is DataGenerator(1).fake is shared_faker()
+
+    def test_same_seed_generates_same_records(self):
+        """Test a seed reproduces records of every kind."""
+        for kind in ("user", "address", "company", "credit_card"):
+            assert DataGenerator(7).generate_many(kind, 5) == DataGenerator(7).generate_many(kind, 5)
+        assert DataGenerator(7).generate_users(5) != DataGenerator(8).generate_users(5)
+
+    def test_seeded_generator_is_unaffected_by_others(self):
+        """Test interleaved generators do not consume each other's random draws."""
+        alone = DataGenerator(3)
+        expected = alone.generate_users(1) + alone.generate_addresses(2)
+        generator = DataGenerator(3)
+        first = generator.generate_users(1)
+        DataGenerator(4).generate_users(10)
+        assert first + generator.generate_addresses(2) == expected
+
+    def test_generate_users_builds_complete_records(self):
+        """Test bulk users carry consistent usernames, emails and strong passwords."""
+        users = DataGenerator(11).generate_users(200)
+
+        assert len(users) == 200
+        for user in users:
+            assert user["email"] == f"{user['username']}@{user['email'].split('@')[1]}"
+            assert user["phone"] and not set("#%$!@") & set(user["phone"])
+            password = user["password"]
+            assert len(password) == 12
+            assert any(c.isdigit() for c in password)
+            assert any(c.isupper() for c in password) and any(c.islower() for c in password)
+
+    def test_unknown_kind_is_rejected(self):
+        """Test generate_many rejects kinds it cannot generate."""
+        with pytest.raises(ValueError, match="spaceship"):
+            DataGenerator().generate_many("spaceship", 1)
+
+    def test_seed_for_is_stable_per_node_id(self):
+        """Test node id seeds are deterministic and differ by node id and base seed."""
+        assert seed_for("tests/test_a.py::test_x") == seed_for("tests/test_a.py::test_x")
+        assert seed_for("tests/test_a.py::test_x") != seed_for("tests/test_a.py::test_y")
+        assert seed_for("tests/test_a.py::test_x", 1) != seed_for("tests/test_a.py::test_x")
+
+
+@pytest.mark.unit
+class TestGeneratedPool:
+    """Tests for pools written to disk once and sampled."""
+
+    def test_pool_is_built_once_and_sampled(self, tmp_path):
+        """Test a pool file is reused and samples come from it."""
+        pool = GeneratedPool(tmp_path, "user", size=50, seed=2, chunk=20)
+        path = pool.build()
+        mtime = path.stat().st_mtime_ns
+
+        same = GeneratedPool(tmp_path, "user", size=50, seed=2)
+        assert same.build() == path
+        assert path.stat().st_mtime_ns == mtime
+        assert len(same) == 50
+
+        assert same.source.read(0)["first_name"] == DataGenerator(2).generate_users(1)[0]["first_name"]
+        sample = same.sample_many(10, random.Random(1))
+        assert len({user["email"] for user in sample}) == 10
+        assert same.sample(random.Random(1)) in [same.source.read(i) for i in range(50)]
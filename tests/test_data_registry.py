@@ -0,0 +1,79 @@
+"""Unit tests for the session test data registry."""
+
+import json
+import os
+
+import pytest
+
+from tools.data_registry import DataRegistry
+
+
+def write_users(path, users, mtime_ns=None):
+    """Write a users.json data file."""
+    path.write_text(json.dumps({"users": users}))
+    if mtime_ns:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.unit
+class TestDataRegistry:
+    """Tests for caching, invalidation, indexes and read-only views."""
+
+    def test_parses_once_and_reparses_on_change(self, tmp_path):
+        """Test a file is parsed once until its mtime changes."""
+        users = tmp_path / "users.json"
+        write_users(users, [{"id": 1, "role": "user"}], mtime_ns=1_000_000_000)
+        registry = DataRegistry(tmp_path)
+
+        registry.load("users.json")
+        registry.load("users.json")
+        assert registry.parses == 1
+
+        write_users(users, [{"id": 1, "role": "admin"}], mtime_ns=2_000_000_000)
+        assert registry.find_one("users.json", "users", "role", "admin")["id"] == 1
+        assert registry.parses == 2
+
+    def test_declared_and_on_demand_indexes(self, tmp_path):
+        """Test records are found through declared and lazily built indexes."""
+        write_users(tmp_path / "users.json", [
+            {"id": 1, "role": "user", "active": True},
+            {"id": 2, "role": "admin", "active": False},
+            {"id": 3, "role": "admin", "active": True},
+        ])
+        registry = DataRegistry(tmp_path, {"users.json": {"users": ["role"]}})
+
+        assert [u["id"] for u in registry.find("users.json", "users", "role", "admin")] == [2, 3]
+        assert registry.find("users.json", "users", "active", False)[0]["id"] == 2
+        assert registry.find("users.json", "users", "role", "guest") == ()
+        with pytest.raises(LookupError):
+            registry.find_one("users.json", "users", "id", 99)
+
+    def test_views_are_read_only(self, tmp_path):
+        """Test cached records cannot be modified by a test."""
+        write_users(tmp_path / "users.json", [{"id": 1, "tags": ["a"]}])
+        registry = DataRegistry(tmp_path)
+        user = registry.collection("users.json", "users")[0]
+
+        with pytest.raises(TypeError):
+            user["id"] = 2
+        assert user["tags"] == ("a",)
+
+    def test_unhashable_field(self, tmp_path):
+        """Test indexing a field holding objects fails with a clear error."""
+        write_users(tmp_path / "users.json", [{"id": 1, "address": {"city": "Kyiv"}}])
+        registry = DataRegistry(tmp_path)
+
+        with pytest.raises(TypeError, match="Cannot index users.address in users.json"):
+            registry.find("users.json", "users", "address", "Kyiv")
+        with pytest.raises(TypeError, match="unhashable dict"):
+            registry.find("users.json", "users", "id", {"id": 1})
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing data file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            DataRegistry(tmp_path).load("missing.json")
+
+    def test_registry_fixture_uses_bundled_data(self, data_registry, load_test_data):
+        """Test the session registry serves tests/data files."""
+        assert load_test_data("users.json") is data_registry.load("users.json")
+        assert data_registry.find_one("users.json", "users", "role", "admin")["id"] == 3
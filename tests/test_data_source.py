@@ -0,0 +1,89 @@
+"""Unit tests for streaming JSONL/CSV datasets."""
+
+import gzip
+import json
+
+import pytest
+
+from tools.data_source import DataSource, parse_shard
+
+
+RECORDS = [{"id": i, "role": "admin" if i % 3 == 0 else "user"} for i in range(10)]
+
+
+@pytest.fixture
+def jsonl_path(tmp_path):
+    """Write a JSONL dataset with a blank line in it."""
+    path = tmp_path / "users.jsonl"
+    lines = [json.dumps(r) for r in RECORDS]
+    path.write_text("\n".join(lines[:5] + [""] + lines[5:]) + "\n")
+    return path
+
+
+@pytest.mark.unit
+class TestDataSource:
+    """Tests for offsets, selections, shards and formats."""
+
+    def test_select_and_read(self, jsonl_path, tmp_path):
+        """Test filtered records are selected by position and read by offset."""
+        source = DataSource(jsonl_path, tmp_path / "index")
+        positions, ids = source.select({"role": "admin"}, id_field="id")
+
+        assert ids == ["0", "3", "6", "9"]
+        assert [source.read(p)["id"] for p in reversed(positions)] == [9, 6, 3, 0]
+        assert len(source) == 10
+
+    def test_index_is_shared_between_processes(self, jsonl_path, tmp_path):
+        """Test a second reader uses the cached index without scanning the file."""
+        DataSource(jsonl_path, tmp_path / "index").select(lambda r: r["id"] > 6)
+
+        other = DataSource(jsonl_path, tmp_path / "index")
+        positions, _ = other.select(lambda r: r["id"] > 6)
+
+        assert other.read(positions[0])["id"] == 7
+        assert other.scans == 0
+
+    def test_index_is_rebuilt_when_file_changes(self, jsonl_path, tmp_path):
+        """Test the cache is keyed by file size and mtime."""
+        DataSource(jsonl_path, tmp_path / "index").select()
+        jsonl_path.write_text(json.dumps({"id": 99}) + "\n")
+
+        source = DataSource(jsonl_path, tmp_path / "index")
+        assert source.select()[0] == [0]
+        assert source.read(0)["id"] == 99
+
+    def test_shard_and_limit(self, jsonl_path, tmp_path):
+        """Test shards partition the selection and limit caps it."""
+        source = DataSource(jsonl_path, tmp_path / "index")
+        shards = [source.select(shard=f"{i}/3")[0] for i in range(3)]
+
+        assert sorted(sum(shards, [])) == list(range(10))
+        assert source.select(shard="1/3", limit=2)[0] == [1, 4]
+        assert parse_shard(None) is None
+        with pytest.raises(ValueError):
+            parse_shard("3/3")
+
+    def test_gzipped_csv(self, tmp_path):
+        """Test CSV rows in a gzip file are read as dicts keyed by the header."""
+        path = tmp_path / "todos.csv.gz"
+        with gzip.open(path, "wt") as f:
+            f.write("id,text\n1,Buy milk\n2,\"Pay rent, today\"\n3,Walk dog\n")
+        source = DataSource(path, tmp_path / "index")
+
+        positions, _ = source.select(lambda r: r["id"] != "1")
+        assert [source.read(p)["text"] for p in positions] == ["Pay rent, today", "Walk dog"]
+        assert source.read(0) == {"id": "1", "text": "Buy milk"}
+
+    def test_csv_row_length_mismatch(self, tmp_path):
+        """Test a row with more or fewer cells than the header is rejected."""
+        path = tmp_path / "todos.csv"
+        path.write_text("id,text\n1,Buy milk,extra\n")
+        with pytest.raises(ValueError):
+            DataSource(path, tmp_path / "index").read(0)
+
+    def test_unsupported_format(self, tmp_path):
+        """Test only JSONL and CSV datasets are accepted."""
+        path = tmp_path / "users.json"
+        path.write_text("[]")
+        with pytest.raises(ValueError):
+            DataSource(path, tmp_path)
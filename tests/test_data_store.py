@@ -0,0 +1,79 @@
+"""Unit tests for the compiled memory-mapped data store."""
+
+import json
+
+import pytest
+
+from tools.data_store import DataStore, DataStoreSet, build_stores, compile_store
+
+
+USERS = [
+    {"id": i, "email": f"user{i}@example.com", "role": "admin" if i % 4 == 0 else "user"}
+    for i in range(1, 101)
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Compile a users data file with id and role indexes."""
+    source = tmp_path / "users.json"
+    source.write_text(json.dumps({"users": USERS, "version": 2}))
+    path = compile_store(source, tmp_path / "users.pds", {"users": ["id", "role"]})
+    store = DataStore(path)
+    yield store
+    store.close()
+
+
+@pytest.mark.unit
+class TestDataStore:
+    """Tests for compiled stores, lookups and the per-run build."""
+
+    def test_positional_access(self, store):
+        """Test records are decoded by position and slice."""
+        users = store.collection("users")
+
+        assert len(users) == 100
+        assert users[0] == USERS[0]
+        assert users[-1]["id"] == 100
+        assert [u["id"] for u in users[10:13]] == [11, 12, 13]
+        assert list(store) == ["users"]
+
+    def test_indexed_lookup(self, store):
+        """Test unique and non-unique keys are found by binary search."""
+        users = store.collection("users")
+
+        assert users.find_one("id", 57)["email"] == "user57@example.com"
+        assert [u["id"] for u in users.find("role", "admin")] == list(range(4, 101, 4))
+        assert users.find("id", "57") == ()
+        with pytest.raises(KeyError):
+            users.find("email", "user1@example.com")
+
+    def test_records_are_read_only(self, store):
+        """Test decoded records cannot be modified."""
+        with pytest.raises(TypeError):
+            store.collection("users")[0]["role"] = "admin"
+
+    def test_build_stores_reuses_up_to_date_files(self, tmp_path):
+        """Test stores are compiled once and rebuilt when the source changes."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "users.json").write_text(json.dumps({"users": USERS[:3]}))
+        declared = {"users.json": {"users": ["id"]}, "missing.json": {"items": ["id"]}}
+
+        first = build_stores(data_dir, tmp_path / "store", declared)
+        assert build_stores(data_dir, tmp_path / "store", declared) == first
+        assert "missing.json" not in first
+
+        (data_dir / "users.json").write_text(json.dumps({"users": USERS[:5]}))
+        second = build_stores(data_dir, tmp_path / "store", declared)
+        stores = DataStoreSet(second)
+        assert second != first
+        assert len(stores("users.json").collection("users")) == 5
+        stores.close()
+
+    def test_fixtures_use_compiled_store(self, data_store, admin_user, test_user, sample_todos):
+        """Test data fixtures are served from the run's compiled stores."""
+        assert "users.json" in data_store
+        assert admin_user["role"] == "admin"
+        assert test_user["id"] == 1
+        assert sample_todos[0]["text"]
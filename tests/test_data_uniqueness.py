@@ -0,0 +1,62 @@
+"""Unit tests for collision-free identities across xdist workers."""
+
+import pytest
+
+from tools.data_generator import DataGenerator, GeneratedPool
+from tools.data_uniqueness import TDSIdentityCheck, UniqueIdentities, worker_partition
+
+
+@pytest.mark.unit
+class TestUniqueIdentities:
+    """Tests for worker partitions of identity tokens."""
+
+    def test_workers_issue_disjoint_tokens(self):
+        """Test tokens of all workers are distinct."""
+        workers = [UniqueIdentities(index, 8, "r") for index in range(8)]
+        tokens = [worker.next_token() for worker in workers for _ in range(500)]
+        assert len(set(tokens)) == len(tokens)
+
+    def test_same_seed_on_every_worker_gives_unique_users(self):
+        """Test identical seeded generators on different workers do not collide."""
+        users = [
+            user
+            for index in range(4)
+            for user in DataGenerator(1, UniqueIdentities(index, 4)).generate_users(300)
+        ]
+        assert len({user["email"] for user in users}) == len(users)
+        assert len({user["username"] for user in users}) == len(users)
+
+    def test_partition_comes_from_xdist_environment(self, monkeypatch):
+        """Test the worker index and count are read from xdist's variables."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "8")
+        monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "abcdef0123")
+        assert worker_partition() == (3, 8)
+
+        identities = UniqueIdentities.for_worker()
+        assert identities.next_token() == "abcdef3"
+        assert UniqueIdentities.for_worker("").next_token() == "3"
+
+        with pytest.raises(ValueError):
+            UniqueIdentities(8, 8)
+
+    def test_verify_skips_taken_identities(self):
+        """Test identities already stored in the TDS are skipped."""
+
+        class Stored:
+            def get_data(self, data_type, filters):
+                return [{"id": 1}] if filters.get("email", "").startswith("ann.lee.0@") else []
+
+        identities = UniqueIdentities(verify=TDSIdentityCheck(Stored()))
+        assert identities.identity("ann.lee", "example.com") == ("ann.lee.1", "ann.lee.1@example.com")
+        assert identities.stats == {"issued": 1, "taken": 1}
+
+    def test_pool_partitions_do_not_overlap(self, tmp_path):
+        """Test workers sample disjoint records of a shared pool."""
+        samples = [
+            GeneratedPool(tmp_path, "user", size=40, partition=(index, 2)).sample_many(20)
+            for index in range(2)
+        ]
+        emails = [{user["email"] for user in sample} for sample in samples]
+        assert len(emails[0]) == len(emails[1]) == 20
+        assert not emails[0] & emails[1]
@@ -0,0 +1,97 @@
+"""Unit tests for per-test device emulation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from plugins.device_plugin import pytest_generate_tests
+from tools.devices import DeviceDescriptors
+
+
+DEVICES = {
+    "Pixel_5": {
+        "user_agent": "Pixel",
+        "viewport": {"width": 393, "height": 851},
+        "is_mobile": True,
+        "has_touch": True,
+    },
+    "Moto_G4": {"viewport": {"width": 360, "height": 640}, "throttling": "mid-tier-mobile"},
+}
+BUILTIN = {"iPad Mini": {"viewport": {"width": 768, "height": 1024}, "default_browser_type": "webkit"}}
+
+
+class StubMetafunc:
+    """Metafunc of a test with the given markers, recording parametrization."""
+
+    def __init__(self, *markers):
+        self.definition = SimpleNamespace(
+            nodeid="tests/test_x.py::test_layout",
+            iter_markers=lambda name: [m for m in markers if m.name == name],
+            get_closest_marker=lambda name: next((m for m in markers if m.name == name), None),
+        )
+        self.fixturenames = ["page"]
+        self.parametrized = []
+
+    def parametrize(self, argnames, argvalues):
+        self.parametrized.append((argnames, argvalues))
+
+
+@pytest.mark.unit
+class TestDeviceDescriptors:
+    """Tests for resolving device names."""
+
+    def test_config_profile_to_context_args(self):
+        """Test only context arguments of a profile are passed on."""
+        descriptors = DeviceDescriptors(DEVICES)
+        assert descriptors.context_args("Moto_G4") == {"viewport": {"width": 360, "height": 640}}
+        assert descriptors.throttling("Moto_G4") == "mid-tier-mobile"
+        assert descriptors.throttling("Pixel_5") is None
+
+    def test_builtin_fallback(self):
+        """Test names missing from config resolve to Playwright's descriptors."""
+        descriptors = DeviceDescriptors(DEVICES, BUILTIN)
+        assert descriptors.context_args("iPad Mini") == {"viewport": {"width": 768, "height": 1024}}
+
+    def test_resolved_once(self):
+        """Test each device is resolved once and reused."""
+        descriptors = DeviceDescriptors(DEVICES)
+        assert descriptors.get("Pixel_5") is descriptors.get("Pixel_5")
+
+    def test_unknown_device(self):
+        """Test unknown names list the configured devices."""
+        with pytest.raises(KeyError, match="Moto_G4, Pixel_5"):
+            DeviceDescriptors(DEVICES).get("Nokia_3310")
+
+    def test_firefox_drops_is_mobile(self):
+        """Test is_mobile is left out on Firefox only."""
+        descriptors = DeviceDescriptors(DEVICES)
+        assert "is_mobile" not in descriptors.context_args("Pixel_5", "firefox")
+        assert descriptors.context_args("Pixel_5", "firefox")["has_touch"] is True
+        assert descriptors.context_args("Pixel_5", "webkit")["is_mobile"] is True
+
+
+@pytest.mark.unit
+class TestDeviceMarker:
+    """Tests for selecting devices with the device marker."""
+
+    def test_parametrizes_device(self):
+        """Test the marker runs the test once per device."""
+        metafunc = StubMetafunc(pytest.mark.device("iPhone_13", "Pixel_5").mark)
+        pytest_generate_tests(metafunc)
+        assert "device" in metafunc.fixturenames
+        assert metafunc.parametrized == [("device", ["iPhone_13", "Pixel_5"])]
+
+    def test_without_marker(self):
+        """Test unmarked tests are left alone."""
+        metafunc = StubMetafunc()
+        pytest_generate_tests(metafunc)
+        assert metafunc.parametrized == []
+
+    def test_marker_and_parameter_conflict(self):
+        """Test a marker and a direct device parameter cannot be combined."""
+        metafunc = StubMetafunc(
+            pytest.mark.device("Pixel_5").mark,
+            pytest.mark.parametrize("viewport, device", [(None, "Moto_G4")]).mark,
+        )
+        with pytest.raises(pytest.UsageError, match="not both"):
+            pytest_generate_tests(metafunc)
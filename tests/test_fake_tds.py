@@ -0,0 +1,113 @@
+"""Unit tests for the fake Test Data Service with the real client."""
+
+import time
+
+import pytest
+import requests
+
+from tools.fake_tds import FakeTDS, FakeTDSClient
+from tools.tds_leases import LeaseManager, LeasePool
+from tools.test_data_service import TestDataServiceClient
+
+
+@pytest.fixture
+def fake():
+    """Start a fake TDS with seeded users."""
+    server = FakeTDS.from_config({"seed": {"users": {"kind": "user", "count": 5}}, "random_seed": 1}).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(fake):
+    """Create a client for the fake TDS."""
+    tds = TestDataServiceClient(base_url=fake.url, api_key="key", backoff=0.001)
+    yield tds
+    tds.close()
+
+
+@pytest.mark.unit
+class TestFakeTDS:
+    """Tests for generation, CRUD, locks and fault injection."""
+
+    def test_generates_records(self, client):
+        """Test user, address and payment generation, single and in bulk."""
+        assert {"email", "username", "id"} <= set(client.generate_user("admin"))
+        assert client.generate_address("UA")["country"] == "UA"
+        assert client.generate_payment("amex")["card_type"] == "amex"
+
+        result = client.generate_many("user", 3)
+        assert result.ok and len({user["id"] for user in result.succeeded}) == 3
+
+    def test_crud(self, client):
+        """Test create, query, update and delete on a data type."""
+        created = client.create_data("orders", {"status": "new"})
+        assert client.get_data("orders", {"status": "new"}) == [created]
+
+        client.update_data("orders", created["id"], {"status": "paid"})
+        assert client.get_data("orders", {"status": "new"}) == []
+
+        client.delete_data("orders", created["id"])
+        with pytest.raises(requests.HTTPError, match="404"):
+            client.delete_data("orders", created["id"])
+
+    def test_locks_are_exclusive_until_expired(self, client):
+        """Test a lock refuses other owners until released or past its TTL."""
+        user_id = client.get_data("users")[0]["id"]
+        client.lock_data("users", user_id, "a", ttl=0.05)
+
+        with pytest.raises(requests.HTTPError, match="409"):
+            client.lock_data("users", user_id, "b")
+        assert not client.lock_many("users", [user_id], "b").ok
+
+        time.sleep(0.06)
+        client.lock_data("users", user_id, "b")
+        client.release_data("users", user_id, "b")
+        client.lock_data("users", user_id, "a")
+
+    def test_leases_through_the_fake(self, client):
+        """Test the lease pool leases seeded records and releases them on stop."""
+        manager = LeaseManager(client, ttl=5, heartbeat_interval=0.05).start()
+        pool = LeasePool(manager, "users", size=2)
+        lease = pool.checkout()
+
+        other = TestDataServiceClient(base_url=client.base_url, backoff=0.001)
+        with pytest.raises(requests.HTTPError, match="409"):
+            other.lock_data("users", lease.data_id, "other")
+
+        manager.stop()
+        other.lock_data("users", lease.data_id, "other")
+
+    def test_injected_errors_and_latency(self, fake, client):
+        """Test injected errors are retried on reads and latency delays responses."""
+        fake.set_error("/data/users", status=503, rate=1.0)
+        with pytest.raises(requests.HTTPError, match="503"):
+            client.get_data("users", {"role": "none"})
+        assert client.metrics["GET /data/users"]["retries"] == client.max_retries
+
+        FakeTDSClient(fake.url).clear_faults()
+        FakeTDSClient(fake.url).set_latency("/data/address", 50)
+        started = time.perf_counter()
+        client.generate_address()
+        assert time.perf_counter() - started >= 0.05
+
+    def test_injected_error_on_post_keeps_connection_usable(self, fake, client):
+        """Test the body of a failed POST does not leak into the next request on the connection."""
+        fake.set_error("/data/user", status=500, rate=1.0)
+        with pytest.raises(requests.HTTPError, match="500"):
+            client.generate_user()
+
+        fake.clear_faults()
+        assert "email" in client.generate_user()
+
+    def test_rate_limited_posts_succeed_on_retry(self, fake):
+        """Test partly rate-limited POSTs end in success once retried."""
+        fake.state.random.seed(0)
+        fake.set_error("/data/user", status=429, rate=0.5)
+        client = TestDataServiceClient(base_url=fake.url, api_key="key", backoff=0.001, max_retries=8)
+        try:
+            users = [client.generate_user() for _ in range(20)]
+        finally:
+            client.close()
+        assert all("email" in user for user in users)
+        assert client.metrics["POST /data/user"]["retries"] > 0
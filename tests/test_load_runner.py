@@ -0,0 +1,78 @@
+"""Unit tests for load generation building blocks."""
+
+import pytest
+
+from tools.load_runner import LatencyHistogram, LoadProfile, LoadRunner
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Tests for the HDR-style latency histogram."""
+
+    def test_percentiles_within_precision(self):
+        """Test percentiles stay within the configured relative error."""
+        histogram = LatencyHistogram(significant_digits=2)
+        for value in range(1, 1001):
+            histogram.record(value)
+
+        assert histogram.total == 1000
+        assert histogram.percentile(50) == pytest.approx(500, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(990, rel=0.01)
+        assert histogram.percentile(100) == 1000
+
+    def test_merge_and_serialization(self):
+        """Test histograms survive a round trip and merge like one histogram."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for value in (1, 2, 3):
+            first.record(value)
+        for value in (100, 200):
+            second.record(value)
+
+        merged = LatencyHistogram.from_dict(first.to_dict())
+        merged.merge(LatencyHistogram.from_dict(second.to_dict()))
+        summary = merged.summary()
+
+        assert summary["count"] == 5
+        assert summary["min"] == 1
+        assert summary["max"] == 200
+        assert summary["mean"] == pytest.approx(61.2)
+
+
+@pytest.mark.unit
+class TestLoadProfile:
+    """Tests for load phases and process planning."""
+
+    def test_windows_cover_phases(self):
+        """Test users start during ramp-up and stop during ramp-down."""
+        profile = LoadProfile(users=4, ramp_up=8, hold=10, ramp_down=4)
+
+        assert profile.window(0) == (0.0, 19.0)
+        assert profile.window(3) == (6.0, 22.0)
+        assert profile.duration == 22
+
+    def test_machine_limits(self):
+        """Test profiles needing too many browser processes are rejected."""
+        with pytest.raises(ValueError, match="need 5 browser processes"):
+            LoadProfile(users=10, contexts_per_browser=2, max_browsers=4).validate()
+
+    def test_plan_round_robin(self):
+        """Test users are spread over browser processes."""
+        runner = LoadRunner("http://app", LoadProfile(users=5, contexts_per_browser=2))
+
+        plan = runner.plan()
+
+        assert [[user for user, _, _ in group] for group in plan] == [[0, 3], [1, 4], [2]]
+
+    def test_report(self):
+        """Test per-process results are merged into rates and percentiles."""
+        histogram = LatencyHistogram()
+        for value in (10, 20, 30):
+            histogram.record(value)
+        result = {"histograms": {"open": histogram.to_dict()}, "errors": {"open": 1},
+                  "iterations": 3}
+
+        report = LoadRunner("http://app", LoadProfile(users=2)).build_report([result, result], 2.0)
+
+        assert report["steps"]["open"]["count"] == 6
+        assert report["steps"]["open"]["error_rate"] == 0.25
+        assert report["iterations_per_s"] == 3.0
@@ -55,6 +55,7 @@ class TestMobileLogin:
 
 
 @pytest.mark.mobile
+@pytest.mark.device("iPhone_13", "Pixel_5")
 class TestMobileNavigation:
     """Mobile navigation tests."""
 
@@ -95,6 +96,14 @@ class TestMobilePerformance:
         # Assert load time is acceptable (e.g., under 5 seconds)
         assert timer.get_duration() < 5.0, "Page should load within 5 seconds"
 
+    @pytest.mark.throttle("mid-tier-mobile")
+    def test_page_load_time_mid_tier_mobile(self, page: Page, base_url: str):
+        """Test page load time on a throttled mid-tier mobile profile."""
+        home_page = HomePage(page, base_url)
+        home_page.navigate_to_home()
+
+        home_page.expect_load_within(10000)
+
     def test_mobile_responsiveness(self, page: Page, base_url: str):
         """Test UI responsiveness on mobile."""
         home_page = HomePage(page, base_url)
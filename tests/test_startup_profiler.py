@@ -0,0 +1,69 @@
+"""Unit tests for the startup profiler and lazy framework imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+from plugins.startup_profiler_plugin import ImportTimer, build_profile, profiling_requested
+
+
+@pytest.mark.unit
+class TestStartupProfiler:
+    """Tests for import timing and the profile summary."""
+
+    def test_import_timer_records_self_and_cumulative_time(self, tmp_path, monkeypatch):
+        """Test nested imports are attributed to the importing module."""
+        (tmp_path / "profiled_child.py").write_text("import time\ntime.sleep(0.05)\n")
+        (tmp_path / "profiled_parent.py").write_text("import profiled_child\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        timer = ImportTimer().install()
+        try:
+            import profiled_parent  # noqa: F401
+        finally:
+            timer.uninstall()
+            sys.modules.pop("profiled_parent", None)
+            sys.modules.pop("profiled_child", None)
+
+        parent, child = timer.records["profiled_parent"], timer.records["profiled_child"]
+        assert child["self_ms"] >= 50
+        assert parent["cumulative_ms"] >= child["cumulative_ms"]
+        assert parent["self_ms"] < child["self_ms"]
+        assert parent["root"] and not child["root"]
+
+    def test_build_profile_sorts_slowest_first(self):
+        """Test profile rows are ordered by cost and only roots add to the total."""
+        profile = build_profile(
+            {
+                "a": {"cumulative_ms": 30.0, "self_ms": 10.0, "root": True},
+                "a.b": {"cumulative_ms": 20.0, "self_ms": 20.0, "root": False},
+            },
+            {"tests/test_fast.py": 1.0, "tests/test_slow.py": 9.0},
+            12.5,
+            3,
+        )
+
+        assert profile["imports"]["total_ms"] == 30.0
+        assert [r["module"] for r in profile["imports"]["slowest"]] == ["a.b", "a"]
+        assert profile["collection"]["slowest"][0]["module"] == "tests/test_slow.py"
+        assert profile["collection"]["tests"] == 3
+
+    def test_profiling_requested(self, monkeypatch):
+        """Test the flag is detected on the command line and in PYTEST_ADDOPTS."""
+        monkeypatch.delenv("PYTEST_ADDOPTS", raising=False)
+        assert profiling_requested(["pytest", "--profile-startup"])
+        assert not profiling_requested(["pytest"])
+
+        monkeypatch.setenv("PYTEST_ADDOPTS", "-q --profile-startup")
+        assert profiling_requested(["pytest"])
+
+    def test_framework_imports_are_lazy(self):
+        """Test importing configs, tools, fixtures and plugins builds no settings."""
+        code = (
+            "import sys, configs, tools, fixtures, plugins\n"
+            "assert configs._settings is None and configs._config_loader is None\n"
+            "assert 'pydantic_settings' not in sys.modules\n"
+            "assert 'requests' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,82 @@
+"""Unit tests for the local TodoMVC server and its fixtures."""
+
+import time
+import urllib.request
+
+import pytest
+
+from tools.static_server import StaticServer, StaticServerClient
+
+
+def fetch_seconds(url):
+    """Fetch a URL and return the elapsed time in seconds."""
+    started = time.monotonic()
+    urllib.request.urlopen(url).read()
+    return time.monotonic() - started
+
+
+@pytest.mark.unit
+class TestStaticServer:
+    """Tests for the local static server."""
+
+    def test_serves_bundled_todomvc(self):
+        """Test the vendored TodoMVC app is served on an ephemeral port."""
+        with StaticServer() as server:
+            body = urllib.request.urlopen(f"{server.url}/").read().decode()
+
+        assert server.port > 0
+        assert 'class="new-todo"' in body
+
+    def test_route_latency(self):
+        """Test latency is injected only for matching routes."""
+        with StaticServer(latency={"/app.js": 200}) as server:
+            fast = fetch_seconds(f"{server.url}/app.css")
+            slow = fetch_seconds(f"{server.url}/app.js")
+
+        assert fast < 0.2 <= slow
+
+
+@pytest.mark.unit
+class TestLocalServerFixtures:
+    """Tests for the local server fixtures."""
+
+    def test_route_latency_fixture(self, local_todo_server, route_latency):
+        """Test per-test latency is applied to the session server."""
+        route_latency("/app.js", 150)
+
+        assert local_todo_server.latency["/app.js"] == 150
+        assert fetch_seconds(f"{local_todo_server.url}/app.js") >= 0.15
+
+
+@pytest.mark.unit
+class TestRouteLatencyCleanup:
+    """Tests for removing per-test latency, on a server of the class's own."""
+
+    @pytest.fixture
+    def local_todo_server(self):
+        """Serve the app for one test and check route_latency cleaned up before it stops."""
+        server = StaticServer().start()
+        yield server
+        # Torn down after route_latency, which depends on this fixture
+        assert server.latency == {}, "route_latency left latency behind"
+        server.stop()
+
+    def test_route_latency_is_cleared(self, local_todo_server, route_latency):
+        """Test latency set in a test is removed at its teardown."""
+        route_latency("/app.js", 10)
+        assert local_todo_server.latency == {"/app.js": 10}
+
+
+@pytest.mark.unit
+class TestSharedServerLatency:
+    """Tests for route_latency with a server shared by xdist workers."""
+
+    @pytest.fixture
+    def local_todo_server(self):
+        """Stand in for the controller's server as seen from a worker."""
+        return StaticServerClient("http://127.0.0.1:1")
+
+    def test_route_latency_rejects_shared_server(self, request):
+        """Test latency cannot be injected into a server shared by xdist workers."""
+        with pytest.raises(pytest.fail.Exception, match="--local-server=worker"):
+            request.getfixturevalue("route_latency")
@@ -0,0 +1,78 @@
+"""Unit tests for the TDS read cache."""
+
+import time
+
+import pytest
+
+from tools.tds_cache import MISSING, TDSCache, merge_stats
+
+
+@pytest.mark.unit
+class TestTDSCache:
+    """Tests for TTLs, LRU eviction, invalidation and the shared disk tier."""
+
+    def test_entries_expire_per_type_ttl(self):
+        """Test entries live for their data type's TTL."""
+        cache = TDSCache(ttls={"users": 0.05, "orders": 0}, default_ttl=60)
+        cache.put("users", {"role": "admin"}, [{"id": 1}])
+        cache.put("orders", None, [{"id": 2}])
+        cache.put("todos", None, [{"id": 3}])
+
+        assert cache.get("users", {"role": "admin"}) == [{"id": 1}]
+        assert cache.get("orders") is MISSING
+        time.sleep(0.06)
+        assert cache.get("users", {"role": "admin"}) is MISSING
+        assert cache.get("todos") == [{"id": 3}]
+        assert cache.stats["users"]["hits"] == 1
+        assert cache.stats["users"]["misses"] == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the memory tier keeps at most max_entries."""
+        cache = TDSCache(max_entries=2)
+        cache.put("users", {"id": 1}, "a")
+        cache.put("users", {"id": 2}, "b")
+        cache.get("users", {"id": 1})
+        cache.put("users", {"id": 3}, "c")
+
+        assert cache.get("users", {"id": 2}) is MISSING
+        assert cache.get("users", {"id": 1}) == "a"
+        assert cache.stats["users"]["evictions"] == 1
+
+    def test_cached_values_are_copies(self):
+        """Test callers cannot mutate cached responses."""
+        cache = TDSCache()
+        cache.put("users", None, [{"id": 1}])
+        cache.get("users")[0]["id"] = 2
+
+        assert cache.get("users") == [{"id": 1}]
+
+    def test_invalidation_reaches_other_workers(self, tmp_path):
+        """Test a write in one process drops entries cached by another."""
+        first, second = TDSCache(disk_dir=tmp_path), TDSCache(disk_dir=tmp_path)
+        first.put("users", None, [{"id": 1}])
+        first.put("todos", None, [{"id": 9}])
+
+        assert second.get("users") == [{"id": 1}]
+        assert second.stats["users"]["disk_hits"] == 1
+
+        second.invalidate("users")
+
+        assert first.get("users") is MISSING
+        assert first.get("todos") == [{"id": 9}]
+
+    def test_response_fetched_before_a_write_is_not_cached(self, tmp_path):
+        """Test put is skipped when the type changed since the fetch started."""
+        first, second = TDSCache(disk_dir=tmp_path), TDSCache(disk_dir=tmp_path)
+        generation = first.generation("users")
+        second.invalidate("users")
+        first.put("users", None, [{"id": "stale"}], generation)
+
+        assert first.get("users") is MISSING
+        assert second.get("users") is MISSING
+
+    def test_stats_are_merged(self):
+        """Test worker stats add up per data type."""
+        total = merge_stats({}, {"users": {"hits": 2, "misses": 1}})
+        merge_stats(total, {"users": {"hits": 1}, "todos": {"misses": 3}})
+
+        assert total == {"users": {"hits": 3, "misses": 1}, "todos": {"misses": 3}}
@@ -0,0 +1,323 @@
+"""Unit tests for the TDS client against a local stand-in server."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from tools.async_test_data_service import AsyncTestDataServiceClient, TDSPrefetcher
+from tools.test_data_service import (
+    BatchError,
+    CircuitBreaker,
+    CircuitOpenError,
+    TestDataServiceClient,
+)
+
+
+class StandInTDS:
+    """Local HTTP server replaying scripted TDS responses per path."""
+
+    def __init__(self):
+        """Initialize stand-in server."""
+        self.responses = {}
+        self.requests = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"null")
+                stand_in.requests.append((self.command, self.path, body))
+                with lock:
+                    stand_in.in_flight += 1
+                    stand_in.max_in_flight = max(stand_in.max_in_flight, stand_in.in_flight)
+                time.sleep(stand_in.delay)
+                with lock:
+                    stand_in.in_flight -= 1
+                script = stand_in.responses.get(self.path, [])
+                status, payload = script.pop(0) if len(script) > 1 else (script or [(200, {})])[0]
+                encoded = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1"
+
+    def paths(self):
+        """Get requested paths."""
+        return [path for _, path, _ in self.requests]
+
+
+@pytest.fixture
+def stand_in():
+    """Start a stand-in TDS server."""
+    server = StandInTDS()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def make_client(url, **kwargs):
+    """Create a client with fast retries."""
+    kwargs.setdefault("backoff", 0.001)
+    return TestDataServiceClient(base_url=url, api_key="key", **kwargs)
+
+
+@pytest.mark.unit
+class TestTDSClient:
+    """Tests for URL joining, retries, circuit breaking and metrics."""
+
+    def test_base_path_is_kept(self, stand_in):
+        """Test endpoints are joined under the /api/v1 base path."""
+        stand_in.responses["/api/v1/data/user"] = [(200, {"email": "a@b.c"})]
+
+        assert make_client(stand_in.url).generate_user()["email"] == "a@b.c"
+        assert stand_in.requests[0] == ("POST", "/api/v1/data/user", {"profile": "default"})
+
+    def test_idempotent_call_is_retried_on_5xx(self, stand_in):
+        """Test a GET succeeds after transient 503s."""
+        stand_in.responses["/api/v1/data/users?role=admin"] = [(503, {}), (502, {}), (200, [{"id": 1}])]
+        client = make_client(stand_in.url)
+
+        assert client.get_data("users", {"role": "admin"}) == [{"id": 1}]
+        assert client.latency_summary()["GET /data/users"]["retries"] == 2
+
+    def test_post_is_not_retried_on_5xx_but_on_429(self, stand_in):
+        """Test non-idempotent calls are only repeated when the server throttled them."""
+        stand_in.responses["/api/v1/data/address"] = [(500, {}), (200, {})]
+        with pytest.raises(requests.HTTPError):
+            make_client(stand_in.url).generate_address()
+        assert stand_in.paths().count("/api/v1/data/address") == 1
+
+        stand_in.responses["/api/v1/data/payment"] = [(429, {}), (200, {"card": "visa"})]
+        assert make_client(stand_in.url).generate_payment() == {"card": "visa"}
+
+    def test_client_errors_are_raised_without_retry(self, stand_in):
+        """Test 4xx responses fail immediately and do not trip the breaker."""
+        stand_in.responses["/api/v1/data/users/7"] = [(404, {})]
+        client = make_client(stand_in.url)
+
+        with pytest.raises(requests.HTTPError):
+            client.delete_data("users", "7")
+        assert len(stand_in.requests) == 1
+        assert client.circuit_breaker.state == "closed"
+
+    def test_circuit_opens_after_repeated_failures(self, stand_in):
+        """Test calls fail fast once the failure threshold is reached."""
+        stand_in.responses["/api/v1/data/users"] = [(503, {})]
+        client = make_client(stand_in.url, max_retries=1, circuit_breaker=CircuitBreaker(2, 60))
+
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                client.get_data("users")
+        requests_before = len(stand_in.requests)
+
+        with pytest.raises(CircuitOpenError):
+            client.get_data("users")
+        assert len(stand_in.requests) == requests_before
+
+    def test_half_open_breaker_closes_on_success(self):
+        """Test a successful trial call after the cool-down closes the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half-open" and breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_breaker_allows_one_trial(self):
+        """Test concurrent callers after the cool-down get a single trial call."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        breaker.opened_at -= 30
+
+        with ThreadPoolExecutor(8) as pool:
+            allowed = list(pool.map(lambda _: breaker.allow(), range(8)))
+        assert allowed.count(True) == 1
+
+        breaker.record_failure()
+        assert breaker.state == "open" and not breaker.allow()
+
+    def test_latency_is_logged_per_endpoint(self, stand_in):
+        """Test each call is logged with its templated endpoint."""
+        events = []
+
+        class Logger:
+            def log_tds_request(self, endpoint, data):
+                events.append((endpoint, data["status"]))
+
+        client = make_client(stand_in.url, structured_logger=Logger())
+        client.lock_data("users", "1", "lock-a")
+        client.lock_data("users", "2", "lock-a")
+
+        assert events == [("POST /data/users/{id}/lock", 200)] * 2
+        assert client.latency_summary()["POST /data/users/{id}/lock"]["calls"] == 2
+        assert client.session.get_adapter(stand_in.url)._pool_maxsize == client.pool_size
+
+
+    def test_reads_are_cached_until_a_write(self, stand_in):
+        """Test identical get_data calls hit the cache until the type is written."""
+        stand_in.responses["/api/v1/data/users?role=admin"] = [(200, [{"id": 1}])]
+        client = make_client(stand_in.url)
+
+        assert client.get_data("users", {"role": "admin"}) == [{"id": 1}]
+        assert client.get_data("users", {"role": "admin"}) == [{"id": 1}]
+        assert len(stand_in.requests) == 1
+
+        client.create_data("users", {"role": "admin"})
+        client.get_data("users", {"role": "admin"})
+
+        assert stand_in.paths().count("/api/v1/data/users?role=admin") == 2
+        assert client.cache.stats["users"] == {
+            "hits": 1, "disk_hits": 0, "misses": 2, "invalidations": 1, "evictions": 0
+        }
+
+
+@pytest.mark.unit
+class TestTDSBatch:
+    """Tests for bulk endpoints and fan-out batching."""
+
+    def test_fan_out_reports_failures_per_item(self, stand_in):
+        """Test lock_many falls back to single calls and keeps partial results."""
+        stand_in.responses["/api/v1/data/users/2/lock"] = [(409, {"error": "locked"})]
+        client = make_client(stand_in.url)
+
+        result = client.lock_many("users", ["1", "2", "3"], "lock-a")
+
+        assert not result.ok
+        assert list(result.errors) == [1]
+        assert len(result.succeeded) == 2
+        with pytest.raises(BatchError, match="1/3 items failed"):
+            result.raise_for_errors()
+
+        client.release_many("users", ["1", "3"], "lock-a")
+        assert stand_in.paths().count("/api/v1/capabilities") == 1
+        assert len(stand_in.paths()) == 6
+
+    def test_bulk_endpoint_is_used_when_advertised(self, stand_in):
+        """Test create_many sends chunks to the bulk endpoint."""
+        stand_in.responses["/api/v1/capabilities"] = [(200, {"bulk": ["create"]})]
+        stand_in.responses["/api/v1/data/users/bulk"] = [
+            (200, {"results": [{"ok": True, "data": {"id": 1}}, {"ok": False, "error": "duplicate"}]}),
+            (200, {"results": [{"ok": True, "data": {"id": 3}}]}),
+        ]
+        client = make_client(stand_in.url)
+        client.batch_size = 2
+
+        result = client.create_many("users", [{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert result.values == [{"id": 1}, None, {"id": 3}]
+        assert str(result.errors[1]) == "duplicate"
+        assert stand_in.requests[1:] == [
+            ("POST", "/api/v1/data/users/bulk", {"records": [{"n": 1}, {"n": 2}]}),
+            ("POST", "/api/v1/data/users/bulk", {"records": [{"n": 3}]}),
+        ]
+
+    def test_generate_many_fans_out_without_bulk(self, stand_in):
+        """Test generate_many makes one call per record when bulk is not advertised."""
+        stand_in.responses["/api/v1/capabilities"] = [(404, {})]
+        stand_in.responses["/api/v1/data/address"] = [(200, {"country": "UA"})]
+
+        result = make_client(stand_in.url).generate_many("address", 5, country="UA")
+
+        assert result.ok and result.succeeded == [{"country": "UA"}] * 5
+        assert stand_in.requests[-1] == ("POST", "/api/v1/data/address", {"country": "UA"})
+        with pytest.raises(ValueError):
+            make_client(stand_in.url).generate_many("company", 1)
+
+
+@pytest.mark.unit
+class TestAsyncTDSClient:
+    """Tests for concurrent TDS calls and background prefetching."""
+
+    def test_profile_parts_are_requested_concurrently(self, stand_in):
+        """Test user, address and payment are generated in parallel."""
+        stand_in.delay = 0.2
+        client = AsyncTestDataServiceClient(make_client(stand_in.url), max_in_flight=4)
+
+        started = time.perf_counter()
+        profile = client.run(client.generate_profile())
+
+        assert set(profile) == {"user", "address", "payment"}
+        assert time.perf_counter() - started < 0.5
+        assert stand_in.max_in_flight == 3
+
+    def test_in_flight_requests_are_bounded(self, stand_in):
+        """Test the semaphore caps concurrent requests."""
+        stand_in.delay = 0.05
+        client = AsyncTestDataServiceClient(make_client(stand_in.url), max_in_flight=2)
+
+        async def generate_many():
+            return await asyncio.gather(*(client.generate_user() for _ in range(6)))
+
+        assert len(client.run(generate_many())) == 6
+        assert stand_in.max_in_flight == 2
+        client.run(client.generate_user())
+        assert len(client._semaphores) == 1, "closed loops keep their semaphores"
+
+    def test_prefetched_records_are_served_from_queue(self, stand_in):
+        """Test records come from the queue and are refilled in the background."""
+        stand_in.responses["/api/v1/data/user"] = [(200, {"email": "a@b.c"})]
+        prefetcher = TDSPrefetcher(
+            AsyncTestDataServiceClient(make_client(stand_in.url)), {"user": 4}
+        ).start()
+        try:
+            deadline = time.monotonic() + 5
+            while prefetcher.queues["user"].qsize() < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(stand_in.requests) == 4
+
+            records = [prefetcher.get("user") for _ in range(3)]
+            assert records == [{"email": "a@b.c"}] * 3
+            assert prefetcher.stats["user"]["hits"] == 3
+
+            while prefetcher.queues["user"].qsize() < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert prefetcher.queues["user"].qsize() == 4
+        finally:
+            prefetcher.stop()
+
+    def test_start_waits_for_first_fill(self, stand_in):
+        """Test start can block until every queue holds its target size."""
+        stand_in.responses["/api/v1/data/user"] = [(200, {"email": "a@b.c"})]
+        stand_in.delay = 0.05
+        prefetcher = TDSPrefetcher(
+            AsyncTestDataServiceClient(make_client(stand_in.url)), {"user": 3}
+        ).start(wait=5)
+        try:
+            assert prefetcher.queues["user"].qsize() == 3
+        finally:
+            prefetcher.stop()
+
+    def test_get_falls_back_to_direct_call(self, stand_in):
+        """Test an empty queue falls back to a synchronous request."""
+        stand_in.responses["/api/v1/data/address"] = [(400, {"error": "bad"}), (200, {"city": "Kyiv"})]
+        client = make_client(stand_in.url)
+        prefetcher = TDSPrefetcher(
+            AsyncTestDataServiceClient(client), {"address": 1}, retry_delay=60
+        ).start()
+        try:
+            assert prefetcher.get("address", timeout=0.1) == {"city": "Kyiv"}
+            assert prefetcher.stats["address"]["misses"] == 1
+        finally:
+            prefetcher.stop()
@@ -0,0 +1,140 @@
+"""Unit tests for TDS record leases."""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from tools.tds_leases import LeaseError, LeaseManager, LeasePool
+from tools.test_data_service import BatchResult
+
+
+class InMemoryLocks:
+    """TDS client stand-in keeping record locks in memory."""
+
+    def __init__(self, records=10):
+        """Initialize in-memory locks."""
+        self.records = [{"id": i} for i in range(records)]
+        self.locks = {}
+        self.lock_calls = 0
+        self._lock = threading.Lock()
+
+    def _refuse(self, data_id):
+        response = requests.Response()
+        response.status_code = 409
+        return requests.HTTPError(f"{data_id} is locked", response=response)
+
+    def lock_data(self, data_type, data_id, lock_id, ttl=None):
+        with self._lock:
+            self.lock_calls += 1
+            if self.locks.get((data_type, data_id), lock_id) != lock_id:
+                raise self._refuse(data_id)
+            self.locks[(data_type, data_id)] = lock_id
+            return {"locked": True}
+
+    def lock_many(self, data_type, data_ids, lock_id, ttl=None):
+        result = BatchResult(len(data_ids))
+        for index, data_id in enumerate(data_ids):
+            try:
+                result.set(index, self.lock_data(data_type, data_id, lock_id, ttl))
+            except requests.HTTPError as e:
+                result.fail(index, e)
+        return result
+
+    def release_many(self, data_type, data_ids, lock_id):
+        result = BatchResult(len(data_ids))
+        with self._lock:
+            for data_id in data_ids:
+                if self.locks.get((data_type, data_id)) == lock_id:
+                    del self.locks[(data_type, data_id)]
+        return result
+
+    def get_data(self, data_type, filters=None):
+        return list(self.records)
+
+
+@pytest.fixture
+def locks():
+    """Get in-memory locks."""
+    return InMemoryLocks()
+
+
+@pytest.fixture
+def manager(locks):
+    """Start a lease manager with a fast heartbeat."""
+    lease_manager = LeaseManager(locks, ttl=1, heartbeat_interval=0.02, owner="gw0").start()
+    yield lease_manager
+    lease_manager.stop()
+
+
+@pytest.mark.unit
+class TestLeaseManager:
+    """Tests for leasing, renewal and release."""
+
+    def test_leases_are_renewed_and_released_on_stop(self, locks, manager):
+        """Test the heartbeat renews leases and stop releases them."""
+        manager.acquire("users", "1")
+        calls = locks.lock_calls
+        time.sleep(0.1)
+
+        assert locks.lock_calls > calls
+        assert locks.locks == {("users", "1"): manager.lock_id}
+
+        manager.stop()
+        assert locks.locks == {}
+        assert manager.leases == {}
+
+    def test_record_held_elsewhere_is_not_leased(self, locks, manager):
+        """Test acquire fails and acquire_many skips records locked by another worker."""
+        locks.locks[("users", "2")] = "gw1"
+
+        with pytest.raises(LeaseError):
+            manager.acquire("users", "2")
+        leases = manager.acquire_many("users", ["1", "2", "3"])
+
+        assert [lease.data_id for lease in leases] == ["1", "3"]
+
+    def test_refused_renewal_marks_lease_lost(self, locks, manager):
+        """Test a lease taken over by another worker is marked lost."""
+        lease = manager.acquire("users", "1")
+        locks.locks[("users", "1")] = "gw1"
+        manager.renew()
+
+        assert lease.lost
+
+
+@pytest.mark.unit
+class TestLeasePool:
+    """Tests for the per-worker pool of leased records."""
+
+    def test_pool_hands_out_and_reuses_leases(self, locks, manager):
+        """Test checkout is served from pre-leased records and checkin keeps them locked."""
+        locks.locks[("users", "0")] = "gw1"
+        pool = LeasePool(manager, "users", size=3)
+
+        assert pool.fill() == 3
+        assert sorted(data_id for _, data_id in manager.leases) == ["1", "2", "3"]
+
+        calls = locks.lock_calls
+        lease = pool.checkout()
+        assert lease.record == {"id": 1}
+        pool.checkin(lease)
+        assert pool.fill() == 0
+        assert locks.locks[("users", "1")] == manager.lock_id
+        assert locks.lock_calls - calls < 3
+
+    def test_empty_pool_leases_more(self, locks, manager):
+        """Test checkout leases more records when every pooled one is taken."""
+        pool = LeasePool(manager, "users", size=1)
+        first, second = pool.checkout(), pool.checkout()
+
+        assert first.data_id != second.data_id
+
+    def test_checkout_fails_when_nothing_is_free(self, locks, manager):
+        """Test checkout gives up when all records are locked elsewhere."""
+        for record in locks.records:
+            locks.locks[("users", str(record["id"]))] = "gw1"
+
+        with pytest.raises(LeaseError):
+            LeasePool(manager, "users").checkout(timeout=0)
@@ -0,0 +1,87 @@
+"""Memory leak tests for repeated TodoMVC workflows."""
+
+import pytest
+
+from pages.todo_page import TodoPage
+from tools.leak_detector import HeapLeakDetector, HeapLeakError
+
+
+@pytest.mark.slow
+@pytest.mark.chromium
+class TestTodoMemory:
+    """JS heap growth tests for todo workflows."""
+
+    def test_add_complete_clear_cycles_do_not_leak(self, page, base_url, heap_leak_detector):
+        """Test add/complete/clear_completed cycles do not retain heap."""
+        todo_page = TodoPage(page)
+        todo_page.navigate_to_todo_app(base_url)
+
+        def cycle():
+            todo_page.add_multiple_todos(["Leak check 1", "Leak check 2"])
+            todo_page.complete_todo("Leak check 1")
+            todo_page.complete_todo("Leak check 2")
+            todo_page.clear_completed()
+
+        result = heap_leak_detector.assert_no_leak(cycle)
+
+        assert todo_page.get_todo_count() == 0
+        assert result["iterations"] > 0
+
+
+class FakeCDPSession:
+    """CDP session stand-in reporting a scripted heap size."""
+
+    def __init__(self, heap_sizes):
+        """Initialize fake session."""
+        self.heap_sizes = iter(heap_sizes)
+        self.listeners = {}
+        self.sent = []
+
+    def send(self, method, params=None):
+        """Record the command and answer heap metrics requests."""
+        self.sent.append(method)
+        if method == "Performance.getMetrics":
+            return {"metrics": [{"name": "JSHeapUsedSize", "value": next(self.heap_sizes)}]}
+        if method == "HeapProfiler.takeHeapSnapshot":
+            for chunk in ('{"snapshot":', "{}}"):
+                self.listeners["HeapProfiler.addHeapSnapshotChunk"]({"chunk": chunk})
+        return {}
+
+    def on(self, event, handler):
+        """Register an event handler."""
+        self.listeners[event] = handler
+
+    def remove_listener(self, event, handler):
+        """Remove an event handler."""
+        self.listeners.pop(event, None)
+
+
+@pytest.mark.unit
+class TestHeapLeakDetector:
+    """Unit tests for heap growth fitting."""
+
+    def test_flat_heap_passes(self):
+        """Test a noisy but flat heap is not reported as a leak."""
+        session = FakeCDPSession([1000, 1200, 900, 1100, 1000, 1050])
+        detector = HeapLeakDetector(session, iterations=5, warmup=0, max_growth_bytes=500)
+
+        result = detector.assert_no_leak(lambda: None)
+
+        assert result["baseline_bytes"] == 1000
+        assert session.sent.count("HeapProfiler.collectGarbage") == 6
+
+    def test_growing_heap_fails(self):
+        """Test a steadily growing heap fails the threshold."""
+        session = FakeCDPSession([1000 + i * 400 for i in range(6)])
+        detector = HeapLeakDetector(session, iterations=5, warmup=0, max_growth_bytes=500)
+
+        with pytest.raises(HeapLeakError, match="400.0 bytes/iteration"):
+            detector.assert_no_leak(lambda: None)
+
+    def test_save_heap_snapshot(self, tmp_path):
+        """Test snapshot chunks are streamed to disk."""
+        detector = HeapLeakDetector(FakeCDPSession([]))
+
+        path = detector.save_heap_snapshot(tmp_path / "heap" / "test.heapsnapshot")
+
+        assert path.read_text() == '{"snapshot":{}}'
@@ -115,3 +115,15 @@ class TestTodoRegression:
         # Complete another
         todo_page.complete_todo("Task 2")
         assert todo_page.get_active_count() == 1
+
+
+@pytest.mark.regression
+@pytest.mark.data_source("todo_items.jsonl", filter={"priority": "high"}, id_field="id")
+def test_add_todo_from_dataset(page, base_url, record):
+    """Test adding todos streamed from the high-priority dataset records."""
+    todo_page = TodoPage(page)
+    todo_page.navigate_to_todo_app(base_url)
+
+    todo_page.add_todo(record["text"])
+
+    assert todo_page.is_todo_visible(record["text"])
@@ -0,0 +1,97 @@
+"""Unit tests for the offline trace analyzer."""
+
+import json
+import zipfile
+
+import pytest
+
+from tools.trace_analyzer import TraceAnalyzer, analyze_directory, summarize_run
+
+
+def write_trace(path, trace_events, network_events):
+    """Write a minimal Playwright-style trace zip."""
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("trace.trace", "\n".join(json.dumps(e) for e in trace_events))
+        archive.writestr("trace.network", "\n".join(json.dumps(e) for e in network_events))
+
+
+@pytest.fixture
+def trace_zip(tmp_path):
+    """Create a trace with a navigation, a wait, a click and two requests."""
+    trace_events = [
+        {"type": "context-options", "version": 7},
+        {"type": "before", "callId": "call@1", "startTime": 100.0, "class": "Frame",
+         "method": "goto", "title": "Navigate to \"/todomvc\""},
+        {"type": "after", "callId": "call@1", "endTime": 400.0},
+        {"type": "before", "callId": "call@2", "startTime": 410.0, "class": "Frame",
+         "method": "waitForSelector"},
+        {"type": "log", "callId": "call@2", "time": 411.0, "message": "waiting for .todo-list"},
+        {"type": "after", "callId": "call@2", "endTime": 460.0},
+        {"type": "before", "callId": "call@3", "startTime": 470.0, "class": "Frame",
+         "method": "click"},
+        {"type": "after", "callId": "call@3", "endTime": 480.0,
+         "error": {"message": "Timeout 10ms exceeded"}},
+        {"type": "console", "messageType": "error", "text": "boom",
+         "location": {"url": "app.js"}},
+        {"type": "console", "messageType": "log", "text": "ignored"},
+    ]
+    network_events = [
+        {"type": "resource-snapshot", "snapshot": {
+            "request": {"url": "https://app/index.html", "method": "GET"},
+            "response": {"status": 200, "_transferSize": 1000},
+            "_monotonicTime": 0.1, "time": 120.0, "timings": {"wait": 80.0}}},
+        {"type": "resource-snapshot", "snapshot": {
+            "request": {"url": "https://app/missing.js", "method": "GET"},
+            "response": {"status": 404, "_transferSize": 200},
+            "_monotonicTime": 0.15, "time": 30.0, "timings": {"wait": 20.0}}},
+    ]
+    path = tmp_path / "run_test_trace.zip"
+    write_trace(path, trace_events, network_events)
+    return path
+
+
+@pytest.mark.unit
+class TestTraceAnalyzer:
+    """Tests for trace summaries."""
+
+    def test_action_timings(self, trace_zip):
+        """Test per-action durations, waits and errors are extracted."""
+        summary = TraceAnalyzer().analyze(trace_zip)
+
+        assert summary["actions"] == 3
+        assert summary["total_action_ms"] == 360.0
+        assert summary["wait_ms"] == 50.0
+        assert summary["slowest_actions"][0]["action"] == "Navigate to \"/todomvc\""
+        assert summary["actions_by_method"]["waitForSelector"]["count"] == 1
+        assert summary["action_errors"] == [
+            {"action": "Frame.click", "error": "Timeout 10ms exceeded"}
+        ]
+
+    def test_console_errors(self, trace_zip):
+        """Test only console errors are kept."""
+        summary = TraceAnalyzer().analyze(trace_zip)
+
+        assert summary["console_errors"] == [{"text": "boom", "location": "app.js"}]
+
+    def test_network_waterfall(self, trace_zip):
+        """Test network totals and waterfall offsets."""
+        network = TraceAnalyzer().analyze(trace_zip)["network"]
+
+        assert network["requests"] == 2
+        assert network["failed"] == 1
+        assert network["transfer_bytes"] == 1200
+        assert [e["start_ms"] for e in network["waterfall"]] == [0.0, 50.0]
+        assert network["span_ms"] == 120.0
+
+    def test_analyze_directory(self, tmp_path, trace_zip):
+        """Test a directory is analyzed and aggregated, including broken zips."""
+        (tmp_path / "broken.zip").write_text("not a zip")
+
+        summaries = analyze_directory(tmp_path, workers=2)
+        run = summarize_run(summaries)
+
+        assert len(summaries) == 2
+        assert "error" in summaries[0]
+        assert run["traces"] == 1
+        assert run["requests"] == 2
+        assert next(iter(run["actions_by_method"])) == "goto"
@@ -0,0 +1,117 @@
+"""Unit tests for web performance metrics aggregation."""
+
+import pytest
+
+from tools.web_metrics import (
+    MetricsRecorder,
+    PerformanceBudgetError,
+    PerformanceBudgetWarning,
+    check_budgets,
+    enforce_budgets,
+    get_budgets,
+    install_performance_observer,
+    percentile,
+)
+
+
+@pytest.mark.unit
+class TestMetricsRecorder:
+    """Tests for per-test recording and per-URL aggregation."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        assert percentile([], 50) is None
+        assert percentile([30, 10, 20], 50) == 20
+        assert percentile(list(range(1, 101)), 95) == 95
+
+    def test_records_are_grouped_per_test(self):
+        """Test records are attributed to the running test."""
+        recorder = MetricsRecorder()
+        recorder.start_test("tests/test_a.py::test_one")
+        recorder.record("https://app/#/active", {"ttfb": 10})
+
+        records = recorder.finish_test()
+
+        assert records == [{
+            "url": "https://app/",
+            "env": "dev",
+            "test_id": "tests/test_a.py::test_one",
+            "metrics": {"ttfb": 10},
+        }]
+        assert recorder.finish_test() == []
+        assert len(recorder.records) == 1
+
+    def test_aggregate_per_env_and_url(self):
+        """Test aggregation per env and URL skips missing metrics."""
+        recorder = MetricsRecorder()
+        recorder.record("https://app/", {"ttfb": 10, "lcp": None})
+        recorder.record("https://app/", {"ttfb": 30, "lcp": 900})
+        recorder.environment = "staging"
+        recorder.record("https://app/", {"ttfb": 50})
+
+        summary = recorder.aggregate()
+
+        assert summary["dev"]["https://app/"]["navigations"] == 2
+        assert summary["dev"]["https://app/"]["ttfb"] == {"p50": 10, "p95": 30, "max": 30}
+        assert summary["dev"]["https://app/"]["lcp"]["max"] == 900
+        assert summary["staging"]["https://app/"]["ttfb"]["p50"] == 50
+
+    def test_observer_installed_once_per_page(self):
+        """Test the observer script is added once per page, without touching the page object."""
+        class StubPage:
+            def __init__(self):
+                self.scripts = []
+
+            def add_init_script(self, script):
+                self.scripts.append(script)
+
+        page, other = StubPage(), StubPage()
+        install_performance_observer(page)
+        install_performance_observer(page)
+        install_performance_observer(other)
+
+        assert len(page.scripts) == 1 and len(other.scripts) == 1
+        assert vars(page) == {"scripts": page.scripts}
+
+
+@pytest.mark.unit
+class TestPerformanceBudgets:
+    """Tests for declarative performance budgets."""
+
+    budgets = [
+        {"url": "*", "severity": "warn", "ttfb": 800, "lcp": 2500},
+        {"url": "*/todomvc*", "severity": "error", "request_count": 10},
+        {"url": "*/other*", "severity": "error", "ttfb": 1},
+    ]
+
+    def test_check_budgets_matches_url_patterns(self):
+        """Test only budgets matching the URL are evaluated."""
+        breaches = check_budgets(
+            "https://demo.playwright.dev/todomvc",
+            {"ttfb": 900, "lcp": None, "request_count": 12},
+            self.budgets,
+        )
+
+        assert [(b["metric"], b["severity"]) for b in breaches] == [
+            ("ttfb", "warn"),
+            ("request_count", "error"),
+        ]
+
+    def test_unknown_severity(self):
+        """Test an unknown severity is rejected."""
+        with pytest.raises(ValueError):
+            check_budgets("https://app/", {"ttfb": 1}, [{"severity": "fatal", "ttfb": 0}])
+
+    def test_enforce_budgets(self):
+        """Test warn breaches warn and error breaches fail."""
+        warn = check_budgets("https://app/", {"ttfb": 900}, self.budgets)
+        error = check_budgets("https://app/other", {"ttfb": 900}, self.budgets)
+
+        with pytest.warns(PerformanceBudgetWarning):
+            enforce_budgets("https://app/", "dev", warn)
+        with pytest.raises(PerformanceBudgetError, match="ttfb=900 exceeds budget 1"):
+            enforce_budgets("https://app/other", "dev", error)
+
+    def test_configured_budgets(self):
+        """Test default budgets are merged with environment budgets."""
+        assert len(get_budgets("dev")) > len(get_budgets("staging"))
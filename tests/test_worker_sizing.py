@@ -0,0 +1,153 @@
+"""Unit tests for resource-aware worker sizing."""
+
+import os
+
+import pytest
+
+from tools.worker_sizing import MB, HostResources, MemoryThrottle, auto_worker_count
+
+
+def _write(root, path, text):
+    """Write a fake system file under root."""
+    target = root / path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text)
+
+
+class StubResources:
+    """Resources with fixed CPUs, memory and /dev/shm."""
+
+    def __init__(self, cpus=8, available_mb=8192, shm_mb=None, used=(0.5,)):
+        self.cpus = cpus
+        self.available_mb = available_mb
+        self.shm_mb = shm_mb
+        self.used = list(used)
+
+    def cpu_count(self):
+        return self.cpus
+
+    def memory(self):
+        return self.available_mb * MB, 16384 * MB
+
+    def shm(self):
+        return (self.shm_mb * MB, self.shm_mb * MB) if self.shm_mb is not None else None
+
+    def memory_used_fraction(self):
+        return self.used.pop(0) if len(self.used) > 1 else self.used[0]
+
+    def shm_used_fraction(self):
+        return 0.0
+
+
+@pytest.mark.unit
+class TestHostResources:
+    """Tests for reading limits from cgroups and /proc."""
+
+    def test_cgroup_v2_limits_cap_host_resources(self, tmp_path):
+        """Test the CPU quota and memory limit of a container win over the host's."""
+        _write(tmp_path, "proc/meminfo", "MemTotal: 16777216 kB\nMemAvailable: 12582912 kB\n")
+        _write(tmp_path, "sys/fs/cgroup/cpu.max", "150000 100000")
+        _write(tmp_path, "sys/fs/cgroup/memory.max", str(4096 * MB))
+        _write(tmp_path, "sys/fs/cgroup/memory.current", str(1024 * MB))
+
+        resources = HostResources(tmp_path)
+        assert resources.cpu_count() == 1
+        assert resources.memory() == (3072 * MB, 4096 * MB)
+        assert resources.memory_used_fraction() == pytest.approx(0.25)
+
+    def test_cgroup_v1_and_unlimited_memory(self, tmp_path):
+        """Test v1 quotas are read and an unlimited cgroup falls back to /proc/meminfo."""
+        _write(tmp_path, "proc/meminfo", "MemTotal: 8388608 kB\nMemAvailable: 2097152 kB\n")
+        _write(tmp_path, "sys/fs/cgroup/cpu/cpu.cfs_quota_us", "-1")
+        _write(tmp_path, "sys/fs/cgroup/cpu/cpu.cfs_period_us", "100000")
+        _write(tmp_path, "sys/fs/cgroup/memory/memory.limit_in_bytes", str(1 << 63))
+        _write(tmp_path, "sys/fs/cgroup/memory/memory.usage_in_bytes", "0")
+
+        resources = HostResources(tmp_path)
+        assert resources.cpu_count() == len(os.sched_getaffinity(0))
+        assert resources.memory() == (2048 * MB, 8192 * MB)
+
+    def test_process_tree_rss_sums_descendants(self, tmp_path):
+        """Test a worker's footprint includes its driver and browser processes."""
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        for pid, ppid, pages in [(10, 1, 100), (11, 10, 200), (12, 11, 300), (13, 1, 999)]:
+            _write(tmp_path, f"proc/{pid}/stat", f"{pid} (proc (x) y) S {ppid} 0 0")
+            _write(tmp_path, f"proc/{pid}/statm", f"5000 {pages} 0")
+
+        assert HostResources(tmp_path).process_tree_rss(10) == 600 * page_size
+
+    def test_footprint_splits_base_and_browsers(self, tmp_path):
+        """Test each engine's browser tree is measured apart from the worker and driver."""
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        processes = [
+            (10, 1, 100, "python"),
+            (11, 10, 50, "/ms-playwright-driver/node"),
+            (12, 11, 300, "/ms-playwright/chromium-1200/chrome-linux/chrome"),
+            (13, 12, 400, "/ms-playwright/chromium-1200/chrome-linux/chrome"),
+            (14, 11, 700, "/ms-playwright/firefox-1500/firefox/firefox"),
+        ]
+        for pid, ppid, pages, executable in processes:
+            _write(tmp_path, f"proc/{pid}/stat", f"{pid} (x) S {ppid} 0 0")
+            _write(tmp_path, f"proc/{pid}/statm", f"5000 {pages} 0")
+            _write(tmp_path, f"proc/{pid}/cmdline", f"{executable}\0--flag\0")
+
+        base, browsers = HostResources(tmp_path).footprint(10, ["chromium", "firefox", "webkit"])
+        assert base == 150 * page_size
+        assert browsers == {"chromium": 700 * page_size, "firefox": 700 * page_size, "webkit": 0}
+
+
+@pytest.mark.unit
+class TestAutoWorkerCount:
+    """Tests for sizing workers to the tightest resource."""
+
+    def test_memory_bounds_workers(self):
+        """Test workers are limited by memory left after the reserve."""
+        count, limits = auto_worker_count(
+            StubResources(cpus=8, available_mb=4096), ["chromium"], {"chromium": 1000}, {}
+        )
+        assert count == 3
+        assert limits == {"cpu": 8, "memory": 3}
+
+    def test_shm_and_engines_bound_workers(self):
+        """Test a small /dev/shm and several engines per worker lower the count."""
+        count, limits = auto_worker_count(
+            StubResources(cpus=16, available_mb=65536, shm_mb=64),
+            ["chromium", "firefox"],
+            {"chromium": 700, "firefox": 900},
+            {"chromium": 0, "firefox": 30},
+        )
+        assert count == 2
+        assert limits["memory"] == 40
+
+    def test_base_counted_once_per_worker(self):
+        """Test the worker base is added once, not per engine."""
+        count, limits = auto_worker_count(
+            StubResources(cpus=16, available_mb=9216),
+            ["chromium", "firefox"],
+            {"chromium": 500, "firefox": 700},
+            {},
+            base_mb=400,
+        )
+        assert limits["memory"] == 5
+
+    def test_at_least_one_worker(self):
+        """Test a starved host still gets one worker, capped by max_workers otherwise."""
+        assert auto_worker_count(StubResources(available_mb=512), ["webkit"], {"webkit": 600}, {})[0] == 1
+        assert auto_worker_count(StubResources(), ["webkit"], {}, {}, max_workers=2)[0] == 2
+
+
+@pytest.mark.unit
+class TestMemoryThrottle:
+    """Tests for holding back tests under memory pressure."""
+
+    def test_waits_until_pressure_drops(self):
+        """Test a test start waits while memory use is above the limit."""
+        throttle = MemoryThrottle(StubResources(used=(0.95, 0.95, 0.5)), max_used=0.9, poll_interval=0.01)
+        assert throttle.wait() > 0
+        assert throttle.wait() == 0.0
+        assert throttle.stats["throttled"] == 1
+
+    def test_gives_up_after_max_wait(self):
+        """Test a test starts anyway when pressure persists."""
+        throttle = MemoryThrottle(StubResources(used=(0.99,)), poll_interval=0.01, max_wait=0.03)
+        assert 0.03 <= throttle.wait() < 1
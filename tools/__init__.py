@@ -1,28 +1,51 @@
-"""Tools and utilities for the framework."""
-
-from tools.test_data_service import TestDataServiceClient, DataGenerator
-from tools.helpers import (
-    ensure_dir,
-    read_json,
-    write_json,
-    get_timestamp,
-    mask_sensitive_data,
-    sanitize_filename,
-    get_env_var,
-    parse_bool,
-    Timer,
-)
-
-__all__ = [
-    "TestDataServiceClient",
-    "DataGenerator",
-    "ensure_dir",
-    "read_json",
-    "write_json",
-    "get_timestamp",
-    "mask_sensitive_data",
-    "sanitize_filename",
-    "get_env_var",
-    "parse_bool",
-    "Timer",
-]
+"""Tools and utilities for the framework.
+
+Exports are resolved on first access so importing a single tool module does not
+pull in the TDS client (requests) or the trace analyzer.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "TestDataServiceClient": "tools.test_data_service",
+    "DataGenerator": "tools.data_generator",
+    "GeneratedPool": "tools.data_generator",
+    "UniqueIdentities": "tools.data_uniqueness",
+    "AsyncTestDataServiceClient": "tools.async_test_data_service",
+    "TDSPrefetcher": "tools.async_test_data_service",
+    "TDSCache": "tools.tds_cache",
+    "FakeTDS": "tools.fake_tds",
+    "LeaseManager": "tools.tds_leases",
+    "LeasePool": "tools.tds_leases",
+    "DataRegistry": "tools.data_registry",
+    "DataStore": "tools.data_store",
+    "TraceAnalyzer": "tools.trace_analyzer",
+    "analyze_trace": "tools.trace_analyzer",
+    "analyze_directory": "tools.trace_analyzer",
+    "ensure_dir": "tools.helpers",
+    "read_json": "tools.helpers",
+    "write_json": "tools.helpers",
+    "get_timestamp": "tools.helpers",
+    "mask_sensitive_data": "tools.helpers",
+    "sanitize_filename": "tools.helpers",
+    "get_env_var": "tools.helpers",
+    "parse_bool": "tools.helpers",
+    "Timer": "tools.helpers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List exported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,248 @@
+"""Asyncio Test Data Service client and background record prefetching."""
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from configs import get_config_loader
+from tools.test_data_service import BatchResult, TestDataServiceClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTestDataServiceClient:
+    """Run TDS calls concurrently with a bounded number in flight.
+
+    Requests go through the pooled, retrying TestDataServiceClient on worker
+    threads (``asyncio.to_thread``), so retries, the circuit breaker and
+    latency metrics are shared with the synchronous client.
+    """
+
+    __test__ = False
+
+    def __init__(
+        self,
+        client: Optional[TestDataServiceClient] = None,
+        max_in_flight: Optional[int] = None
+    ):
+        """Initialize async TDS client."""
+        self.client = client or TestDataServiceClient()
+        async_config = get_config_loader().get("test_data_service.async", {})
+        # More requests in flight than pooled connections would only queue on the pool
+        self.max_in_flight = min(
+            max_in_flight or async_config.get("max_in_flight", 8), self.client.pool_size
+        )
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the in-flight limit of the running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            # Each run() closes its loop; a semaphore references its loop, so a weak key would not expire
+            for closed in [other for other in self._semaphores if other.is_closed()]:
+                del self._semaphores[closed]
+            self._semaphores[loop] = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphores[loop]
+
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client method on a thread within the in-flight limit."""
+        async with self._semaphore():
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def generate_user(self, profile: str = "default") -> Dict[str, Any]:
+        """Generate synthetic user data."""
+        return await self._call(self.client.generate_user, profile)
+
+    async def generate_address(self, country: str = "US") -> Dict[str, Any]:
+        """Generate synthetic address data."""
+        return await self._call(self.client.generate_address, country)
+
+    async def generate_payment(self, card_type: str = "visa") -> Dict[str, Any]:
+        """Generate synthetic payment data."""
+        return await self._call(self.client.generate_payment, card_type)
+
+    async def lock_data(
+        self, data_type: str, data_id: str, lock_id: str, ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Lock a data record for exclusive use."""
+        return await self._call(self.client.lock_data, data_type, data_id, lock_id, ttl)
+
+    async def release_data(self, data_type: str, data_id: str, lock_id: str) -> Dict[str, Any]:
+        """Release a locked data record."""
+        return await self._call(self.client.release_data, data_type, data_id, lock_id)
+
+    async def get_data(self, data_type: str, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """Get data records with optional filters."""
+        return await self._call(self.client.get_data, data_type, filters)
+
+    async def create_data(self, data_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create new data record."""
+        return await self._call(self.client.create_data, data_type, data)
+
+    async def update_data(self, data_type: str, data_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update existing data record."""
+        return await self._call(self.client.update_data, data_type, data_id, data)
+
+    async def delete_data(self, data_type: str, data_id: str) -> Dict[str, Any]:
+        """Delete data record."""
+        return await self._call(self.client.delete_data, data_type, data_id)
+
+    async def create_many(self, data_type: str, records: List[Dict[str, Any]]) -> BatchResult:
+        """Create many data records."""
+        return await self._call(self.client.create_many, data_type, records)
+
+    async def lock_many(
+        self, data_type: str, data_ids: List[str], lock_id: str, ttl: Optional[float] = None
+    ) -> BatchResult:
+        """Lock many data records for exclusive use."""
+        return await self._call(self.client.lock_many, data_type, data_ids, lock_id, ttl)
+
+    async def release_many(self, data_type: str, data_ids: List[str], lock_id: str) -> BatchResult:
+        """Release many locked data records."""
+        return await self._call(self.client.release_many, data_type, data_ids, lock_id)
+
+    async def generate_many(self, kind: str, n: int, **params: Any) -> BatchResult:
+        """Generate n synthetic records of a kind."""
+        return await self._call(self.client.generate_many, kind, n, **params)
+
+    async def generate_profile(
+        self,
+        profile: str = "default",
+        country: str = "US",
+        card_type: str = "visa"
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate a user, an address and a payment concurrently."""
+        user, address, payment = await asyncio.gather(
+            self.generate_user(profile),
+            self.generate_address(country),
+            self.generate_payment(card_type),
+        )
+        return {"user": user, "address": address, "payment": payment}
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        """Run a coroutine to completion from synchronous test code."""
+        return asyncio.run(coroutine)
+
+
+class TDSPrefetcher:
+    """Keep per-kind queues of generated records filled in the background.
+
+    An event loop on a daemon thread tops each queue up to its target size
+    whenever it drops below the refill threshold, so tests take ready records
+    without waiting on TDS latency. ``get`` falls back to a direct call when
+    a queue stays empty.
+    """
+
+    GENERATORS = {
+        "user": "generate_user",
+        "address": "generate_address",
+        "payment": "generate_payment",
+    }
+
+    def __init__(
+        self,
+        client: AsyncTestDataServiceClient,
+        sizes: Dict[str, int],
+        refill_below: float = 0.5,
+        retry_delay: float = 1.0
+    ):
+        """Initialize TDS prefetcher."""
+        unknown = set(sizes) - set(self.GENERATORS)
+        if unknown:
+            raise ValueError(f"Cannot prefetch {', '.join(sorted(unknown))}")
+        self.client = client
+        self.sizes = {kind: size for kind, size in sizes.items() if size > 0}
+        self.refill_below = refill_below
+        self.retry_delay = retry_delay
+        self.queues: Dict[str, queue.Queue] = {kind: queue.Queue() for kind in self.sizes}
+        self.stats = {kind: {"prefetched": 0, "hits": 0, "misses": 0} for kind in self.sizes}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Future] = None
+        self._filled = threading.Event()
+
+    async def _fill(self, kind: str) -> None:
+        """Top up one queue to its size whenever it falls below the refill threshold."""
+        generate = getattr(self.client, self.GENERATORS[kind])
+        target = self.sizes[kind]
+        refilling = False
+        while True:
+            size = self.queues[kind].qsize()
+            refilling = size < target and (refilling or size <= target * self.refill_below)
+            if not refilling:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            results = await asyncio.gather(
+                *(generate() for _ in range(target - size)), return_exceptions=True
+            )
+            failures = [r for r in results if isinstance(r, Exception)]
+            for record in results:
+                if not isinstance(record, Exception):
+                    self.queues[kind].put(record)
+                    self.stats[kind]["prefetched"] += 1
+            if all(self.queues[k].qsize() >= self.sizes[k] for k in self.sizes):
+                self._filled.set()
+            if failures:
+                logger.warning("Prefetching %s failed %d times: %s", kind, len(failures), failures[0])
+                await asyncio.sleep(self.retry_delay)
+
+    async def _main(self, started: threading.Event) -> None:
+        """Run fill loops for all kinds until cancelled."""
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.gather(*(self._fill(kind) for kind in self.sizes))
+        started.set()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def start(self, wait: Optional[float] = None) -> "TDSPrefetcher":
+        """Start prefetching on a background thread, waiting up to wait seconds for the first fill."""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(self._main(started),), daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        if wait and self.sizes and not self._filled.wait(wait):
+            logger.warning("TDS prefetch queues not filled after %.0fs, tests may wait on TDS", wait)
+        return self
+
+    def _notify(self) -> None:
+        """Wake the fill loops to check queue sizes."""
+        if self._loop and self._wakeup and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def get(self, kind: str, timeout: float = 5.0) -> Dict[str, Any]:
+        """Take a prefetched record, falling back to a direct call."""
+        if kind not in self.queues:
+            raise KeyError(f"{kind} is not prefetched")
+        try:
+            record = self.queues[kind].get_nowait()
+            self.stats[kind]["hits"] += 1
+        except queue.Empty:
+            self._notify()
+            try:
+                record = self.queues[kind].get(timeout=timeout)
+                self.stats[kind]["hits"] += 1
+            except queue.Empty:
+                self.stats[kind]["misses"] += 1
+                record = getattr(self.client.client, self.GENERATORS[kind])()
+        self._notify()
+        return record
+
+    def stop(self) -> None:
+        """Stop background refills."""
+        if self._loop and self._task and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._thread:
+            self._thread.join(timeout=10)
+        if self._loop and not self._loop.is_running():
+            self._loop.close()
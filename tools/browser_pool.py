@@ -0,0 +1,44 @@
+"""Launched browsers of a test worker, kept per engine for the whole session.
+
+pytest re-creates session fixtures that depend on ``browser_name`` whenever a
+worker moves on to a test of another engine. Browsers live in the pool
+instead, so a worker running tests of several engines launches each engine
+once rather than at every switch.
+"""
+
+import logging
+from typing import Callable, Dict, List
+
+from playwright.sync_api import Browser
+
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """One launched browser per engine, closed when the session ends."""
+
+    def __init__(self):
+        """Initialize browser pool."""
+        self._browsers: Dict[str, Browser] = {}
+
+    def get(self, engine: str, launch: Callable[[], Browser]) -> Browser:
+        """Get the engine's browser, launching it on first use or after it crashed."""
+        browser = self._browsers.get(engine)
+        if browser is None or not browser.is_connected():
+            browser = self._browsers[engine] = launch()
+        return browser
+
+    @property
+    def engines(self) -> List[str]:
+        """Get the engines with a launched browser."""
+        return list(self._browsers)
+
+    def close(self) -> None:
+        """Close every browser."""
+        for engine, browser in self._browsers.items():
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning("Cannot close %s browser: %s", engine, e)
+        self._browsers.clear()
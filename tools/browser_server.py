@@ -0,0 +1,392 @@
+"""Long-lived browser servers that test workers attach to instead of launching.
+
+A supervisor process per engine keeps ``playwright launch-server`` processes
+alive on fixed ports, restarts them after crashes and records their websocket
+endpoints in a state file. Workers connect with ``browser_type.connect`` and
+hold a file-lock slot per open context, which caps contexts per server across
+all workers and runs.
+
+Usage:
+    python -m tools.browser_server start --engine chromium --servers 2 --max-contexts 8
+    python -m tools.browser_server status
+    python -m tools.browser_server stop --engine chromium
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: contexts per server are not capped
+    fcntl = None
+
+
+ENGINES = ["chromium", "firefox", "webkit"]
+
+STATE_DIR = Path(
+    os.environ.get("BROWSER_SERVER_DIR", Path(tempfile.gettempdir()) / "py-playwright-browser-servers")
+)
+
+
+def state_path(engine: str) -> Path:
+    """Get the state file of an engine's supervisor."""
+    return STATE_DIR / f"{engine}.json"
+
+
+def is_port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.5) -> bool:
+    """Check if a TCP port accepts connections."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def is_process_alive(pid: int) -> bool:
+    """Check if a process exists."""
+    try:
+        os.kill(pid, 0)
+        return True
+    except (OSError, TypeError):
+        return False
+
+
+def free_port() -> int:
+    """Get a free TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BrowserServerProcess:
+    """A ``playwright launch-server`` process on a fixed port."""
+
+    def __init__(self, engine: str, port: int, launch_options: Dict[str, Any]):
+        """Initialize browser server process."""
+        self.engine = engine
+        self.port = port
+        self.launch_options = launch_options
+        self.process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self._config_path = STATE_DIR / f"{engine}-{port}.config.json"
+
+    @property
+    def ws_endpoint(self) -> str:
+        """Get websocket endpoint for browser_type.connect."""
+        return f"ws://127.0.0.1:{self.port}/{self.engine}"
+
+    def start(self) -> None:
+        """Launch the server process."""
+        config = {**self.launch_options, "port": self.port, "wsPath": f"/{self.engine}"}
+        self._config_path.write_text(json.dumps(config))
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "playwright", "launch-server",
+             "--browser", self.engine, "--config", str(self._config_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def is_healthy(self) -> bool:
+        """Check the process is running and accepting connections."""
+        return (
+            self.process is not None
+            and self.process.poll() is None
+            and is_port_open(self.port)
+        )
+
+    def wait_until_healthy(self, timeout: float = 30.0) -> bool:
+        """Wait for the server to accept connections."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.is_healthy():
+                return True
+            if self.process and self.process.poll() is not None:
+                return False
+            time.sleep(0.1)
+        return False
+
+    def restart(self) -> None:
+        """Restart a crashed or hung server on the same port."""
+        self.stop()
+        self.restarts += 1
+        self.start()
+
+    def stop(self) -> None:
+        """Terminate the server process."""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+class BrowserServerSupervisor:
+    """Keep browser servers for one engine alive and publish their endpoints."""
+
+    def __init__(
+        self,
+        engine: str,
+        servers: int = 1,
+        max_contexts: int = 8,
+        launch_options: Optional[Dict[str, Any]] = None,
+        check_interval: float = 2.0
+    ):
+        """Initialize browser server supervisor."""
+        self.engine = engine
+        self.max_contexts = max_contexts
+        self.check_interval = check_interval
+        self.servers = [
+            BrowserServerProcess(engine, free_port(), launch_options or {"headless": True})
+            for _ in range(servers)
+        ]
+        self._running = False
+
+    def write_state(self) -> None:
+        """Publish endpoints and health to the state file."""
+        state = {
+            "engine": self.engine,
+            "supervisor_pid": os.getpid(),
+            "max_contexts": self.max_contexts,
+            "updated": time.time(),
+            "servers": [
+                {
+                    "ws_endpoint": server.ws_endpoint,
+                    "port": server.port,
+                    "pid": server.process.pid if server.process else None,
+                    "healthy": server.is_healthy(),
+                    "restarts": server.restarts,
+                }
+                for server in self.servers
+            ],
+        }
+        tmp_path = state_path(self.engine).with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2))
+        tmp_path.replace(state_path(self.engine))
+
+    def run(self) -> None:
+        """Start servers and restart them whenever a health check fails."""
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        signal.signal(signal.SIGTERM, lambda *args: self.stop())
+        signal.signal(signal.SIGINT, lambda *args: self.stop())
+
+        for server in self.servers:
+            server.start()
+        for server in self.servers:
+            server.wait_until_healthy()
+
+        self._running = True
+        try:
+            while self._running:
+                for server in self.servers:
+                    if not server.is_healthy():
+                        server.restart()
+                        server.wait_until_healthy()
+                self.write_state()
+                time.sleep(self.check_interval)
+        finally:
+            for server in self.servers:
+                server.stop()
+            state_path(self.engine).unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Ask the supervision loop to exit."""
+        self._running = False
+
+
+def read_state(engine: str) -> Optional[Dict[str, Any]]:
+    """Read the supervisor state of an engine if its supervisor is alive."""
+    path = state_path(engine)
+    if not path.exists():
+        return None
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not is_process_alive(state.get("supervisor_pid")):
+        return None
+    return state
+
+
+def healthy_servers(engine: str) -> List[Dict[str, Any]]:
+    """Get servers of an engine that currently accept connections."""
+    state = read_state(engine)
+    if not state:
+        return []
+    return [
+        {**server, "max_contexts": state["max_contexts"]}
+        for server in state["servers"]
+        if is_port_open(server["port"])
+    ]
+
+
+class BrowserServerClient:
+    """Attach a worker to a browser server and cap contexts per server."""
+
+    def __init__(self, browser_type, worker_index: int = 0, slot_timeout: float = 60.0):
+        """Initialize browser server client."""
+        self.browser_type = browser_type
+        self.worker_index = worker_index
+        self.slot_timeout = slot_timeout
+        self.server: Optional[Dict[str, Any]] = None
+        self._browser = None
+
+    def available(self) -> bool:
+        """Check if a healthy server exists for the engine."""
+        return bool(healthy_servers(self.browser_type.name))
+
+    def browser(self):
+        """Get a connected browser, reconnecting after a server restart."""
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        servers = healthy_servers(self.browser_type.name)
+        if not servers:
+            raise RuntimeError(
+                f"No running {self.browser_type.name} browser server. "
+                f"Start one with: python -m tools.browser_server start --engine "
+                f"{self.browser_type.name}"
+            )
+        # Spread workers over servers; wait for a restarted server to come back
+        self.server = servers[self.worker_index % len(servers)]
+        deadline = time.monotonic() + self.slot_timeout
+        while True:
+            try:
+                self._browser = self.browser_type.connect(self.server["ws_endpoint"])
+                return self._browser
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.5)
+
+    @contextmanager
+    def context_slot(self) -> Iterator[None]:
+        """Hold one of the server's context slots while a context is open."""
+        if fcntl is None or self.server is None:
+            yield
+            return
+
+        lock_paths = [
+            STATE_DIR / f"{self.browser_type.name}-{self.server['port']}.slot{i}.lock"
+            for i in range(self.server["max_contexts"])
+        ]
+        deadline = time.monotonic() + self.slot_timeout
+        while True:
+            for path in lock_paths:
+                handle = open(path, "a")
+                try:
+                    fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    handle.close()
+                    continue
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+                    handle.close()
+                return
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"All {len(lock_paths)} context slots of {self.server['ws_endpoint']} "
+                    f"stayed busy for {self.slot_timeout}s"
+                )
+            time.sleep(0.05)
+
+    def close(self) -> None:
+        """Disconnect from the server; the server keeps running."""
+        if self._browser is not None and self._browser.is_connected():
+            self._browser.close()
+        self._browser = None
+
+
+def start_daemon(engine: str, servers: int, max_contexts: int, headless: bool) -> Dict[str, Any]:
+    """Start a detached supervisor and wait until its servers are healthy."""
+    if read_state(engine):
+        raise RuntimeError(f"A {engine} browser server is already running")
+
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = STATE_DIR / f"{engine}.log"
+    # The supervisor inherits the log descriptor; the parent's copy is closed right away
+    with open(log_path, "a") as log:
+        subprocess.Popen(
+            [sys.executable, "-m", "tools.browser_server", "supervise", "--engine", engine,
+             "--servers", str(servers), "--max-contexts", str(max_contexts),
+             *([] if headless else ["--headed"])],
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        state = read_state(engine)
+        if state and all(server["healthy"] for server in state["servers"]):
+            return state
+        time.sleep(0.2)
+    raise RuntimeError(f"{engine} browser server did not become healthy, see {log_path}")
+
+
+def stop_daemon(engine: str) -> bool:
+    """Stop an engine's supervisor and its servers."""
+    state = read_state(engine)
+    if not state:
+        return False
+    os.kill(state["supervisor_pid"], signal.SIGTERM)
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and state_path(engine).exists():
+        time.sleep(0.1)
+    return True
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Persistent Playwright browser servers")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("start", "supervise"):
+        sub = subparsers.add_parser(command)
+        sub.add_argument("--engine", choices=ENGINES, default="chromium")
+        sub.add_argument("--servers", type=int, default=1, help="Server processes per engine")
+        sub.add_argument("--max-contexts", type=int, default=8, help="Open contexts per server")
+        sub.add_argument("--headed", action="store_true", help="Launch headed browsers")
+    stop = subparsers.add_parser("stop")
+    stop.add_argument("--engine", choices=ENGINES, default=None, help="Default: all engines")
+    subparsers.add_parser("status")
+    args = parser.parse_args(argv)
+
+    if args.command == "supervise":
+        BrowserServerSupervisor(
+            args.engine, args.servers, args.max_contexts, {"headless": not args.headed}
+        ).run()
+    elif args.command == "start":
+        state = start_daemon(args.engine, args.servers, args.max_contexts, not args.headed)
+        for server in state["servers"]:
+            print(f"{args.engine}: {server['ws_endpoint']}")
+    elif args.command == "stop":
+        for engine in [args.engine] if args.engine else ENGINES:
+            if stop_daemon(engine):
+                print(f"{engine}: stopped")
+    elif args.command == "status":
+        for engine in ENGINES:
+            state = read_state(engine)
+            if not state:
+                print(f"{engine}: not running")
+                continue
+            for server in state["servers"]:
+                health = "healthy" if server["healthy"] else "unhealthy"
+                print(f"{engine}: {server['ws_endpoint']} {health} restarts={server['restarts']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Synthetic test data generation with Faker.
+
+All generators share one Faker instance per process, because building one
+loads every locale provider. Each generator draws from its own random
+source, swapped into the shared instance under a lock, so a generator seeded
+from a test's node id produces the same data on every run. Batch methods
+sample from the provider tables in one pass instead of repeating weighted
+picks per record.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import string
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from tools.data_uniqueness import UniqueIdentities
+
+
+_faker: Any = None
+_faker_lock = threading.RLock()
+
+
+def shared_faker() -> Any:
+    """Get the process-wide Faker instance, created on first use."""
+    global _faker
+    with _faker_lock:
+        if _faker is None:
+            from faker import Faker
+            _faker = Faker()
+        return _faker
+
+
+def seed_for(nodeid: str, base_seed: int = 0) -> int:
+    """Derive a stable seed for a test from its node id."""
+    digest = hashlib.sha256(f"{base_seed}:{nodeid}".encode()).hexdigest()
+    return int(digest[:16], 16)
+
+
+# Placeholders of Faker number formats and the digits they stand for; "" drops the placeholder
+_NUMBER_PLACEHOLDERS = {
+    "#": "0123456789",
+    "%": "123456789",
+    "$": "23456789",
+    "!": ["", *"0123456789"],
+    "@": ["", *"123456789"],
+}
+_PASSWORD_CLASSES = ("!@#$%^&*()_+", string.digits, string.ascii_uppercase, string.ascii_lowercase)
+_PASSWORD_CHARS = "".join(_PASSWORD_CLASSES)
+
+
+def _provider(fake: Any, name: str) -> Any:
+    """Get a provider of a Faker instance by name, e.g. "person", to read its data tables."""
+    for provider in fake.get_providers():
+        if provider.__provider__ == f"faker.providers.{name}":
+            return provider
+    raise LookupError(f"Faker has no '{name}' provider")
+
+
+class DataGenerator:
+    """Helper class for generating synthetic test data using Faker."""
+
+    def __init__(self, seed: Optional[int] = None, unique: Optional[UniqueIdentities] = None):
+        """Initialize data generator.
+
+        With ``unique``, usernames and emails end in a token from the worker's
+        partition instead of a random number, so they never collide.
+        """
+        self.fake = shared_faker()
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.unique = unique
+
+    @contextmanager
+    def _faker(self) -> Iterator[Any]:
+        """Use the shared Faker instance with this generator's random source."""
+        with _faker_lock:
+            previous = self.fake.random
+            self.fake.random = self.random
+            try:
+                yield self.fake
+            finally:
+                self.fake.random = previous
+
+    def generate_users(self, n: int) -> List[Dict[str, Any]]:
+        """Generate n users, sampling names and domains in bulk."""
+        with self._faker() as fake:
+            person = _provider(fake, "person")
+            first_names = fake.random_elements(person.first_names, length=n, use_weighting=True)
+            last_names = fake.random_elements(person.last_names, length=n, use_weighting=True)
+            domains = fake.random_elements(_provider(fake, "internet").free_email_domains, length=n)
+            phone_formats = fake.random_elements(_provider(fake, "phone_number").formats, length=n)
+
+        users = []
+        samples = zip(first_names, last_names, domains, phone_formats, strict=True)
+        for first_name, last_name, domain, phone_format in samples:
+            name = re.sub(r"[^a-z0-9.]", "", f"{first_name}.{last_name}".lower())
+            if self.unique is not None:
+                username, email = self.unique.identity(name, domain)
+            else:
+                username = f"{name}{self.random.randint(1, 999)}"
+                email = f"{username}@{domain}"
+            users.append({
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "phone": self._numerify(phone_format),
+                "username": username,
+                "password": self._password(12),
+            })
+        return users
+
+    def _numerify(self, number_format: str) -> str:
+        """Fill the digit placeholders of a Faker number format."""
+        return "".join(
+            self.random.choice(_NUMBER_PLACEHOLDERS[c]) if c in _NUMBER_PLACEHOLDERS else c
+            for c in number_format
+        )
+
+    def _password(self, length: int) -> str:
+        """Build a password with a special character, digit, upper and lower case letter."""
+        chars = [self.random.choice(chars) for chars in _PASSWORD_CLASSES]
+        chars += self.random.choices(_PASSWORD_CHARS, k=length - len(chars))
+        self.random.shuffle(chars)
+        return "".join(chars)
+
+    def generate_addresses(self, n: int) -> List[Dict[str, Any]]:
+        """Generate n addresses."""
+        with self._faker() as fake:
+            return [
+                {
+                    "street": fake.street_address(),
+                    "city": fake.city(),
+                    "state": fake.state(),
+                    "postal_code": fake.postcode(),
+                    "country": fake.country_code(),
+                }
+                for _ in range(n)
+            ]
+
+    def generate_companies(self, n: int) -> List[Dict[str, Any]]:
+        """Generate n companies."""
+        with self._faker() as fake:
+            return [
+                {
+                    "name": fake.company(),
+                    "email": fake.company_email(),
+                    "phone": fake.phone_number(),
+                    "website": fake.url(),
+                }
+                for _ in range(n)
+            ]
+
+    def generate_credit_cards(self, n: int) -> List[Dict[str, Any]]:
+        """Generate n credit cards."""
+        with self._faker() as fake:
+            return [
+                {
+                    "number": fake.credit_card_number(),
+                    "provider": fake.credit_card_provider(),
+                    "expire": fake.credit_card_expire(),
+                    "cvv": fake.credit_card_security_code(),
+                }
+                for _ in range(n)
+            ]
+
+    def generate_user(self) -> Dict[str, Any]:
+        """Generate user data."""
+        return self.generate_users(1)[0]
+
+    def generate_address(self) -> Dict[str, Any]:
+        """Generate address data."""
+        return self.generate_addresses(1)[0]
+
+    def generate_company(self) -> Dict[str, Any]:
+        """Generate company data."""
+        return self.generate_companies(1)[0]
+
+    def generate_credit_card(self) -> Dict[str, Any]:
+        """Generate credit card data."""
+        return self.generate_credit_cards(1)[0]
+
+    def generate_many(self, kind: str, n: int) -> List[Dict[str, Any]]:
+        """Generate n records of a kind: user, address, company or credit_card."""
+        batch = {
+            "user": self.generate_users,
+            "address": self.generate_addresses,
+            "company": self.generate_companies,
+            "credit_card": self.generate_credit_cards,
+        }.get(kind)
+        if batch is None:
+            raise ValueError(f"Unknown data kind '{kind}'")
+        return batch(n)
+
+
+class GeneratedPool:
+    """Pre-generated records written to disk once and sampled cheaply.
+
+    The pool file is JSONL keyed by kind, size, seed and Faker version, so
+    runs and xdist workers reuse it; records are read by offset through
+    DataSource instead of being generated per test. Pooled identities are
+    unique, and each worker samples only its own partition of the records.
+    """
+
+    def __init__(
+        self,
+        pool_dir: Path,
+        kind: str,
+        size: int = 10000,
+        seed: int = 0,
+        chunk: int = 1000,
+        partition: Tuple[int, int] = (0, 1)
+    ):
+        """Initialize generated pool; partition is (worker index, worker count)."""
+        from faker import VERSION
+
+        self.kind = kind
+        self.size = size
+        self.seed = seed
+        self.chunk = chunk
+        self.partition = partition
+        self.pool_dir = Path(pool_dir)
+        self.path = self.pool_dir / f"{kind}-{size}-{seed}-faker{VERSION}.jsonl"
+        self._source = None
+
+    def build(self) -> Path:
+        """Write the pool file unless another process already did."""
+        from tools.data_source import _locked
+
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        with _locked(self.path.with_suffix(".lock")):
+            if not self.path.exists():
+                generator = DataGenerator(self.seed, UniqueIdentities(namespace="p"))
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    for start in range(0, self.size, self.chunk):
+                        for record in generator.generate_many(self.kind, min(self.chunk, self.size - start)):
+                            f.write(json.dumps(record) + "\n")
+                os.replace(tmp_path, self.path)
+        return self.path
+
+    @property
+    def source(self):
+        """Get the indexed pool file, building it on first use."""
+        if self._source is None:
+            from tools.data_source import get_data_source
+
+            self.build()
+            self._source = get_data_source(self.path, self.pool_dir / "index")
+        return self._source
+
+    def __len__(self) -> int:
+        """Get number of pooled records."""
+        return len(self.source)
+
+    @property
+    def positions(self) -> range:
+        """Get the record positions of this worker's partition."""
+        index, count = self.partition
+        return range(index, len(self.source), count)
+
+    def sample(self, rng: Optional[random.Random] = None) -> Dict[str, Any]:
+        """Read one random record of this worker's partition."""
+        return self.source.read((rng or random).choice(self.positions))
+
+    def sample_many(self, n: int, rng: Optional[random.Random] = None) -> List[Dict[str, Any]]:
+        """Read n distinct random records of this worker's partition."""
+        positions = (rng or random).sample(self.positions, n)
+        return [self.source.read(position) for position in positions]
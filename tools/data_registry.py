@@ -0,0 +1,93 @@
+"""Session-level registry of parsed, indexed and read-only JSON test data."""
+
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from configs.snapshot import freeze
+
+
+class DataRegistry:
+    """Parse each test data file once and serve read-only, indexed views.
+
+    Files are re-parsed when their mtime or size changes. Secondary indexes
+    are declared per file and collection, e.g. ``{"users.json": {"users":
+    ["id", "role"]}}``; fields that are not declared are indexed on first lookup.
+    """
+
+    def __init__(self, data_dir: Path, indexes: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        """Initialize data registry."""
+        self.data_dir = Path(data_dir)
+        self.declared_indexes = indexes or {}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.parses = 0
+
+    def _entry(self, filename: str) -> Dict[str, Any]:
+        """Get the cached entry of a file, parsing it if new or changed."""
+        file_path = self.data_dir / filename
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Test data file not found: {file_path}") from None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(filename)
+        if entry is None or entry["version"] != version:
+            with open(file_path, "r") as f:
+                data = freeze(json.load(f))
+            self.parses += 1
+            entry = {"version": version, "data": data, "indexes": {}}
+            self._entries[filename] = entry
+            for collection, fields in self.declared_indexes.get(filename, {}).items():
+                for field in fields:
+                    self._build_index(filename, entry, collection, field)
+        return entry
+
+    def _build_index(self, filename: str, entry: Dict[str, Any], collection: str, field: str) -> Mapping:
+        """Group a collection's records by a field value; object values cannot be indexed."""
+        groups: Dict[Any, List[Mapping[str, Any]]] = {}
+        for record in entry["data"].get(collection, ()):
+            value = record.get(field)
+            try:
+                groups.setdefault(value, []).append(record)
+            except TypeError:
+                raise TypeError(
+                    f"Cannot index {collection}.{field} in {filename}: "
+                    f"{type(value).__name__} values are not hashable"
+                ) from None
+        index = MappingProxyType({value: tuple(records) for value, records in groups.items()})
+        entry["indexes"][(collection, field)] = index
+        return index
+
+    def load(self, filename: str) -> Mapping[str, Any]:
+        """Get the parsed content of a data file as a read-only mapping."""
+        return self._entry(filename)["data"]
+
+    def collection(self, filename: str, collection: str) -> Tuple[Mapping[str, Any], ...]:
+        """Get the records of a top-level list in a data file."""
+        return self.load(filename).get(collection, ())
+
+    def index(self, filename: str, collection: str, field: str) -> Mapping[Any, Tuple]:
+        """Get records of a collection grouped by a field value."""
+        entry = self._entry(filename)
+        index = entry["indexes"].get((collection, field))
+        if index is None:
+            index = self._build_index(filename, entry, collection, field)
+        return index
+
+    def find(self, filename: str, collection: str, field: str, value: Any) -> Tuple[Mapping[str, Any], ...]:
+        """Get all records whose field equals value."""
+        index = self.index(filename, collection, field)
+        try:
+            return index.get(value, ())
+        except TypeError:
+            raise TypeError(f"Cannot look up {collection}.{field} by unhashable {type(value).__name__}") from None
+
+    def find_one(self, filename: str, collection: str, field: str, value: Any) -> Mapping[str, Any]:
+        """Get the first record whose field equals value."""
+        records = self.find(filename, collection, field, value)
+        if not records:
+            raise LookupError(f"No {collection} with {field}={value!r} in {filename}")
+        return records[0]
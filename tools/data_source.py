@@ -0,0 +1,247 @@
+"""Streaming access to large JSONL/CSV (optionally gzipped) test datasets.
+
+A dataset is scanned once to build an index of record byte offsets, which is
+cached on disk next to the filtered selections built from it. Concurrent
+processes (xdist workers) take a file lock, so only the first one scans the
+file and the others read the cached index. Single records are read by seeking
+to their offset, so memory use does not grow with the dataset size.
+
+CSV records must be one per line (no quoted newlines).
+"""
+
+import csv
+import gzip
+import hashlib
+import json
+import os
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent index builds are not serialized
+    fcntl = None
+
+
+RecordFilter = Union[Callable[[Dict[str, Any]], bool], Mapping[str, Any], None]
+
+
+def parse_shard(shard: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse an "index/count" shard spec."""
+    if shard is None:
+        return None
+    index, _, count = str(shard).partition("/")
+    try:
+        parsed = int(index), int(count)
+    except ValueError:
+        parsed = (-1, 0)
+    if not 0 <= parsed[0] < parsed[1]:
+        raise ValueError(f"Invalid shard '{shard}', expected 'index/count' with 0 <= index < count")
+    return parsed
+
+
+def filter_fingerprint(record_filter: RecordFilter) -> str:
+    """Get a stable identity for a filter, used to key cached selections."""
+    if record_filter is None:
+        return "all"
+    if isinstance(record_filter, Mapping):
+        return json.dumps(dict(record_filter), sort_keys=True, default=str)
+    code = getattr(record_filter, "__code__", None)
+    if code is None:
+        return repr(record_filter)
+    # Bytecode, constants and captured values identify a filter across processes
+    cells = [cell.cell_contents for cell in record_filter.__closure__ or ()]
+    return f"{code.co_code.hex()}|{code.co_consts!r}|{code.co_names}|{cells!r}"
+
+
+def _matches(record: Dict[str, Any], record_filter: RecordFilter) -> bool:
+    """Check a record against a callable or field-equality filter."""
+    if record_filter is None:
+        return True
+    if isinstance(record_filter, Mapping):
+        return all(record.get(k) == v for k, v in record_filter.items())
+    return bool(record_filter(record))
+
+
+@contextmanager
+def _locked(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock file for the duration of the block."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class DataSource:
+    """A JSONL or CSV dataset read record by record through an offset index."""
+
+    def __init__(self, path: Path, index_dir: Path):
+        """Initialize data source."""
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Dataset not found: {self.path}")
+
+        name = self.path.name
+        self.compressed = name.endswith(".gz")
+        suffix = Path(name[:-3] if self.compressed else name).suffix
+        if suffix not in (".jsonl", ".csv"):
+            raise ValueError(f"Unsupported dataset format '{suffix}', use .jsonl or .csv")
+        self.format = suffix[1:]
+
+        stat = self.path.stat()
+        digest = hashlib.sha1(f"{self.path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        self._key = f"{self.path.stem}-{digest.hexdigest()[:16]}"
+        self.index_dir = Path(index_dir)
+        self.scans = 0
+
+        self._offsets: Optional[array] = None
+        self._header: Optional[List[str]] = None
+        self._handle: Optional[IO[bytes]] = None
+
+    def _open(self) -> IO[bytes]:
+        """Open the dataset for binary reading."""
+        return gzip.open(self.path, "rb") if self.compressed else open(self.path, "rb")
+
+    def _parse(self, line: bytes) -> Dict[str, Any]:
+        """Parse one record line."""
+        text = line.decode("utf-8")
+        if self.format == "jsonl":
+            return json.loads(text)
+        return dict(zip(self.header, next(csv.reader([text])), strict=True))
+
+    @property
+    def header(self) -> List[str]:
+        """Get CSV column names."""
+        if self._header is None:
+            with self._open() as f:
+                self._header = next(csv.reader([f.readline().decode("utf-8")]))
+        return self._header
+
+    def _scan(self) -> Iterator[Tuple[int, bytes]]:
+        """Stream (offset, line) of every record in the file."""
+        self.scans += 1
+        with self._open() as f:
+            offset = 0
+            if self.format == "csv":
+                offset += len(f.readline())
+            for line in f:
+                if line.strip():
+                    yield offset, line
+                offset += len(line)
+
+    @property
+    def _offsets_path(self) -> Path:
+        """Get path of the cached offset index."""
+        return self.index_dir / f"{self._key}.offsets"
+
+    def _write_offsets(self, offsets: array) -> None:
+        """Write the offset index atomically."""
+        tmp_path = self._offsets_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            offsets.tofile(f)
+        os.replace(tmp_path, self._offsets_path)
+
+    def _store_offsets(self, offsets: array) -> None:
+        """Cache the offset index on disk unless another process already did."""
+        with _locked(self._offsets_path.with_suffix(".lock")):
+            if not self._offsets_path.exists():
+                self._write_offsets(offsets)
+        self._offsets = offsets
+
+    @property
+    def offsets(self) -> array:
+        """Get byte offsets of all records, built once and cached on disk."""
+        if self._offsets is None:
+            with _locked(self._offsets_path.with_suffix(".lock")):
+                offsets = array("Q")
+                if self._offsets_path.exists():
+                    with open(self._offsets_path, "rb") as f:
+                        offsets.frombytes(f.read())
+                else:
+                    offsets.extend(offset for offset, _ in self._scan())
+                    self._write_offsets(offsets)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        """Get number of records."""
+        return len(self.offsets)
+
+    def read(self, position: int) -> Dict[str, Any]:
+        """Read the record at a position by seeking to its offset."""
+        offset = self.offsets[position]
+        # Reuse the handle: forward seeks on gzip files only decompress the gap
+        if self._handle is None or (self.compressed and self._handle.tell() > offset):
+            self.close()
+            self._handle = self._open()
+        self._handle.seek(offset)
+        return self._parse(self._handle.readline())
+
+    def select(
+        self,
+        record_filter: RecordFilter = None,
+        shard: Optional[str] = None,
+        limit: Optional[int] = None,
+        id_field: Optional[str] = None
+    ) -> Tuple[List[int], List[str]]:
+        """Get positions and test ids of matching records, cached per filter."""
+        parsed_shard = parse_shard(shard)
+        fingerprint = filter_fingerprint(record_filter)
+        selection_key = hashlib.sha1(f"{fingerprint}|{id_field}".encode()).hexdigest()[:16]
+        selection_path = self.index_dir / f"{self._key}-{selection_key}.selection.json"
+
+        with _locked(selection_path.with_suffix(".lock")):
+            if selection_path.exists():
+                with open(selection_path) as f:
+                    cached = json.load(f)
+                positions, ids = cached["positions"], cached["ids"]
+            else:
+                positions, ids = [], []
+                offsets = array("Q")
+                for position, (offset, line) in enumerate(self._scan()):
+                    offsets.append(offset)
+                    if record_filter is None and id_field is None:
+                        positions.append(position)
+                        ids.append(f"{self.path.stem}:{position}")
+                        continue
+                    record = self._parse(line)
+                    if _matches(record, record_filter):
+                        positions.append(position)
+                        label = record.get(id_field) if id_field else None
+                        ids.append(str(label) if label is not None else f"{self.path.stem}:{position}")
+                if self._offsets is None:
+                    self._store_offsets(offsets)
+                with open(selection_path.with_suffix(".tmp"), "w") as f:
+                    json.dump({"positions": positions, "ids": ids}, f)
+                os.replace(selection_path.with_suffix(".tmp"), selection_path)
+
+        if parsed_shard:
+            index, count = parsed_shard
+            positions, ids = positions[index::count], ids[index::count]
+        if limit is not None:
+            positions, ids = positions[:limit], ids[:limit]
+        return positions, ids
+
+    def close(self) -> None:
+        """Close the read handle."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+_sources: Dict[Tuple[str, str], DataSource] = {}
+
+
+def get_data_source(path: Path, index_dir: Path) -> DataSource:
+    """Get a process-wide data source for a dataset."""
+    key = (str(Path(path).resolve()), str(index_dir))
+    if key not in _sources:
+        _sources[key] = DataSource(path, index_dir)
+    return _sources[key]
@@ -0,0 +1,255 @@
+"""Compiled, memory-mapped test data store shared by xdist workers.
+
+A JSON data file such as ``{"users": [...]}`` is compiled into one binary file:
+
+    MAGIC | header offset (u64) | record bytes | record tables | index tables | header
+
+Each top-level list becomes a collection: its records are packed as compact
+JSON, a record table holds (offset, length) per record and every indexed
+field gets a table of (key offset, key length, position) sorted by the
+JSON-encoded key. Workers map the file read-only, so the OS page cache holds a
+single copy for all of them; records are decoded only when accessed and keys
+are found by binary search without loading the index.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from configs.snapshot import freeze
+
+
+MAGIC = b"PWDSTOR1"
+
+_OFFSET = struct.Struct("<Q")
+_RECORD = struct.Struct("<QI")
+_INDEX = struct.Struct("<QII")
+
+
+def encode_key(value: Any) -> bytes:
+    """Encode an index key so equal values compare equal as bytes."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+
+
+def compile_store(
+    source: Path,
+    output: Path,
+    indexes: Optional[Mapping[str, List[str]]] = None
+) -> Path:
+    """Compile a JSON data file into a memory-mappable store."""
+    with open(source, "r") as f:
+        data = json.load(f)
+    indexes = indexes or {}
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp file, so concurrent compiles of the same store never share one
+    tmp_path = output.with_suffix(f".{os.getpid()}.tmp")
+    header: Dict[str, Any] = {"version": 1, "source": Path(source).name, "collections": {}}
+
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC + _OFFSET.pack(0))
+
+        for name, records in data.items():
+            if not isinstance(records, list):
+                continue
+
+            # Records
+            spans: List[Tuple[int, int]] = []
+            for record in records:
+                encoded = json.dumps(record, separators=(",", ":")).encode()
+                spans.append((f.tell(), len(encoded)))
+                f.write(encoded)
+
+            # Record table
+            table_offset = f.tell()
+            for span in spans:
+                f.write(_RECORD.pack(*span))
+            collection = {"count": len(records), "table": table_offset, "indexes": {}}
+
+            # Index tables sorted by encoded key
+            for field in indexes.get(name, []):
+                keys = sorted(
+                    (encode_key(record[field]), position)
+                    for position, record in enumerate(records)
+                    if isinstance(record, dict) and field in record
+                )
+                entries = []
+                for key, position in keys:
+                    entries.append((f.tell(), len(key), position))
+                    f.write(key)
+                index_offset = f.tell()
+                for entry in entries:
+                    f.write(_INDEX.pack(*entry))
+                collection["indexes"][field] = {"table": index_offset, "count": len(entries)}
+
+            header["collections"][name] = collection
+
+        header_offset = f.tell()
+        f.write(json.dumps(header).encode())
+        f.seek(len(MAGIC))
+        f.write(_OFFSET.pack(header_offset))
+
+    os.replace(tmp_path, output)
+    return output
+
+
+def compiled_path(source: Path, store_dir: Path, indexes: Optional[Mapping[str, Any]] = None) -> Path:
+    """Get the store path for a source file, keyed by its content version and indexes."""
+    stat = Path(source).stat()
+    version = f"{stat.st_mtime_ns}:{stat.st_size}:{json.dumps(indexes or {}, sort_keys=True)}"
+    digest = hashlib.sha1(version.encode()).hexdigest()[:16]
+    return store_dir / f"{Path(source).stem}-{digest}.pds"
+
+
+def build_stores(
+    data_dir: Path,
+    store_dir: Path,
+    declared: Mapping[str, Mapping[str, List[str]]]
+) -> Dict[str, str]:
+    """Compile declared data files unless an up-to-date store already exists."""
+    paths = {}
+    for filename, indexes in declared.items():
+        source = Path(data_dir) / filename
+        if not source.exists():
+            continue
+        output = compiled_path(source, store_dir, indexes)
+        if not output.exists():
+            compile_store(source, output, indexes)
+        paths[filename] = str(output)
+    return paths
+
+
+class StoreCollection(Sequence):
+    """Lazily decoded, read-only records of one collection."""
+
+    def __init__(self, store: "DataStore", name: str, meta: Mapping[str, Any]):
+        """Initialize store collection."""
+        self._store = store
+        self.name = name
+        self._count = meta["count"]
+        self._table = meta["table"]
+        self._indexes = meta["indexes"]
+
+    def __len__(self) -> int:
+        """Get number of records."""
+        return self._count
+
+    def __getitem__(self, position):
+        """Decode the record at a position, or a tuple of records for a slice."""
+        if isinstance(position, slice):
+            return tuple(self[i] for i in range(*position.indices(self._count)))
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(f"{self.name} has {self._count} records")
+        offset, length = _RECORD.unpack_from(self._store.buffer, self._table + position * _RECORD.size)
+        return freeze(json.loads(self._store.buffer[offset:offset + length]))
+
+    def _index_entry(self, field: str, i: int) -> Tuple[bytes, int]:
+        """Read key bytes and record position of an index entry."""
+        table = self._indexes[field]["table"]
+        key_offset, key_length, position = _INDEX.unpack_from(
+            self._store.buffer, table + i * _INDEX.size
+        )
+        return self._store.buffer[key_offset:key_offset + key_length], position
+
+    def positions(self, field: str, value: Any) -> List[int]:
+        """Find positions of records whose field equals value by binary search."""
+        if field not in self._indexes:
+            raise KeyError(f"{self.name}.{field} is not indexed, add it under test_data in config.yaml")
+        target = encode_key(value)
+        lo, hi = 0, self._indexes[field]["count"]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._index_entry(field, mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        positions = []
+        while lo < self._indexes[field]["count"]:
+            key, position = self._index_entry(field, lo)
+            if key != target:
+                break
+            positions.append(position)
+            lo += 1
+        return positions
+
+    def find(self, field: str, value: Any) -> Tuple[Mapping[str, Any], ...]:
+        """Get all records whose field equals value."""
+        return tuple(self[p] for p in self.positions(field, value))
+
+    def find_one(self, field: str, value: Any) -> Mapping[str, Any]:
+        """Get the first record whose field equals value."""
+        positions = self.positions(field, value)
+        if not positions:
+            raise LookupError(f"No {self.name} with {field}={value!r}")
+        return self[positions[0]]
+
+
+class DataStore:
+    """Read-only memory map of a compiled data file."""
+
+    def __init__(self, path: Path):
+        """Initialize data store."""
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            self.buffer.close()
+            raise ValueError(f"{self.path} is not a compiled data store")
+        (header_offset,) = _OFFSET.unpack_from(self.buffer, len(MAGIC))
+        self.header = json.loads(self.buffer[header_offset:])
+        self._collections: Dict[str, StoreCollection] = {}
+
+    def collection(self, name: str) -> StoreCollection:
+        """Get a collection by name."""
+        if name not in self._collections:
+            meta = self.header["collections"].get(name)
+            if meta is None:
+                raise KeyError(f"{self.header['source']} has no collection '{name}'")
+            self._collections[name] = StoreCollection(self, name, meta)
+        return self._collections[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate collection names."""
+        return iter(self.header["collections"])
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._collections.clear()
+        self.buffer.close()
+
+
+class DataStoreSet:
+    """Stores of all compiled data files, opened on first access."""
+
+    def __init__(self, paths: Mapping[str, str]):
+        """Initialize data store set."""
+        self.paths = dict(paths)
+        self._stores: Dict[str, DataStore] = {}
+
+    def __call__(self, filename: str) -> DataStore:
+        """Get the store compiled from a data file."""
+        if filename not in self._stores:
+            if filename not in self.paths:
+                raise KeyError(
+                    f"{filename} is not compiled, declare it under test_data in config.yaml"
+                )
+            self._stores[filename] = DataStore(Path(self.paths[filename]))
+        return self._stores[filename]
+
+    def __contains__(self, filename: str) -> bool:
+        """Check if a data file is compiled."""
+        return filename in self.paths
+
+    def close(self) -> None:
+        """Unmap all opened stores."""
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
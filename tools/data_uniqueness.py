@@ -0,0 +1,108 @@
+"""Collision-free generated identities across xdist workers.
+
+Every identity carries a token drawn from the worker's own slice of a
+sequence: worker i of n issues i, i + n, i + 2n, ... so tokens from different
+workers never meet, without any coordination between them. A namespace,
+by default the xdist test run id, keeps runs apart when records outlive a
+run in the Test Data Service. An optional check skips tokens whose
+identities already exist there.
+"""
+
+import os
+import threading
+import uuid
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def worker_partition() -> Tuple[int, int]:
+    """Get this process's xdist worker index and the worker count."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+    index = int(worker[2:]) if worker.startswith("gw") and worker[2:].isdigit() else 0
+    return index, max(count, index + 1)
+
+
+def run_namespace() -> str:
+    """Get a short id shared by all workers of this test run."""
+    run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    return run_id[:6]
+
+
+def _base36(number: int) -> str:
+    """Encode a non-negative integer in lowercase base 36."""
+    encoded = ""
+    while True:
+        number, digit = divmod(number, 36)
+        encoded = _DIGITS[digit] + encoded
+        if not number:
+            return encoded
+
+
+class UniqueIdentities:
+    """Issue identity tokens from this worker's disjoint partition of the sequence."""
+
+    def __init__(
+        self,
+        worker_index: int = 0,
+        worker_count: int = 1,
+        namespace: str = "",
+        verify: Optional[Callable[[Dict[str, str]], bool]] = None
+    ):
+        """Initialize unique identities.
+
+        ``verify`` gets a candidate identity and returns True when it is taken.
+        """
+        if not 0 <= worker_index < worker_count:
+            raise ValueError(f"Worker index {worker_index} is outside 0..{worker_count - 1}")
+        self.worker_index = worker_index
+        self.worker_count = worker_count
+        self.namespace = namespace
+        self.verify = verify
+        self._next = 0
+        self._lock = threading.Lock()
+        self.stats = {"issued": 0, "taken": 0}
+
+    @classmethod
+    def for_worker(cls, namespace: Optional[str] = None, **kwargs: Any) -> "UniqueIdentities":
+        """Create the identities of this xdist worker, namespaced by the test run by default."""
+        index, count = worker_partition()
+        return cls(index, count, run_namespace() if namespace is None else namespace, **kwargs)
+
+    def next_token(self) -> str:
+        """Get the next token, unique across workers and, with a namespace, across runs."""
+        with self._lock:
+            sequence = self._next * self.worker_count + self.worker_index
+            self._next += 1
+        return f"{self.namespace}{_base36(sequence)}"
+
+    def identity(self, name: str, domain: str) -> Tuple[str, str]:
+        """Get a unique username and email for a name, skipping identities that are taken."""
+        while True:
+            username = f"{name}.{self.next_token()}"
+            candidate = {"username": username, "email": f"{username}@{domain}"}
+            if self.verify is not None and self.verify(candidate):
+                self.stats["taken"] += 1
+                continue
+            self.stats["issued"] += 1
+            return candidate["username"], candidate["email"]
+
+
+class TDSIdentityCheck:
+    """Check candidate identities against records stored in the Test Data Service."""
+
+    def __init__(self, client: Any, data_type: str = "users", fields: Sequence[str] = ("username", "email")):
+        """Initialize TDS identity check."""
+        self.client = client
+        self.data_type = data_type
+        self.fields = tuple(fields)
+
+    def __call__(self, identity: Dict[str, str]) -> bool:
+        """Check if any field of an identity is already used by a stored record."""
+        return any(
+            self.client.get_data(self.data_type, {field: identity[field]})
+            for field in self.fields
+            if field in identity
+        )
@@ -0,0 +1,45 @@
+"""Device emulation descriptors for browser contexts.
+
+Device names resolve to profiles under ``devices`` in config.yaml, falling
+back to Playwright's built-in descriptors such as "iPhone 13". Each name is
+resolved once per session; tests then open contexts for any number of
+devices on the same launched browser.
+"""
+
+from typing import Any, Dict, Mapping, Optional
+
+
+# Context arguments a device descriptor sets; other profile keys, e.g. throttling, are not passed on
+DEVICE_KEYS = ("viewport", "screen", "user_agent", "device_scale_factor", "is_mobile", "has_touch")
+
+
+class DeviceDescriptors:
+    """Resolve device names to browser context arguments, caching each one."""
+
+    def __init__(self, devices: Mapping[str, Mapping[str, Any]], builtin: Optional[Mapping[str, Mapping]] = None):
+        """Initialize device descriptors from config profiles and Playwright's built-in ones."""
+        self.devices = devices
+        self.builtin = builtin or {}
+        self._resolved: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, name: str) -> Dict[str, Any]:
+        """Get the full profile of a device."""
+        if name not in self._resolved:
+            profile = self.devices.get(name) or self.builtin.get(name)
+            if profile is None:
+                known = ", ".join(sorted(self.devices))
+                raise KeyError(f"Unknown device '{name}'; configured devices: {known}")
+            self._resolved[name] = dict(profile)
+        return self._resolved[name]
+
+    def context_args(self, name: str, engine: Optional[str] = None) -> Dict[str, Any]:
+        """Get the context arguments emulating a device on an engine."""
+        args = {key: value for key, value in self.get(name).items() if key in DEVICE_KEYS}
+        if engine == "firefox":
+            # Firefox rejects is_mobile; the viewport, user agent and touch still apply
+            args.pop("is_mobile", None)
+        return args
+
+    def throttling(self, name: str) -> Optional[Any]:
+        """Get the throttling preset or settings of a device profile."""
+        return self.get(name).get("throttling")
@@ -0,0 +1,435 @@
+"""In-process fake Test Data Service for offline runs and benchmarks.
+
+Implements the endpoints used by TestDataServiceClient: generation of users,
+addresses and payments with DataGenerator, CRUD on ``/data/{type}``, TTL
+locks, the bulk endpoints and ``/capabilities``. Records live in memory.
+Latency and errors can be injected per path pattern, in process or through
+the ``/__fake_tds`` control endpoint from other processes.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from fnmatch import fnmatch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+
+API_PREFIX = "/api/v1"
+
+# Control endpoint for changing latency and errors of a running server
+CONTROL_ENDPOINT = "/__fake_tds"
+
+BULK_OPERATIONS = ["create", "lock", "release", "generate"]
+
+
+class FakeTDSError(Exception):
+    """An error response of the fake service."""
+
+    def __init__(self, status: int, message: str):
+        """Initialize fake TDS error."""
+        super().__init__(message)
+        self.status = status
+
+
+class FakeTDSState:
+    """Records, locks and injected faults of a fake service."""
+
+    def __init__(self, generator: Any = None, seed: Optional[int] = None):
+        """Initialize fake TDS state."""
+        if generator is None:
+            from tools.data_generator import DataGenerator
+            generator = DataGenerator()
+        self.generator = generator
+        self.records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # (type, id) -> (lock id, expires at or None)
+        self.locks: Dict[Tuple[str, str], Tuple[str, Optional[float]]] = {}
+        self.latency: Dict[str, int] = {}
+        self.errors: Dict[str, Dict[str, Any]] = {}
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.bulk = True
+        self._lock = threading.RLock()
+
+    # Generation
+
+    def generate(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a user, address or payment record."""
+        with self._lock:
+            if kind == "user":
+                record = {**self.generator.generate_user(), "profile": params.get("profile", "default")}
+            elif kind == "address":
+                record = {**self.generator.generate_address(), "country": params.get("country", "US")}
+            elif kind == "payment":
+                record = {**self.generator.generate_credit_card(), "card_type": params.get("card_type", "visa")}
+            else:
+                raise FakeTDSError(404, f"Cannot generate '{kind}'")
+        return {"id": uuid.uuid4().hex, **record}
+
+    # CRUD
+
+    def seed(self, data_type: str, records: List[Dict[str, Any]]) -> None:
+        """Store records, assigning ids to records without one."""
+        for record in records:
+            self.create(data_type, record)
+
+    def seed_generated(self, data_type: str, kind: str, count: int) -> None:
+        """Store generated records of a kind."""
+        self.seed(data_type, [self.generate(kind, {}) for _ in range(count)])
+
+    def _record(self, data_type: str, data_id: str) -> Dict[str, Any]:
+        """Get a stored record."""
+        record = self.records.get(data_type, {}).get(data_id)
+        if record is None:
+            raise FakeTDSError(404, f"{data_type}/{data_id} not found")
+        return record
+
+    def query(self, data_type: str, filters: Dict[str, str]) -> List[Dict[str, Any]]:
+        """List records whose fields equal the filters."""
+        with self._lock:
+            return [
+                dict(record) for record in self.records.get(data_type, {}).values()
+                if all(str(record.get(field)) == value for field, value in filters.items())
+            ]
+
+    def get(self, data_type: str, data_id: str) -> Dict[str, Any]:
+        """Get one record."""
+        with self._lock:
+            return dict(self._record(data_type, data_id))
+
+    def create(self, data_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a record."""
+        record = {"id": uuid.uuid4().hex, **data}
+        record["id"] = str(record["id"])
+        with self._lock:
+            collection = self.records.setdefault(data_type, {})
+            if record["id"] in collection:
+                raise FakeTDSError(409, f"{data_type}/{record['id']} already exists")
+            collection[record["id"]] = record
+        return dict(record)
+
+    def update(self, data_type: str, data_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a record."""
+        with self._lock:
+            record = self._record(data_type, data_id)
+            record.update({k: v for k, v in data.items() if k != "id"})
+            return dict(record)
+
+    def delete(self, data_type: str, data_id: str) -> Dict[str, Any]:
+        """Delete a record and its lock."""
+        with self._lock:
+            self._record(data_type, data_id)
+            del self.records[data_type][data_id]
+            self.locks.pop((data_type, data_id), None)
+        return {"deleted": True, "id": data_id}
+
+    # Locks
+
+    def lock(self, data_type: str, data_id: str, lock_id: str, ttl: Optional[float] = None) -> Dict[str, Any]:
+        """Lock a record, or renew the lock when lock_id already holds it."""
+        if not lock_id:
+            raise FakeTDSError(400, "lock_id is required")
+        with self._lock:
+            self._record(data_type, data_id)
+            held = self.locks.get((data_type, data_id))
+            now = time.time()
+            if held and held[0] != lock_id and (held[1] is None or held[1] > now):
+                raise FakeTDSError(409, f"{data_type}/{data_id} is locked")
+            expires_at = now + ttl if ttl else None
+            self.locks[(data_type, data_id)] = (lock_id, expires_at)
+        return {"locked": True, "id": data_id, "expires_at": expires_at}
+
+    def release(self, data_type: str, data_id: str, lock_id: str) -> Dict[str, Any]:
+        """Release a lock held by lock_id."""
+        with self._lock:
+            held = self.locks.get((data_type, data_id))
+            if held is None:
+                return {"released": False, "id": data_id}
+            if held[0] != lock_id:
+                raise FakeTDSError(409, f"{data_type}/{data_id} is locked by another owner")
+            del self.locks[(data_type, data_id)]
+        return {"released": True, "id": data_id}
+
+    # Fault injection
+
+    def set_latency(self, pattern: str, delay_ms: int) -> None:
+        """Delay responses for paths matching a glob pattern."""
+        self.latency[pattern] = delay_ms
+
+    def set_error(self, pattern: str, status: int = 503, rate: float = 1.0) -> None:
+        """Fail a share of requests for paths matching a glob pattern."""
+        self.errors[pattern] = {"status": status, "rate": rate}
+
+    def clear_faults(self) -> None:
+        """Remove injected latency and errors."""
+        self.latency.clear()
+        self.errors.clear()
+
+    def inject(self, path: str) -> Optional[int]:
+        """Count a request, apply latency for its path and get an injected error status, if any."""
+        with self._lock:
+            self.requests += 1
+        for pattern, delay_ms in list(self.latency.items()):
+            if fnmatch(path, pattern):
+                time.sleep(delay_ms / 1000)
+                break
+        for pattern, error in list(self.errors.items()):
+            if fnmatch(path, pattern):
+                with self._lock:
+                    failed = self.random.random() < error.get("rate", 1.0)
+                return error.get("status", 503) if failed else None
+        return None
+
+
+def _bulk(items: List[Any], call: Callable[[Any], Any]) -> Dict[str, Any]:
+    """Apply a call per item and report per-item results."""
+    results = []
+    for item in items:
+        try:
+            results.append({"ok": True, "data": call(item)})
+        except FakeTDSError as e:
+            results.append({"ok": False, "error": str(e)})
+    return {"results": results}
+
+
+def _routes(state: FakeTDSState) -> List[Tuple[str, "re.Pattern", Callable[..., Any]]]:
+    """Map methods and API paths to handlers taking path groups, body and query."""
+    return [
+        ("GET", re.compile(r"/capabilities"), lambda body, query: {"bulk": BULK_OPERATIONS if state.bulk else []}),
+        ("POST", re.compile(r"/data/(user|address|payment)"),
+         lambda body, query, kind: state.generate(kind, body or {})),
+        ("POST", re.compile(r"/data/([^/]+)/generate"),
+         lambda body, query, kind: _bulk(
+             [None] * int((body or {}).get("count", 1)), lambda _: state.generate(kind, body or {})
+         )),
+        ("POST", re.compile(r"/data/([^/]+)/bulk"),
+         lambda body, query, data_type: _bulk(
+             body.get("records", []), lambda record: state.create(data_type, record)
+         )),
+        ("POST", re.compile(r"/data/([^/]+)/lock"),
+         lambda body, query, data_type: _bulk(
+             body.get("ids", []), lambda i: state.lock(data_type, str(i), body.get("lock_id"), body.get("ttl"))
+         )),
+        ("POST", re.compile(r"/data/([^/]+)/release"),
+         lambda body, query, data_type: _bulk(
+             body.get("ids", []), lambda i: state.release(data_type, str(i), body.get("lock_id"))
+         )),
+        ("POST", re.compile(r"/data/([^/]+)/([^/]+)/lock"),
+         lambda body, query, data_type, data_id: state.lock(
+             data_type, data_id, (body or {}).get("lock_id"), (body or {}).get("ttl")
+         )),
+        ("POST", re.compile(r"/data/([^/]+)/([^/]+)/release"),
+         lambda body, query, data_type, data_id: state.release(data_type, data_id, (body or {}).get("lock_id"))),
+        ("GET", re.compile(r"/data/([^/]+)"), lambda body, query, data_type: state.query(data_type, query)),
+        ("POST", re.compile(r"/data/([^/]+)"), lambda body, query, data_type: state.create(data_type, body or {})),
+        ("GET", re.compile(r"/data/([^/]+)/([^/]+)"),
+         lambda body, query, data_type, data_id: state.get(data_type, data_id)),
+        ("PUT", re.compile(r"/data/([^/]+)/([^/]+)"),
+         lambda body, query, data_type, data_id: state.update(data_type, data_id, body or {})),
+        ("DELETE", re.compile(r"/data/([^/]+)/([^/]+)"),
+         lambda body, query, data_type, data_id: state.delete(data_type, data_id)),
+    ]
+
+
+class _FakeTDSRequestHandler(BaseHTTPRequestHandler):
+    """Route requests to the fake service state."""
+
+    # Keep-alive, so pooled client connections are reused as with the real service;
+    # without Nagle, the separately written body is not held back by delayed ACKs
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    state: FakeTDSState
+    routes: List[Tuple[str, "re.Pattern", Callable[..., Any]]]
+    api_key: Optional[str]
+
+    def _send(self, status: int, payload: Any) -> None:
+        """Respond with JSON."""
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> None:
+        """Read the raw request body, so no reply leaves it on a keep-alive connection."""
+        length = int(self.headers.get("Content-Length", 0))
+        self._raw_body = self.rfile.read(length) if length else b""
+
+    def _body(self) -> Any:
+        """Parse the JSON request body."""
+        return json.loads(self._raw_body or b"null")
+
+    def _control(self) -> None:
+        """Set or clear injected faults."""
+        if self.command == "PUT":
+            body = self._body() or {}
+            for pattern, delay_ms in body.get("latency", {}).items():
+                self.state.set_latency(pattern, delay_ms)
+            for pattern, error in body.get("errors", {}).items():
+                self.state.set_error(pattern, **error)
+        elif self.command == "DELETE":
+            self.state.clear_faults()
+        self._send(200, {"latency": self.state.latency, "errors": self.state.errors})
+
+    def _handle(self) -> None:
+        """Dispatch a request."""
+        self._read_body()
+        url = urlsplit(self.path)
+        if url.path == CONTROL_ENDPOINT:
+            self._control()
+            return
+        if not url.path.startswith(API_PREFIX):
+            self._send(404, {"error": f"Unknown path {url.path}"})
+            return
+        path = url.path[len(API_PREFIX):].rstrip("/")
+
+        try:
+            if self.api_key and self.headers.get("X-API-Key") != self.api_key:
+                raise FakeTDSError(401, "Invalid API key")
+            injected = self.state.inject(path)
+            if injected:
+                raise FakeTDSError(injected, "Injected error")
+            body = self._body()
+            query = dict(parse_qsl(url.query))
+            for method, pattern, handler in self.routes:
+                match = pattern.fullmatch(path)
+                if match and method == self.command:
+                    self._send(200, handler(body, query, *match.groups()))
+                    return
+            raise FakeTDSError(404, f"No route for {self.command} {path}")
+        except FakeTDSError as e:
+            self._send(e.status, {"error": str(e)})
+        except (ValueError, AttributeError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format: str, *args) -> None:
+        """Suppress per-request logging."""
+
+
+class FakeTDS:
+    """Serve a fake Test Data Service on an ephemeral port in a background thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[Dict[str, int]] = None,
+        errors: Optional[Dict[str, Dict[str, Any]]] = None,
+        api_key: Optional[str] = None,
+        generator: Any = None,
+        seed: Optional[int] = None,
+        bulk: bool = True
+    ):
+        """Initialize fake TDS."""
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.state = FakeTDSState(generator, seed)
+        # Without bulk, /capabilities advertises nothing and clients fan out
+        self.state.bulk = bulk
+        for pattern, delay_ms in (latency or {}).items():
+            self.state.set_latency(pattern, delay_ms)
+        for pattern, error in (errors or {}).items():
+            self.state.set_error(pattern, **error)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, fake_config: Dict[str, Any]) -> "FakeTDS":
+        """Create a fake service from test_data_service.fake in config.yaml, seeded with records."""
+        fake = cls(
+            latency=dict(fake_config.get("latency") or {}),
+            errors={pattern: dict(error) for pattern, error in (fake_config.get("errors") or {}).items()},
+            seed=fake_config.get("random_seed"),
+        )
+        for data_type, spec in (fake_config.get("seed") or {}).items():
+            fake.state.seed_generated(data_type, spec.get("kind", "user"), spec.get("count", 0))
+        return fake
+
+    @property
+    def url(self) -> str:
+        """Get the API base URL for TestDataServiceClient."""
+        return f"http://{self.host}:{self.port}{API_PREFIX}"
+
+    def set_latency(self, pattern: str, delay_ms: int) -> None:
+        """Delay responses for API paths matching a glob pattern, e.g. "/data/*"."""
+        self.state.set_latency(pattern, delay_ms)
+
+    def set_error(self, pattern: str, status: int = 503, rate: float = 1.0) -> None:
+        """Fail a share of requests for API paths matching a glob pattern."""
+        self.state.set_error(pattern, status, rate)
+
+    def clear_faults(self) -> None:
+        """Remove injected latency and errors."""
+        self.state.clear_faults()
+
+    def start(self) -> "FakeTDS":
+        """Start serving in a daemon thread."""
+        handler = type("Handler", (_FakeTDSRequestHandler,), {
+            "state": self.state,
+            "routes": _routes(self.state),
+            "api_key": self.api_key,
+        })
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeTDS":
+        """Start server on context entry."""
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        """Stop server on context exit."""
+        self.stop()
+
+
+class FakeTDSClient:
+    """Handle to a FakeTDS running in another process."""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        """Initialize fake TDS client."""
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _send(self, method: str, payload: object) -> Dict[str, Any]:
+        """Send a request to the control endpoint."""
+        root = self.url[:-len(API_PREFIX)] if self.url.endswith(API_PREFIX) else self.url
+        request = urllib.request.Request(
+            root + CONTROL_ENDPOINT,
+            data=json.dumps(payload).encode(),
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    def set_latency(self, pattern: str, delay_ms: int) -> None:
+        """Delay responses for API paths matching a glob pattern."""
+        self._send("PUT", {"latency": {pattern: delay_ms}})
+
+    def set_error(self, pattern: str, status: int = 503, rate: float = 1.0) -> None:
+        """Fail a share of requests for API paths matching a glob pattern."""
+        self._send("PUT", {"errors": {pattern: {"status": status, "rate": rate}}})
+
+    def clear_faults(self) -> None:
+        """Remove injected latency and errors."""
+        self._send("DELETE", None)
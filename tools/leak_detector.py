@@ -0,0 +1,92 @@
+"""JS heap leak detection for repeated page-object workflows (Chromium only)."""
+
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from playwright.sync_api import CDPSession, Page
+
+
+class HeapLeakError(AssertionError):
+    """Raised when retained JS heap grows beyond the allowed threshold."""
+
+
+class HeapLeakDetector:
+    """Repeat a workflow and fit the growth of the JS heap after forced GC."""
+
+    def __init__(
+        self,
+        session: CDPSession,
+        iterations: int = 20,
+        warmup: int = 3,
+        max_growth_bytes: int = 1024 * 1024
+    ):
+        """Initialize heap leak detector."""
+        self.session = session
+        self.iterations = iterations
+        self.warmup = warmup
+        self.max_growth_bytes = max_growth_bytes
+        self.samples: List[int] = []
+
+        self.session.send("Performance.enable")
+        self.session.send("HeapProfiler.enable")
+
+    @classmethod
+    def for_page(cls, page: Page, **kwargs: Any) -> "HeapLeakDetector":
+        """Create a detector attached to a page over CDP."""
+        return cls(page.context.new_cdp_session(page), **kwargs)
+
+    def sample(self) -> int:
+        """Force garbage collection and read the used JS heap size in bytes."""
+        self.session.send("HeapProfiler.collectGarbage")
+        metrics = self.session.send("Performance.getMetrics")["metrics"]
+        for metric in metrics:
+            if metric["name"] == "JSHeapUsedSize":
+                return int(metric["value"])
+        raise RuntimeError("JSHeapUsedSize is not reported by this browser")
+
+    def run(self, workflow: Callable[[], None]) -> Dict[str, Any]:
+        """Run the workflow repeatedly and return the fitted heap growth."""
+        # Warm-up runs let caches and lazily created objects settle
+        for _ in range(self.warmup):
+            workflow()
+
+        self.samples = [self.sample()]
+        for _ in range(self.iterations):
+            workflow()
+            self.samples.append(self.sample())
+
+        slope, _ = statistics.linear_regression(range(len(self.samples)), self.samples)
+        return {
+            "iterations": self.iterations,
+            "baseline_bytes": self.samples[0],
+            "final_bytes": self.samples[-1],
+            "slope_bytes_per_iteration": round(slope, 2),
+            "retained_growth_bytes": round(slope * self.iterations),
+            "max_growth_bytes": self.max_growth_bytes,
+        }
+
+    def assert_no_leak(self, workflow: Callable[[], None]) -> Dict[str, Any]:
+        """Run the workflow and fail if the retained heap grows beyond the threshold."""
+        result = self.run(workflow)
+        if result["retained_growth_bytes"] > self.max_growth_bytes:
+            raise HeapLeakError(
+                f"JS heap grew by {result['retained_growth_bytes']} bytes over "
+                f"{self.iterations} iterations ({result['slope_bytes_per_iteration']} "
+                f"bytes/iteration), threshold is {self.max_growth_bytes} bytes"
+            )
+        return result
+
+    def save_heap_snapshot(self, path: Path) -> Path:
+        """Stream a heap snapshot to a .heapsnapshot file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            def write_chunk(params: Dict[str, Any]) -> None:
+                f.write(params["chunk"])
+
+            self.session.on("HeapProfiler.addHeapSnapshotChunk", write_chunk)
+            try:
+                self.session.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+            finally:
+                self.session.remove_listener("HeapProfiler.addHeapSnapshotChunk", write_chunk)
+        return path
@@ -0,0 +1,423 @@
+"""Browser-level load generation using the page objects as virtual users.
+
+Virtual users (VUs) are spread over several browser processes, each hosting up
+to ``contexts_per_browser`` browser contexts. Inside a process the Playwright
+sync API is single-threaded, so its VUs take turns one workflow step at a time
+while the browser renders all of their contexts; parallelism across cores comes
+from running several browser processes.
+
+Usage:
+    python -m tools.load_runner --users 20 --contexts-per-browser 5 \\
+        --ramp-up 10 --hold 30 --ramp-down 5
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pages.todo_page import TodoPage
+from tools.static_server import StaticServer, TODOMVC_DIR
+
+
+class LatencyHistogram:
+    """HDR-style histogram with log-linear buckets and bounded relative error."""
+
+    def __init__(self, significant_digits: int = 2):
+        """Initialize latency histogram."""
+        self.significant_digits = significant_digits
+        # Enough linear sub-buckets per power of two for the requested precision
+        self.sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self.sub_bucket_count = 1 << self.sub_bucket_bits
+        self.sub_bucket_half = self.sub_bucket_count // 2
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    def _index(self, value_us: int) -> int:
+        """Get the bucket index of a value in microseconds."""
+        if value_us < self.sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self.sub_bucket_bits
+        return shift * self.sub_bucket_half + (value_us >> shift)
+
+    def _value(self, index: int) -> int:
+        """Get the highest value in microseconds equivalent to a bucket index."""
+        if index < self.sub_bucket_count:
+            return index
+        shift = (index - self.sub_bucket_count) // self.sub_bucket_half + 1
+        sub_bucket = index - shift * self.sub_bucket_half
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_ms: float) -> None:
+        """Record a latency in milliseconds."""
+        value_us = max(0, int(value_ms * 1000))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_us += value_us
+        self.max_us = max(self.max_us, value_us)
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+
+    def percentile(self, pct: float) -> float:
+        """Get the latency in milliseconds at a percentile."""
+        if not self.total:
+            return 0.0
+        target = max(1, math.ceil(pct / 100 * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._value(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram with the same precision."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean and percentiles in milliseconds."""
+        return {
+            "count": self.total,
+            "min": (self.min_us or 0) / 1000,
+            "mean": round(self.sum_us / self.total / 1000, 3) if self.total else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max_us / 1000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize histogram for transfer between processes."""
+        return {
+            "significant_digits": self.significant_digits,
+            "counts": self.counts,
+            "total": self.total,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "sum_us": self.sum_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Deserialize histogram."""
+        histogram = cls(data["significant_digits"])
+        histogram.counts = {int(k): v for k, v in data["counts"].items()}
+        histogram.total = data["total"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        histogram.sum_us = data["sum_us"]
+        return histogram
+
+
+class LoadProfile:
+    """Virtual user count and ramp-up, hold and ramp-down phases."""
+
+    def __init__(
+        self,
+        users: int = 10,
+        ramp_up: float = 10.0,
+        hold: float = 30.0,
+        ramp_down: float = 5.0,
+        contexts_per_browser: int = 5,
+        max_browsers: Optional[int] = None,
+        think_time_ms: int = 0
+    ):
+        """Initialize load profile."""
+        self.users = users
+        self.ramp_up = ramp_up
+        self.hold = hold
+        self.ramp_down = ramp_down
+        self.contexts_per_browser = contexts_per_browser
+        self.max_browsers = max_browsers or os.cpu_count() or 1
+        self.think_time_ms = think_time_ms
+
+    @property
+    def browsers(self) -> int:
+        """Get the number of browser processes needed."""
+        return math.ceil(self.users / self.contexts_per_browser)
+
+    @property
+    def duration(self) -> float:
+        """Get total duration in seconds."""
+        return self.ramp_up + self.hold + self.ramp_down
+
+    def validate(self) -> None:
+        """Check the profile fits into this machine's limits."""
+        if self.users < 1 or self.contexts_per_browser < 1:
+            raise ValueError("users and contexts_per_browser must be at least 1")
+        if self.browsers > self.max_browsers:
+            raise ValueError(
+                f"{self.users} users at {self.contexts_per_browser} contexts per browser "
+                f"need {self.browsers} browser processes, limit is {self.max_browsers}. "
+                "Raise --contexts-per-browser or --max-browsers."
+            )
+
+    def window(self, user: int) -> Tuple[float, float]:
+        """Get start and stop offsets in seconds for a virtual user."""
+        start = self.ramp_up * user / self.users
+        stop = self.ramp_up + self.hold + self.ramp_down * (user + 1) / self.users
+        return start, stop
+
+
+def todo_workflow(url: str) -> List[Tuple[str, Callable[[TodoPage], None]]]:
+    """Scripted TodoPage workflow executed by each virtual user per iteration."""
+    def open_app(todo_page: TodoPage) -> None:
+        todo_page.navigate(url, collect_metrics=False)
+        todo_page.wait_for_load_state()
+
+    return [
+        ("open", open_app),
+        ("add_todos", lambda p: p.add_multiple_todos(["Load task 1", "Load task 2"])),
+        ("complete_todo", lambda p: p.complete_todo("Load task 1")),
+        ("read_todos", lambda p: p.get_all_todos()),
+        ("clear_completed", lambda p: p.clear_completed()),
+        ("delete_todo", lambda p: p.delete_todo("Load task 2")),
+    ]
+
+
+class VirtualUser:
+    """One browser context running the workflow in a loop within its time window."""
+
+    def __init__(self, index: int, start_at: float, stop_at: float):
+        """Initialize virtual user."""
+        self.index = index
+        self.start_at = start_at
+        self.stop_at = stop_at
+        self.context = None
+        self.todo_page: Optional[TodoPage] = None
+        self.step = 0
+        self.next_step_at = start_at
+
+    def close(self) -> None:
+        """Close the browser context."""
+        if self.context:
+            self.context.close()
+            self.context = None
+
+
+def run_browser_process(
+    url: str,
+    browser_name: str,
+    headless: bool,
+    users: List[Tuple[int, float, float]],
+    think_time_ms: int,
+    significant_digits: int
+) -> Dict[str, Any]:
+    """Drive several virtual users from one browser process."""
+    from playwright.sync_api import sync_playwright
+
+    workflow = todo_workflow(url)
+    histograms = {name: LatencyHistogram(significant_digits) for name, _ in workflow}
+    errors: Dict[str, int] = {name: 0 for name, _ in workflow}
+    iterations = 0
+
+    origin = time.monotonic()
+    vus = [VirtualUser(i, origin + start, origin + stop) for i, start, stop in users]
+
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, browser_name).launch(headless=headless)
+        try:
+            while vus:
+                now = time.monotonic()
+                ran_step = False
+                for vu in list(vus):
+                    if now >= vu.stop_at:
+                        vu.close()
+                        vus.remove(vu)
+                        continue
+                    if now < vu.next_step_at:
+                        continue
+                    if vu.context is None:
+                        vu.context = browser.new_context()
+                        vu.todo_page = TodoPage(vu.context.new_page())
+
+                    name, action = workflow[vu.step]
+                    started = time.perf_counter()
+                    try:
+                        action(vu.todo_page)
+                        histograms[name].record((time.perf_counter() - started) * 1000)
+                        vu.step = (vu.step + 1) % len(workflow)
+                        iterations += vu.step == 0
+                    except Exception:
+                        errors[name] += 1
+                        # Restart the iteration from a fresh context
+                        vu.close()
+                        vu.step = 0
+                    vu.next_step_at = time.monotonic() + think_time_ms / 1000
+                    ran_step = True
+
+                if not ran_step and vus:
+                    wake_at = min(vu.next_step_at for vu in vus)
+                    time.sleep(min(0.05, max(0.0, wake_at - time.monotonic())))
+        finally:
+            for vu in vus:
+                vu.close()
+            browser.close()
+
+    return {
+        "histograms": {name: h.to_dict() for name, h in histograms.items()},
+        "errors": errors,
+        "iterations": iterations,
+    }
+
+
+class LoadRunner:
+    """Run a load profile across browser processes and aggregate the results."""
+
+    def __init__(
+        self,
+        url: str,
+        profile: LoadProfile,
+        browser_name: str = "chromium",
+        headless: bool = True,
+        significant_digits: int = 2
+    ):
+        """Initialize load runner."""
+        self.url = url
+        self.profile = profile
+        self.browser_name = browser_name
+        self.headless = headless
+        self.significant_digits = significant_digits
+
+    def plan(self) -> List[List[Tuple[int, float, float]]]:
+        """Assign virtual users to browser processes round-robin."""
+        groups: List[List[Tuple[int, float, float]]] = [[] for _ in range(self.profile.browsers)]
+        for user in range(self.profile.users):
+            start, stop = self.profile.window(user)
+            groups[user % len(groups)].append((user, start, stop))
+        return groups
+
+    def run(self) -> Dict[str, Any]:
+        """Run the load test and return the report."""
+        self.profile.validate()
+        groups = self.plan()
+
+        started = time.monotonic()
+        with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [
+                executor.submit(
+                    run_browser_process,
+                    self.url,
+                    self.browser_name,
+                    self.headless,
+                    group,
+                    self.profile.think_time_ms,
+                    self.significant_digits,
+                )
+                for group in groups
+            ]
+            results = [future.result() for future in futures]
+        elapsed = time.monotonic() - started
+
+        return self.build_report(results, elapsed)
+
+    def build_report(self, results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        """Merge per-process results into throughput, percentiles and error rates."""
+        merged: Dict[str, LatencyHistogram] = {}
+        errors: Dict[str, int] = {}
+        iterations = 0
+        for result in results:
+            iterations += result["iterations"]
+            for name, data in result["histograms"].items():
+                histogram = LatencyHistogram.from_dict(data)
+                if name in merged:
+                    merged[name].merge(histogram)
+                else:
+                    merged[name] = histogram
+            for name, count in result["errors"].items():
+                errors[name] = errors.get(name, 0) + count
+
+        steps = {}
+        for name, histogram in merged.items():
+            attempts = histogram.total + errors.get(name, 0)
+            steps[name] = {
+                **histogram.summary(),
+                "errors": errors.get(name, 0),
+                "error_rate": round(errors.get(name, 0) / attempts, 4) if attempts else 0.0,
+                "throughput_per_s": round(histogram.total / elapsed, 3) if elapsed else 0.0,
+            }
+
+        total_ok = sum(h.total for h in merged.values())
+        total_errors = sum(errors.values())
+        return {
+            "url": self.url,
+            "browser": self.browser_name,
+            "users": self.profile.users,
+            "browser_processes": self.profile.browsers,
+            "contexts_per_browser": self.profile.contexts_per_browser,
+            "duration_s": round(elapsed, 2),
+            "iterations": iterations,
+            "iterations_per_s": round(iterations / elapsed, 3) if elapsed else 0.0,
+            "steps_per_s": round(total_ok / elapsed, 3) if elapsed else 0.0,
+            "error_rate": round(total_errors / (total_ok + total_errors), 4)
+            if total_ok + total_errors else 0.0,
+            "steps": steps,
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Browser-level load test with TodoPage VUs")
+    parser.add_argument("--url", default=None,
+                        help="App URL; defaults to a local server with the bundled TodoMVC")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--contexts-per-browser", type=int, default=5,
+                        help="Browser contexts hosted by one browser process")
+    parser.add_argument("--max-browsers", type=int, default=None,
+                        help="Upper limit of browser processes (default: CPU count)")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Ramp-up seconds")
+    parser.add_argument("--hold", type=float, default=30.0, help="Hold seconds")
+    parser.add_argument("--ramp-down", type=float, default=5.0, help="Ramp-down seconds")
+    parser.add_argument("--think-time", type=int, default=0, help="Pause between steps in ms")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true", help="Run browsers headed")
+    parser.add_argument("--output", type=Path, default=Path("reports/load_report.json"))
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(
+        users=args.users,
+        ramp_up=args.ramp_up,
+        hold=args.hold,
+        ramp_down=args.ramp_down,
+        contexts_per_browser=args.contexts_per_browser,
+        max_browsers=args.max_browsers,
+        think_time_ms=args.think_time,
+    )
+
+    server = None
+    url = args.url
+    if url is None:
+        server = StaticServer(TODOMVC_DIR).start()
+        url = f"{server.url}/index.html"
+
+    try:
+        report = LoadRunner(url, profile, args.browser, headless=not args.headed).run()
+    finally:
+        if server:
+            server.stop()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""Threaded local static HTTP server used as a stand-in for the app under test."""
+
+import threading
+import time
+from fnmatch import fnmatch
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+
+# Vendored TodoMVC app served for offline runs
+TODOMVC_DIR = Path(__file__).parent / "todomvc"
+
+
+class _StaticRequestHandler(SimpleHTTPRequestHandler):
+    """Request handler that injects per-route latency and stays quiet."""
+
+    def __init__(self, *args, latency: Dict[str, int], **kwargs):
+        """Initialize request handler."""
+        self.latency = latency
+        super().__init__(*args, **kwargs)
+
+    def _delay(self) -> None:
+        """Sleep for the latency configured for the request path."""
+        path = self.path.split("?")[0]
+        for pattern, delay_ms in list(self.latency.items()):
+            if fnmatch(path, pattern):
+                time.sleep(delay_ms / 1000)
+                return
+
+    def do_GET(self) -> None:
+        """Serve GET with injected latency."""
+        self._delay()
+        super().do_GET()
+
+    def do_HEAD(self) -> None:
+        """Serve HEAD with injected latency."""
+        self._delay()
+        super().do_HEAD()
+
+    def end_headers(self) -> None:
+        """Disable caching so every navigation hits the server."""
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        """Suppress per-request logging."""
+
+
+class StaticServer:
+    """Serve a directory over HTTP on an ephemeral port in a background thread."""
+
+    def __init__(
+        self,
+        directory: Path = TODOMVC_DIR,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Optional[Dict[str, int]] = None
+    ):
+        """Initialize static server."""
+        self.directory = Path(directory)
+        self.host = host
+        self.port = port
+        self.latency: Dict[str, int] = dict(latency or {})
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get server base URL."""
+        return f"http://{self.host}:{self.port}"
+
+    def set_latency(self, route: str, delay_ms: int) -> None:
+        """Inject latency in milliseconds for paths matching a glob pattern."""
+        self.latency[route] = delay_ms
+
+    def remove_latency(self, route: str) -> None:
+        """Remove latency injected for a route pattern."""
+        self.latency.pop(route, None)
+
+    def clear_latency(self) -> None:
+        """Remove all injected latency."""
+        self.latency.clear()
+
+    def start(self) -> "StaticServer":
+        """Start serving in a daemon thread."""
+        handler = partial(
+            _StaticRequestHandler, directory=str(self.directory), latency=self.latency
+        )
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StaticServer":
+        """Start server on context entry."""
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        """Stop server on context exit."""
+        self.stop()
+
+
+class StaticServerClient:
+    """Handle to a StaticServer running in another process; only its URL is known."""
+
+    def __init__(self, url: str):
+        """Initialize static server client."""
+        self.url = url.rstrip("/")
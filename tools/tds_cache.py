@@ -0,0 +1,210 @@
+"""TTL/LRU cache for Test Data Service read calls.
+
+Responses are kept per data type in an in-memory LRU and, optionally, in a
+disk tier shared by xdist workers. Each data type has a generation: with the
+disk tier it is the mtime of a file that invalidation touches under the
+type's lock, so a write in one worker drops the type's entries from every
+worker's memory tier on their next lookup.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: disk tier writes are not serialized
+    fcntl = None
+
+
+# Returned by TDSCache.get when nothing is cached; None is a valid response
+MISSING = object()
+
+
+@contextmanager
+def _locked(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive lock file for the duration of the block."""
+    with open(lock_path, "a") as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def cache_key(params: Optional[Mapping[str, Any]]) -> str:
+    """Get a stable key for request parameters."""
+    return json.dumps(dict(params or {}), sort_keys=True, default=str)
+
+
+class TDSCache:
+    """Cache TDS read responses by data type and parameters."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 60.0,
+        disk_dir: Optional[Path] = None
+    ):
+        """Initialize TDS cache."""
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+        # (data type, key) -> (expires at, generation, encoded response)
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, int, str]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def ttl(self, data_type: str) -> float:
+        """Get the time to live of a data type's entries in seconds."""
+        return self.ttls.get(data_type, self.default_ttl)
+
+    def _count(self, data_type: str, event: str) -> None:
+        """Count a cache event per data type."""
+        stats = self.stats.setdefault(
+            data_type, {"hits": 0, "disk_hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+        )
+        stats[event] += 1
+
+    def _type_dir(self, data_type: str) -> Path:
+        """Get the disk tier directory of a data type."""
+        return self.disk_dir / hashlib.sha1(data_type.encode()).hexdigest()[:12]
+
+    def generation(self, data_type: str) -> int:
+        """Get the generation of a data type, changed by every invalidation.
+
+        Take it before fetching and pass it to ``put`` so a response fetched
+        before a concurrent write is not cached after it.
+        """
+        if not self.disk_dir:
+            return self._generations.get(data_type, 0)
+        try:
+            return (self._type_dir(data_type) / "generation").stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def get(self, data_type: str, params: Optional[Mapping[str, Any]] = None) -> Any:
+        """Get a cached response, or MISSING."""
+        key = cache_key(params)
+        generation = self.generation(data_type)
+        with self._lock:
+            entry = self._memory.get((data_type, key))
+            if entry is not None:
+                expires_at, entry_generation, encoded = entry
+                if expires_at > time.time() and entry_generation == generation:
+                    self._memory.move_to_end((data_type, key))
+                    self._count(data_type, "hits")
+                    return json.loads(encoded)
+                del self._memory[(data_type, key)]
+
+        if self.disk_dir:
+            path = self._type_dir(data_type) / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+            try:
+                with open(path) as f:
+                    expires_at, entry_generation, encoded = json.load(f)
+            except (FileNotFoundError, ValueError):
+                expires_at = 0
+            if expires_at > time.time() and entry_generation == generation:
+                self._remember(data_type, key, expires_at, generation, encoded)
+                with self._lock:
+                    self._count(data_type, "disk_hits")
+                return json.loads(encoded)
+
+        with self._lock:
+            self._count(data_type, "misses")
+        return MISSING
+
+    def _remember(self, data_type: str, key: str, expires_at: float, generation: int, encoded: str) -> None:
+        """Store an entry in the memory tier, evicting the least recently used."""
+        with self._lock:
+            self._memory[(data_type, key)] = (expires_at, generation, encoded)
+            self._memory.move_to_end((data_type, key))
+            while len(self._memory) > self.max_entries:
+                (evicted_type, _), _ = self._memory.popitem(last=False)
+                self._count(evicted_type, "evictions")
+
+    def put(
+        self,
+        data_type: str,
+        params: Optional[Mapping[str, Any]],
+        value: Any,
+        generation: Optional[int] = None
+    ) -> None:
+        """Cache a response for its data type's TTL unless the type changed since generation."""
+        ttl = self.ttl(data_type)
+        if ttl <= 0:
+            return
+        key = cache_key(params)
+        encoded = json.dumps(value)
+        expires_at = time.time() + ttl
+
+        if not self.disk_dir:
+            current = self.generation(data_type)
+            if generation is None or generation == current:
+                self._remember(data_type, key, expires_at, current, encoded)
+            return
+
+        type_dir = self._type_dir(data_type)
+        type_dir.mkdir(exist_ok=True)
+        with _locked(type_dir / "lock"):
+            current = self.generation(data_type)
+            if generation is not None and generation != current:
+                return
+            path = type_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+            tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump([expires_at, current, encoded], f)
+            os.replace(tmp_path, path)
+        self._remember(data_type, key, expires_at, current, encoded)
+
+    def invalidate(self, data_type: str) -> None:
+        """Drop all cached responses of a data type in every tier and worker."""
+        with self._lock:
+            for entry_key in [k for k in self._memory if k[0] == data_type]:
+                del self._memory[entry_key]
+            self._generations[data_type] = self._generations.get(data_type, 0) + 1
+            self._count(data_type, "invalidations")
+        if not self.disk_dir:
+            return
+
+        type_dir = self._type_dir(data_type)
+        type_dir.mkdir(exist_ok=True)
+        with _locked(type_dir / "lock"):
+            generation_path = type_dir / "generation"
+            previous = self.generation(data_type)
+            generation_path.touch()
+            # A new generation even within the filesystem's timestamp resolution
+            new = max(previous + 1, time.time_ns())
+            os.utime(generation_path, ns=(new, new))
+            for path in type_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir:
+            for path in self.disk_dir.glob("*/*.json"):
+                path.unlink(missing_ok=True)
+
+
+def merge_stats(total: Dict[str, Dict[str, int]], stats: Mapping[str, Mapping[str, int]]) -> Dict[str, Dict[str, int]]:
+    """Add per-type cache stats of one process to a total."""
+    for data_type, counts in stats.items():
+        merged = total.setdefault(data_type, {})
+        for event, count in counts.items():
+            merged[event] = merged.get(event, 0) + count
+    return total
@@ -0,0 +1,272 @@
+"""Lease-based locking of Test Data Service records.
+
+Records are locked with a TTL so the service frees them on its own when a
+worker dies. A heartbeat thread renews live leases well before they expire,
+and every lease still held is released when the manager stops: in fixture
+teardown, at session end, on SIGTERM and at interpreter exit.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import signal
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from tools.test_data_service import BatchError, TestDataServiceClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseError(RuntimeError):
+    """Raised when a record cannot be leased."""
+
+
+def _refused(error: Exception) -> bool:
+    """Check if the service answered a lock request with a refusal, not an outage."""
+    if isinstance(error, BatchError):
+        return True
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return status is not None and status < 500
+
+
+class Lease:
+    """A TDS record locked by this worker until released or expired."""
+
+    def __init__(self, data_type: str, data_id: str, record: Optional[Mapping[str, Any]] = None):
+        """Initialize lease."""
+        self.data_type = data_type
+        self.data_id = str(data_id)
+        self.record = record
+        self.renewed_at = time.monotonic()
+        self.lost = False
+
+    def __repr__(self) -> str:
+        """Describe the lease."""
+        state = "lost" if self.lost else "held"
+        return f"Lease({self.data_type}/{self.data_id}, {state})"
+
+
+class LeaseManager:
+    """Take TTL leases on TDS records and keep them alive with a heartbeat.
+
+    All leases of a manager share one lock id, so renewals and releases are
+    batched per data type.
+    """
+
+    def __init__(
+        self,
+        client: TestDataServiceClient,
+        ttl: float = 60.0,
+        heartbeat_interval: Optional[float] = None,
+        owner: Optional[str] = None
+    ):
+        """Initialize lease manager."""
+        self.client = client
+        self.ttl = ttl
+        self.heartbeat_interval = heartbeat_interval or ttl / 3
+        owner = owner or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.lock_id = f"{owner}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self.leases: Dict[Tuple[str, str], Lease] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous_sigterm: Any = None
+
+    def start(self) -> "LeaseManager":
+        """Start the heartbeat and release leases on exit or SIGTERM."""
+        self._thread = threading.Thread(target=self._heartbeat, name="tds-lease-heartbeat", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+        if threading.current_thread() is threading.main_thread():
+            self._previous_sigterm = signal.getsignal(signal.SIGTERM)
+            if self._previous_sigterm in (signal.SIG_DFL, None):
+                signal.signal(signal.SIGTERM, self._on_sigterm)
+        return self
+
+    def _on_sigterm(self, signum, frame) -> None:
+        """Interrupt the run so teardown and session end release leases."""
+        raise KeyboardInterrupt(f"signal {signum}")
+
+    def acquire(self, data_type: str, data_id: str, record: Optional[Mapping[str, Any]] = None) -> Lease:
+        """Lease one record."""
+        try:
+            self.client.lock_data(data_type, str(data_id), self.lock_id, ttl=self.ttl)
+        except Exception as e:
+            raise LeaseError(f"Cannot lease {data_type}/{data_id}: {e}") from e
+        return self._track(Lease(data_type, data_id, record))
+
+    def acquire_many(
+        self,
+        data_type: str,
+        data_ids: Sequence[str],
+        records: Optional[Sequence[Mapping[str, Any]]] = None
+    ) -> List[Lease]:
+        """Lease every record that is free, skipping ones held elsewhere."""
+        result = self.client.lock_many(data_type, [str(i) for i in data_ids], self.lock_id, ttl=self.ttl)
+        leases = []
+        for index, (_, error) in enumerate(result):
+            if error is None:
+                record = records[index] if records is not None else None
+                leases.append(self._track(Lease(data_type, data_ids[index], record)))
+        return leases
+
+    def _track(self, lease: Lease) -> Lease:
+        """Register a lease for renewal and release."""
+        with self._lock:
+            self.leases[(lease.data_type, lease.data_id)] = lease
+        return lease
+
+    def _grouped(self, leases: Sequence[Lease]) -> Dict[str, List[Lease]]:
+        """Group leases by data type."""
+        groups: Dict[str, List[Lease]] = {}
+        for lease in leases:
+            groups.setdefault(lease.data_type, []).append(lease)
+        return groups
+
+    def renew(self) -> None:
+        """Extend all live leases.
+
+        A lease is lost when the service refuses the renewal, or when it could
+        not be reached for a whole TTL.
+        """
+        with self._lock:
+            live = [lease for lease in self.leases.values() if not lease.lost]
+        for data_type, leases in self._grouped(live).items():
+            try:
+                result = self.client.lock_many(
+                    data_type, [lease.data_id for lease in leases], self.lock_id, ttl=self.ttl
+                )
+                errors = result.errors
+            except Exception as e:
+                errors = {index: e for index in range(len(leases))}
+            now = time.monotonic()
+            for index, lease in enumerate(leases):
+                if index not in errors:
+                    lease.renewed_at = now
+                elif _refused(errors[index]) or now - lease.renewed_at >= self.ttl:
+                    lease.lost = True
+                    logger.warning("Lost lease on %s/%s: %s", data_type, lease.data_id, errors[index])
+
+    def _heartbeat(self) -> None:
+        """Renew leases until stopped."""
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.renew()
+            except Exception:
+                logger.exception("TDS lease heartbeat failed")
+
+    def release(self, lease: Lease) -> None:
+        """Release one lease."""
+        self.release_many([lease])
+
+    def release_many(self, leases: Sequence[Lease]) -> None:
+        """Release leases, logging records the service failed to release."""
+        with self._lock:
+            for lease in leases:
+                self.leases.pop((lease.data_type, lease.data_id), None)
+        for data_type, group in self._grouped(leases).items():
+            try:
+                result = self.client.release_many(data_type, [lease.data_id for lease in group], self.lock_id)
+                for index, error in result.errors.items():
+                    logger.warning("Cannot release %s/%s: %s", data_type, group[index].data_id, error)
+            except Exception as e:
+                logger.warning("Cannot release %d %s leases: %s", len(group), data_type, e)
+
+    def release_all(self) -> None:
+        """Release every lease still held."""
+        with self._lock:
+            leases = list(self.leases.values())
+        if leases:
+            self.release_many(leases)
+
+    def stop(self) -> None:
+        """Stop the heartbeat and release every lease."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.heartbeat_interval + 5)
+        self.release_all()
+        atexit.unregister(self.stop)
+        if signal.getsignal(signal.SIGTERM) == self._on_sigterm and \
+                threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._previous_sigterm or signal.SIG_DFL)
+
+
+class LeasePool:
+    """Per-worker pool of pre-leased records of one data type.
+
+    Records are leased in batches from ``get_data(data_type, filters)`` and
+    handed to tests instantly; returned leases stay locked for the next test.
+    """
+
+    def __init__(
+        self,
+        manager: LeaseManager,
+        data_type: str,
+        size: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        id_field: str = "id"
+    ):
+        """Initialize lease pool."""
+        self.manager = manager
+        self.data_type = data_type
+        self.size = size
+        self.filters = filters
+        self.id_field = id_field
+        self._available: "queue.Queue[Lease]" = queue.Queue()
+        self._fill_lock = threading.Lock()
+
+    def fill(self) -> int:
+        """Lease free records until the pool holds its size; return how many were added."""
+        with self._fill_lock:
+            missing = self.size - self._available.qsize()
+            if missing <= 0:
+                return 0
+            held = {data_id for data_type, data_id in self.manager.leases if data_type == self.data_type}
+            candidates = [
+                record for record in self.manager.client.get_data(self.data_type, self.filters)
+                if str(record.get(self.id_field)) not in held
+            ]
+            added = 0
+            # Lease a few more than missing per round: some candidates are locked elsewhere
+            while candidates and added < missing:
+                batch, candidates = candidates[:missing * 2], candidates[missing * 2:]
+                leases = self.manager.acquire_many(
+                    self.data_type, [record[self.id_field] for record in batch], batch
+                )
+                for lease in leases:
+                    if added < missing:
+                        self._available.put(lease)
+                        added += 1
+                    else:
+                        self.manager.release(lease)
+            return added
+
+    def checkout(self, timeout: float = 30.0) -> Lease:
+        """Take a leased record, leasing more when the pool is empty."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                lease = self._available.get_nowait()
+            except queue.Empty as e:
+                if not self.fill():
+                    if time.monotonic() >= deadline:
+                        raise LeaseError(f"No free {self.data_type} records to lease") from e
+                    time.sleep(min(1.0, self.manager.heartbeat_interval))
+                continue
+            if not lease.lost:
+                return lease
+            self.manager.release(lease)
+
+    def checkin(self, lease: Lease) -> None:
+        """Return a lease to the pool for the next test."""
+        if lease.lost:
+            self.manager.release(lease)
+        else:
+            self._available.put(lease)
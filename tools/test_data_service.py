@@ -1,49 +1,337 @@
 """Test Data Service (TDS) client for managing test data."""
 
-import requests
-from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Any, Iterator, Optional, List, Sequence, Tuple
 
-from configs import get_settings
+from configs import get_config_loader, get_settings
+from tools.data_generator import DataGenerator  # noqa: F401 - kept importable from here
+from tools.tds_cache import MISSING, TDSCache
+from tools.web_metrics import percentile
+
+
+logger = logging.getLogger(__name__)
+
+# Methods that are safe to repeat after a connection error or 5xx response
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when TDS calls are short-circuited after repeated failures."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing service until a cool-down has passed."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize circuit breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        # Start of the half-open trial call, None while no trial is in flight
+        self._trial_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get breaker state: closed, open or half-open."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Check if a call may go through; half-open lets a single trial call pass.
+
+        A trial that never reports back, e.g. because it raised an unexpected
+        error, is given up after another reset_timeout so the next caller can try.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_timeout:
+                return False
+            if self._trial_started is not None and now - self._trial_started < self.reset_timeout:
+                return False
+            self._trial_started = now
+            return True
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the breaker at the threshold."""
+        with self._lock:
+            self._trial_started = None
+            self.failures += 1
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+
+
+class BatchError(RuntimeError):
+    """Raised when items of a batch call failed."""
+
+
+class BatchResult:
+    """Per-item outcome of a batch call, in input order."""
+
+    def __init__(self, size: int):
+        """Initialize batch result."""
+        self.values: List[Any] = [None] * size
+        self.errors: Dict[int, Exception] = {}
+
+    def set(self, index: int, value: Any) -> None:
+        """Record a successful item."""
+        self.values[index] = value
+
+    def fail(self, index: int, error: Exception) -> None:
+        """Record a failed item."""
+        self.errors[index] = error
+
+    @property
+    def ok(self) -> bool:
+        """Check if every item succeeded."""
+        return not self.errors
+
+    @property
+    def succeeded(self) -> List[Any]:
+        """Get values of successful items."""
+        return [value for i, value in enumerate(self.values) if i not in self.errors]
+
+    def __len__(self) -> int:
+        """Get number of items."""
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Optional[Exception]]]:
+        """Iterate (value, error) per item."""
+        return ((value, self.errors.get(i)) for i, value in enumerate(self.values))
+
+    def raise_for_errors(self) -> "BatchResult":
+        """Raise BatchError if any item failed."""
+        if self.errors:
+            index, error = next(iter(self.errors.items()))
+            raise BatchError(f"{len(self.errors)}/{len(self)} items failed, first at {index}: {error}")
+        return self
 
 
 class TestDataServiceClient:
-    """Client for Test Data Service API."""
+    """Client for Test Data Service API.
+
+    Connections are pooled per host and sized to the xdist worker count.
+    Idempotent calls are retried on connection errors and retryable statuses,
+    any call is retried on 429, with exponential backoff and full jitter.
+    Repeated failures open a circuit breaker so tests fail fast while TDS is
+    down. Latency per endpoint is kept in ``metrics`` and, when a structured
+    logger is given, logged for every call.
+
+    ``get_data`` responses are cached per data type (see TDSCache) and
+    invalidated by writes to that type through this client.
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    Batch calls use the bulk endpoints the service lists at ``/capabilities``
+    and otherwise fan out single calls over the pool.
+    """
+
+    GENERATED_KINDS = ("user", "address", "payment")
+
+    __test__ = False
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        structured_logger: Any = None,
+        cache: Optional[TDSCache] = None
+    ):
         """Initialize TDS client."""
         settings = get_settings()
-        self.base_url = base_url or settings.tds_base_url
+        tds_config = get_config_loader().get("test_data_service", {})
+        retry_config = tds_config.get("retries", {})
+        breaker_config = tds_config.get("circuit_breaker", {})
+
+        self.base_url = (base_url or settings.tds_base_url).rstrip("/")
         self.api_key = api_key or settings.tds_api_key
         self.timeout = settings.tds_timeout
-        
+        self.max_retries = max_retries if max_retries is not None else retry_config.get("total", 3)
+        self.backoff = backoff if backoff is not None else retry_config.get("backoff", 0.2)
+        self.max_backoff = retry_config.get("max_backoff", 5.0)
+        self.retry_statuses = set(retry_config.get("statuses", [429, 500, 502, 503, 504]))
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            breaker_config.get("failure_threshold", 5),
+            breaker_config.get("reset_timeout", 30.0),
+        )
+        self.structured_logger = structured_logger
+        batch_config = tds_config.get("batch", {})
+        self.batch_size = batch_config.get("size", 100)
+        self.fan_out = batch_config.get("fan_out", 8)
+        self._capabilities: Optional[set] = None
+        self.cache = cache if cache is not None else self._default_cache(tds_config.get("cache", {}))
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self._metrics_lock = threading.Lock()
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        workers = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", settings.parallel_workers))
+        self.pool_size = pool_size or tds_config.get("pool_size") or max(10, workers)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, max_retries=0)
+
         self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if self.api_key:
             self.session.headers.update({"X-API-Key": self.api_key})
 
+    @staticmethod
+    def _default_cache(cache_config: Dict[str, Any]) -> Optional[TDSCache]:
+        """Build the read cache configured under test_data_service.cache."""
+        if not cache_config.get("enabled", True):
+            return None
+        disk_dir = None
+        if cache_config.get("disk", False):
+            disk_dir = Path(get_settings().artifacts_path) / "tds_cache"
+        return TDSCache(
+            max_entries=cache_config.get("max_entries", 512),
+            ttls=cache_config.get("ttl", {}),
+            default_ttl=cache_config.get("default_ttl", 60),
+            disk_dir=disk_dir,
+        )
+
+    def _url(self, endpoint: str) -> str:
+        """Join the base URL and an endpoint without dropping the base path."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _sleep_before_retry(self, attempt: int, response: Any = None) -> None:
+        """Wait with exponential backoff and full jitter, honouring Retry-After."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(float(retry_after), self.max_backoff))
+        time.sleep(delay)
+
+    def _should_retry(self, method: str, status: Optional[int]) -> bool:
+        """Check if a failed attempt may be repeated."""
+        if status == 429:
+            return True
+        if method not in IDEMPOTENT_METHODS:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def _record(self, label: str, status: Optional[int], duration_ms: float, attempts: int) -> None:
+        """Record latency of a call per endpoint and log it."""
+        with self._metrics_lock:
+            stats = self.metrics.setdefault(
+                label, {"calls": 0, "errors": 0, "retries": 0, "latency_ms": []}
+            )
+            stats["calls"] += 1
+            stats["retries"] += attempts - 1
+            stats["latency_ms"].append(duration_ms)
+            if status is None or status >= 400:
+                stats["errors"] += 1
+        if self.structured_logger:
+            self.structured_logger.log_tds_request(label, {
+                "status": status,
+                "duration_ms": round(duration_ms, 2),
+                "attempts": attempts,
+            })
+
+    def latency_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Summarize calls, errors, retries and latency percentiles per endpoint."""
+        with self._metrics_lock:
+            return {
+                label: {
+                    "calls": stats["calls"],
+                    "errors": stats["errors"],
+                    "retries": stats["retries"],
+                    "p50_ms": round(percentile(stats["latency_ms"], 50), 2),
+                    "p95_ms": round(percentile(stats["latency_ms"], 95), 2),
+                    "max_ms": round(max(stats["latency_ms"]), 2),
+                }
+                for label, stats in self.metrics.items()
+            }
+
     def _request(
         self, 
         method: str, 
         endpoint: str, 
         data: Optional[Dict] = None,
-        params: Optional[Dict] = None
+        params: Optional[Dict] = None,
+        label: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Make HTTP request to TDS API."""
-        url = urljoin(self.base_url, endpoint)
-        
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout
+        """Make HTTP request to TDS API with retries and the circuit breaker."""
+        import requests
+
+        label = f"{method} {label or endpoint}"
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(
+                f"TDS circuit is open after {self.circuit_breaker.failures} failures, "
+                f"retrying in up to {self.circuit_breaker.reset_timeout}s"
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            print(f"TDS request failed: {e}")
-            raise
+
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            response = None
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=self._url(endpoint),
+                    json=data,
+                    params=params,
+                    timeout=self.timeout
+                )
+                if response.status_code not in self.retry_statuses:
+                    response.raise_for_status()
+                    self.circuit_breaker.record_success()
+                    duration_ms = (time.perf_counter() - started) * 1000
+                    self._record(label, response.status_code, duration_ms, attempt + 1)
+                    return response.json() if response.content else {}
+                error: Exception = requests.HTTPError(
+                    f"{response.status_code} from {method} {endpoint}", response=response
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except requests.HTTPError:
+                # Client errors are the caller's fault, not a TDS outage
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+                self._record(label, response.status_code, (time.perf_counter() - started) * 1000, attempt + 1)
+                raise
+
+            status = response.status_code if response is not None else None
+            if attempt < self.max_retries and self._should_retry(method, status):
+                logger.warning(
+                    "TDS %s failed (%s), retry %d/%d", label, error, attempt + 1, self.max_retries
+                )
+                self._sleep_before_retry(attempt, response)
+                attempt += 1
+                continue
+
+            self.circuit_breaker.record_failure()
+            self._record(label, status, (time.perf_counter() - started) * 1000, attempt + 1)
+            logger.error("TDS %s failed after %d attempts: %s", label, attempt + 1, error)
+            raise error
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
 
     def generate_user(self, profile: str = "default") -> Dict[str, Any]:
         """Generate synthetic user data."""
@@ -57,12 +345,22 @@ class TestDataServiceClient:
         """Generate synthetic payment data."""
         return self._request("POST", "/data/payment", data={"card_type": card_type})
 
-    def lock_data(self, data_type: str, data_id: str, lock_id: str) -> Dict[str, Any]:
-        """Lock a data record for exclusive use."""
+    def lock_data(
+        self, data_type: str, data_id: str, lock_id: str, ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Lock a data record for exclusive use.
+
+        With a ttl the lock is a lease the service drops after ttl seconds;
+        locking again with the same lock_id renews it.
+        """
+        payload: Dict[str, Any] = {"lock_id": lock_id}
+        if ttl is not None:
+            payload["ttl"] = ttl
         return self._request(
             "POST",
             f"/data/{data_type}/{data_id}/lock",
-            data={"lock_id": lock_id}
+            data=payload,
+            label=f"/data/{data_type}/{{id}}/lock"
         )
 
     def release_data(self, data_type: str, data_id: str, lock_id: str) -> Dict[str, Any]:
@@ -70,69 +368,143 @@ class TestDataServiceClient:
         return self._request(
             "POST",
             f"/data/{data_type}/{data_id}/release",
-            data={"lock_id": lock_id}
+            data={"lock_id": lock_id},
+            label=f"/data/{data_type}/{{id}}/release"
         )
 
     def get_data(self, data_type: str, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
-        """Get data records with optional filters."""
-        return self._request("GET", f"/data/{data_type}", params=filters)
+        """Get data records with optional filters, served from the cache when fresh."""
+        if self.cache is None:
+            return self._request("GET", f"/data/{data_type}", params=filters)
+
+        cached = self.cache.get(data_type, filters)
+        if cached is not MISSING:
+            return cached
+        generation = self.cache.generation(data_type)
+        records = self._request("GET", f"/data/{data_type}", params=filters)
+        self.cache.put(data_type, filters, records, generation)
+        return records
+
+    def _write(self, data_type: str, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        """Make a request that changes data, invalidating cached reads of the type."""
+        try:
+            return self._request(method, endpoint, **kwargs)
+        finally:
+            # Also on failure: a timed out write may still have been applied
+            if self.cache is not None:
+                self.cache.invalidate(data_type)
 
     def create_data(self, data_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new data record."""
-        return self._request("POST", f"/data/{data_type}", data=data)
+        return self._write(data_type, "POST", f"/data/{data_type}", data=data)
 
     def update_data(self, data_type: str, data_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update existing data record."""
-        return self._request("PUT", f"/data/{data_type}/{data_id}", data=data)
+        return self._write(
+            data_type, "PUT", f"/data/{data_type}/{data_id}", data=data, label=f"/data/{data_type}/{{id}}"
+        )
 
     def delete_data(self, data_type: str, data_id: str) -> Dict[str, Any]:
         """Delete data record."""
-        return self._request("DELETE", f"/data/{data_type}/{data_id}")
-
-
-class DataGenerator:
-    """Helper class for generating synthetic test data using Faker."""
-
-    def __init__(self):
-        """Initialize data generator."""
-        from faker import Faker
-        self.fake = Faker()
-
-    def generate_user(self) -> Dict[str, Any]:
-        """Generate user data."""
-        return {
-            "first_name": self.fake.first_name(),
-            "last_name": self.fake.last_name(),
-            "email": self.fake.email(),
-            "phone": self.fake.phone_number(),
-            "username": self.fake.user_name(),
-            "password": self.fake.password(length=12),
-        }
-
-    def generate_address(self) -> Dict[str, Any]:
-        """Generate address data."""
-        return {
-            "street": self.fake.street_address(),
-            "city": self.fake.city(),
-            "state": self.fake.state(),
-            "postal_code": self.fake.postcode(),
-            "country": self.fake.country_code(),
-        }
-
-    def generate_company(self) -> Dict[str, Any]:
-        """Generate company data."""
-        return {
-            "name": self.fake.company(),
-            "email": self.fake.company_email(),
-            "phone": self.fake.phone_number(),
-            "website": self.fake.url(),
-        }
-
-    def generate_credit_card(self) -> Dict[str, Any]:
-        """Generate credit card data."""
-        return {
-            "number": self.fake.credit_card_number(),
-            "provider": self.fake.credit_card_provider(),
-            "expire": self.fake.credit_card_expire(),
-            "cvv": self.fake.credit_card_security_code(),
-        }
+        return self._write(
+            data_type, "DELETE", f"/data/{data_type}/{data_id}", label=f"/data/{data_type}/{{id}}"
+        )
+
+    def capabilities(self) -> set:
+        """Get the bulk operations the service advertises, fetched once."""
+        if self._capabilities is None:
+            import requests
+
+            try:
+                advertised = self._request("GET", "/capabilities").get("bulk", [])
+            except (requests.RequestException, CircuitOpenError) as e:
+                logger.info("TDS capabilities unavailable (%s), batching by fan-out", e)
+                advertised = []
+            self._capabilities = set(advertised)
+        return self._capabilities
+
+    def _fan_out(self, call: Callable[[Any], Any], items: Sequence[Any]) -> BatchResult:
+        """Run a single-item call for every item concurrently."""
+        result = BatchResult(len(items))
+        if not items:
+            return result
+        workers = max(1, min(len(items), self.fan_out, self.pool_size))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tds-batch") as executor:
+            futures = [executor.submit(call, item) for item in items]
+            for index, future in enumerate(futures):
+                try:
+                    result.set(index, future.result())
+                except Exception as e:
+                    result.fail(index, e)
+        return result
+
+    def _bulk(self, endpoint: str, items: Sequence[Any], payload: Callable[[Sequence[Any]], Dict]) -> BatchResult:
+        """Send items to a bulk endpoint in chunks and collect per-item results.
+
+        The service answers ``{"results": [{"ok": true, "data": ...} or
+        {"ok": false, "error": "..."}]}`` in request order.
+        """
+        result = BatchResult(len(items))
+        for start in range(0, len(items), self.batch_size):
+            chunk = items[start:start + self.batch_size]
+            try:
+                response = self._request("POST", endpoint, data=payload(chunk))
+            except Exception as e:
+                for index in range(start, start + len(chunk)):
+                    result.fail(index, e)
+                continue
+            entries = response.get("results", []) if isinstance(response, dict) else response
+            for offset in range(len(chunk)):
+                entry = entries[offset] if offset < len(entries) else {"ok": False, "error": "missing result"}
+                if isinstance(entry, dict) and "ok" in entry:
+                    if entry["ok"]:
+                        result.set(start + offset, entry.get("data"))
+                    else:
+                        result.fail(start + offset, BatchError(entry.get("error", "failed")))
+                else:
+                    result.set(start + offset, entry)
+        return result
+
+    def create_many(self, data_type: str, records: Sequence[Dict[str, Any]]) -> BatchResult:
+        """Create many data records."""
+        records = list(records)
+        if "create" in self.capabilities():
+            try:
+                return self._bulk(f"/data/{data_type}/bulk", records, lambda chunk: {"records": chunk})
+            finally:
+                if self.cache is not None:
+                    self.cache.invalidate(data_type)
+        return self._fan_out(lambda record: self.create_data(data_type, record), records)
+
+    def lock_many(
+        self, data_type: str, data_ids: Sequence[str], lock_id: str, ttl: Optional[float] = None
+    ) -> BatchResult:
+        """Lock many data records for exclusive use."""
+        data_ids = list(data_ids)
+        if "lock" in self.capabilities():
+            extra = {"ttl": ttl} if ttl is not None else {}
+            return self._bulk(
+                f"/data/{data_type}/lock", data_ids, lambda chunk: {"ids": chunk, "lock_id": lock_id, **extra}
+            )
+        return self._fan_out(lambda data_id: self.lock_data(data_type, data_id, lock_id, ttl), data_ids)
+
+    def release_many(self, data_type: str, data_ids: Sequence[str], lock_id: str) -> BatchResult:
+        """Release many locked data records."""
+        data_ids = list(data_ids)
+        if "release" in self.capabilities():
+            return self._bulk(
+                f"/data/{data_type}/release", data_ids, lambda chunk: {"ids": chunk, "lock_id": lock_id}
+            )
+        return self._fan_out(lambda data_id: self.release_data(data_type, data_id, lock_id), data_ids)
+
+    def generate_many(self, kind: str, n: int, **params: Any) -> BatchResult:
+        """Generate n synthetic records of a kind: user, address or payment."""
+        if kind not in self.GENERATED_KINDS:
+            raise ValueError(f"Unknown data kind '{kind}', expected one of {', '.join(self.GENERATED_KINDS)}")
+        if "generate" in self.capabilities():
+            return self._bulk(
+                f"/data/{kind}/generate", [None] * n, lambda chunk: {"count": len(chunk), **params}
+            )
+        generate = getattr(self, f"generate_{kind}")
+        return self._fan_out(lambda _: generate(**params), [None] * n)
+
@@ -0,0 +1,48 @@
+"""CPU and network throttling applied through Chrome DevTools Protocol sessions."""
+
+from typing import Any, Dict
+
+from playwright.sync_api import BrowserContext, CDPSession, Page
+
+
+# Engines that expose a CDP session for emulation
+CDP_ENGINES = ("chromium",)
+
+
+def supports_throttling(browser_name: str) -> bool:
+    """Check if the browser engine can be throttled over CDP."""
+    return browser_name in CDP_ENGINES
+
+
+def kbps_to_bytes_per_second(kbps: float) -> float:
+    """Convert kilobits per second to bytes per second as CDP expects."""
+    return kbps * 1024 / 8
+
+
+def to_network_conditions(network: Dict[str, Any]) -> Dict[str, Any]:
+    """Build Network.emulateNetworkConditions parameters from a profile."""
+    download = network.get("download_kbps")
+    upload = network.get("upload_kbps")
+    return {
+        "offline": bool(network.get("offline", False)),
+        "latency": network.get("latency", 0),
+        # -1 disables throughput throttling
+        "downloadThroughput": kbps_to_bytes_per_second(download) if download else -1,
+        "uploadThroughput": kbps_to_bytes_per_second(upload) if upload else -1,
+    }
+
+
+def apply_throttling(context: BrowserContext, page: Page, profile: Dict[str, Any]) -> CDPSession:
+    """Apply CPU slowdown and network conditions to a page."""
+    session = context.new_cdp_session(page)
+
+    cpu_slowdown = profile.get("cpu_slowdown")
+    if cpu_slowdown:
+        session.send("Emulation.setCPUThrottlingRate", {"rate": cpu_slowdown})
+
+    network = profile.get("network")
+    if network:
+        session.send("Network.enable")
+        session.send("Network.emulateNetworkConditions", to_network_conditions(network))
+
+    return session
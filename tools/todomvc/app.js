@@ -0,0 +1,158 @@
+(function () {
+    'use strict';
+
+    var STORAGE_KEY = 'todos-local';
+    var ENTER_KEY = 'Enter';
+    var ESCAPE_KEY = 'Escape';
+
+    var todos = JSON.parse(localStorage.getItem(STORAGE_KEY) || '[]');
+    var nextId = todos.reduce(function (max, t) { return Math.max(max, t.id); }, 0) + 1;
+    var editingId = null;
+
+    var newTodo = document.querySelector('.new-todo');
+    var main = document.querySelector('.main');
+    var footerSlot = document.querySelector('.footer-slot');
+
+    function escapeHtml(text) {
+        var div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    function route() {
+        return (location.hash.replace(/^#\/?/, '') || 'all');
+    }
+
+    function visible() {
+        var filter = route();
+        return todos.filter(function (todo) {
+            if (filter === 'active') return !todo.completed;
+            if (filter === 'completed') return todo.completed;
+            return true;
+        });
+    }
+
+    function save() {
+        localStorage.setItem(STORAGE_KEY, JSON.stringify(todos));
+    }
+
+    function render() {
+        var active = todos.filter(function (t) { return !t.completed; }).length;
+        var completed = todos.length - active;
+        var filter = route();
+
+        if (!todos.length) {
+            // Like the React implementation, main and footer are removed when empty
+            main.innerHTML = '';
+            footerSlot.innerHTML = '';
+            return;
+        }
+
+        main.innerHTML =
+            '<input id="toggle-all" class="toggle-all" type="checkbox"' + (active ? '' : ' checked') + '>' +
+            '<label for="toggle-all">Mark all as complete</label>' +
+            '<ul class="todo-list">' + visible().map(function (todo) {
+                var classes = [todo.completed ? 'completed' : '', todo.id === editingId ? 'editing' : ''];
+                return '<li data-id="' + todo.id + '" class="' + classes.join(' ').trim() + '">' +
+                    '<div class="view">' +
+                    '<input class="toggle" type="checkbox"' + (todo.completed ? ' checked' : '') + '>' +
+                    '<label>' + escapeHtml(todo.title) + '</label>' +
+                    '<button class="destroy"></button>' +
+                    '</div>' +
+                    (todo.id === editingId ? '<input class="edit" value="' + escapeHtml(todo.title).replace(/"/g, '&quot;') + '">' : '') +
+                    '</li>';
+            }).join('') + '</ul>';
+
+        footerSlot.innerHTML =
+            '<footer class="footer">' +
+            '<span class="todo-count"><strong>' + active + '</strong> ' + (active === 1 ? 'item' : 'items') + ' left</span>' +
+            '<ul class="filters">' +
+            '<li><a href="#/"' + (filter === 'all' ? ' class="selected"' : '') + '>All</a></li>' +
+            '<li><a href="#/active"' + (filter === 'active' ? ' class="selected"' : '') + '>Active</a></li>' +
+            '<li><a href="#/completed"' + (filter === 'completed' ? ' class="selected"' : '') + '>Completed</a></li>' +
+            '</ul>' +
+            (completed ? '<button class="clear-completed">Clear completed</button>' : '') +
+            '</footer>';
+
+        var edit = main.querySelector('.edit');
+        if (edit) {
+            edit.focus();
+        }
+    }
+
+    function update() {
+        save();
+        render();
+    }
+
+    function findId(element) {
+        var li = element.closest('li[data-id]');
+        return li ? Number(li.getAttribute('data-id')) : null;
+    }
+
+    function finishEdit(input, commit) {
+        var id = findId(input);
+        if (editingId !== id) return;
+        editingId = null;
+        if (commit) {
+            var title = input.value.trim();
+            todos = title
+                ? todos.map(function (t) { return t.id === id ? Object.assign({}, t, { title: title }) : t; })
+                : todos.filter(function (t) { return t.id !== id; });
+        }
+        update();
+    }
+
+    newTodo.addEventListener('keydown', function (event) {
+        var title = newTodo.value.trim();
+        if (event.key !== ENTER_KEY || !title) return;
+        todos.push({ id: nextId++, title: title, completed: false });
+        newTodo.value = '';
+        update();
+    });
+
+    main.addEventListener('change', function (event) {
+        if (event.target.classList.contains('toggle-all')) {
+            var checked = event.target.checked;
+            todos = todos.map(function (t) { return Object.assign({}, t, { completed: checked }); });
+        } else if (event.target.classList.contains('toggle')) {
+            var id = findId(event.target);
+            todos = todos.map(function (t) { return t.id === id ? Object.assign({}, t, { completed: !t.completed }) : t; });
+        } else {
+            return;
+        }
+        update();
+    });
+
+    main.addEventListener('click', function (event) {
+        if (!event.target.classList.contains('destroy')) return;
+        var id = findId(event.target);
+        todos = todos.filter(function (t) { return t.id !== id; });
+        update();
+    });
+
+    main.addEventListener('dblclick', function (event) {
+        if (event.target.tagName !== 'LABEL') return;
+        editingId = findId(event.target);
+        render();
+    });
+
+    main.addEventListener('keydown', function (event) {
+        if (!event.target.classList.contains('edit')) return;
+        if (event.key === ENTER_KEY) finishEdit(event.target, true);
+        if (event.key === ESCAPE_KEY) finishEdit(event.target, false);
+    });
+
+    main.addEventListener('focusout', function (event) {
+        if (event.target.classList.contains('edit')) finishEdit(event.target, true);
+    });
+
+    footerSlot.addEventListener('click', function (event) {
+        if (!event.target.classList.contains('clear-completed')) return;
+        todos = todos.filter(function (t) { return !t.completed; });
+        update();
+    });
+
+    window.addEventListener('hashchange', render);
+    render();
+})();
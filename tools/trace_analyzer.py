@@ -0,0 +1,313 @@
+"""Offline analyzer for Playwright trace archives.
+
+Trace zips are read entry by entry with ``zipfile`` streams, so archives are
+never extracted to disk and only one JSON line is held in memory at a time.
+
+Usage:
+    python -m tools.trace_analyzer artifacts/traces
+    python -m tools.trace_analyzer artifacts/traces --workers 8 --output summary.jsonl
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+TRACE_SUFFIX = ".trace"
+NETWORK_SUFFIX = ".network"
+
+# Actions whose duration is time spent waiting rather than interacting
+WAIT_METHODS = ("waitFor", "expect", "waitForTimeout", "waitForLoadState", "waitForSelector")
+
+
+def iter_trace_events(archive: zipfile.ZipFile, suffix: str) -> Iterator[Dict[str, Any]]:
+    """Stream JSON events from every archive entry ending with suffix."""
+    for name in sorted(archive.namelist()):
+        if not name.endswith(suffix) or "/" in name:
+            continue
+        with archive.open(name) as raw:
+            for line in io.TextIOWrapper(raw, encoding="utf-8"):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def _is_wait(method: str) -> bool:
+    """Check if an action method is a wait."""
+    return method.startswith(WAIT_METHODS)
+
+
+def _request_start_ms(entry: Dict[str, Any]) -> Optional[float]:
+    """Get request start time in milliseconds from a HAR entry."""
+    if entry.get("_monotonicTime") is not None:
+        return float(entry["_monotonicTime"]) * 1000
+    started = entry.get("startedDateTime")
+    if started:
+        try:
+            return datetime.fromisoformat(started.replace("Z", "+00:00")).timestamp() * 1000
+        except ValueError:
+            return None
+    return None
+
+
+class TraceAnalyzer:
+    """Build per-action timing summaries from Playwright trace zips."""
+
+    def __init__(self, slowest: int = 5, waterfall_limit: int = 20):
+        """Initialize trace analyzer."""
+        self.slowest = slowest
+        self.waterfall_limit = waterfall_limit
+
+    def analyze(self, trace_path: Path) -> Dict[str, Any]:
+        """Analyze a single trace zip and return a compact summary."""
+        trace_path = Path(trace_path)
+        with zipfile.ZipFile(trace_path) as archive:
+            actions, console_errors = self._read_actions(archive)
+            network = self._read_network(archive)
+
+        finished = [a for a in actions.values() if a.get("duration_ms") is not None]
+        by_method: Dict[str, Dict[str, Any]] = {}
+        for action in finished:
+            stats = by_method.setdefault(
+                action["method"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += action["duration_ms"]
+            stats["max_ms"] = max(stats["max_ms"], action["duration_ms"])
+        for stats in by_method.values():
+            stats["total_ms"] = round(stats["total_ms"], 2)
+            stats["max_ms"] = round(stats["max_ms"], 2)
+
+        slowest = sorted(finished, key=lambda a: a["duration_ms"], reverse=True)[: self.slowest]
+
+        return {
+            "trace": trace_path.name,
+            "actions": len(finished),
+            "total_action_ms": round(sum(a["duration_ms"] for a in finished), 2),
+            "wait_ms": round(sum(a["duration_ms"] for a in finished if _is_wait(a["method"])), 2),
+            "actions_by_method": by_method,
+            "slowest_actions": [
+                {
+                    "action": a["title"],
+                    "duration_ms": round(a["duration_ms"], 2),
+                    "waits": a["waits"],
+                    **({"error": a["error"]} if a.get("error") else {}),
+                }
+                for a in slowest
+            ],
+            "action_errors": [
+                {"action": a["title"], "error": a["error"]} for a in finished if a.get("error")
+            ],
+            "console_errors": console_errors,
+            "network": network,
+        }
+
+    def _read_actions(self, archive: zipfile.ZipFile):
+        """Collect action timings and console errors from trace events."""
+        actions: Dict[str, Dict[str, Any]] = {}
+        console_errors: List[Dict[str, Any]] = []
+
+        for event in iter_trace_events(archive, TRACE_SUFFIX):
+            event_type = event.get("type")
+
+            if event_type == "before":
+                method = event.get("method", "")
+                actions[event.get("callId")] = {
+                    "method": method,
+                    "title": event.get("title") or f"{event.get('class', '')}.{method}",
+                    "start": event.get("startTime"),
+                    "duration_ms": None,
+                    "waits": 0,
+                }
+            elif event_type == "after":
+                action = actions.get(event.get("callId"))
+                if action and action["start"] is not None and event.get("endTime"):
+                    action["duration_ms"] = max(0.0, event["endTime"] - action["start"])
+                    error = event.get("error")
+                    if error:
+                        action["error"] = error.get("message", str(error))
+            elif event_type == "log":
+                action = actions.get(event.get("callId"))
+                if action and "waiting for" in event.get("message", ""):
+                    action["waits"] += 1
+            elif event_type == "action":
+                # Trace format before 1.31 stores the whole call in one event
+                metadata = event.get("metadata", {})
+                method = metadata.get("method", "")
+                start, end = metadata.get("startTime"), metadata.get("endTime")
+                actions[metadata.get("id", str(len(actions)))] = {
+                    "method": method,
+                    "title": metadata.get("apiName") or f"{metadata.get('type', '')}.{method}",
+                    "start": start,
+                    "duration_ms": max(0.0, end - start) if start and end else None,
+                    "waits": len([m for m in metadata.get("log", []) if "waiting for" in m]),
+                    "error": (metadata.get("error") or {}).get("error", {}).get("message"),
+                }
+            elif event_type == "console" and event.get("messageType") == "error":
+                console_errors.append({
+                    "text": event.get("text", ""),
+                    "location": event.get("location", {}).get("url", ""),
+                })
+            elif event_type == "event" and event.get("method") == "pageError":
+                error = event.get("params", {}).get("error", {})
+                console_errors.append({
+                    "text": error.get("error", {}).get("message", str(error)),
+                    "location": "pageerror",
+                })
+
+        return actions, console_errors
+
+    def _read_network(self, archive: zipfile.ZipFile) -> Dict[str, Any]:
+        """Build network totals and a compact waterfall from HAR snapshots."""
+        entries: List[Dict[str, Any]] = []
+        failed = 0
+        transfer_bytes = 0
+
+        for event in iter_trace_events(archive, NETWORK_SUFFIX):
+            if event.get("type") != "resource-snapshot":
+                continue
+            entry = event.get("snapshot", {})
+            response = entry.get("response", {})
+            status = response.get("status", 0)
+            if status <= 0 or status >= 400:
+                failed += 1
+            transfer_bytes += max(0, response.get("_transferSize", 0) or 0)
+            entries.append({
+                "url": entry.get("request", {}).get("url", ""),
+                "method": entry.get("request", {}).get("method", ""),
+                "status": status,
+                "start": _request_start_ms(entry),
+                "duration_ms": round(max(0.0, entry.get("time", 0) or 0), 2),
+                "wait_ms": round(max(0.0, entry.get("timings", {}).get("wait", 0) or 0), 2),
+            })
+
+        starts = [e["start"] for e in entries if e["start"] is not None]
+        origin = min(starts) if starts else 0.0
+        for entry in entries:
+            start = entry.pop("start")
+            entry["start_ms"] = round(start - origin, 2) if start is not None else None
+
+        # Keep the slowest requests, presented in start order
+        slowest = sorted(entries, key=lambda e: e["duration_ms"], reverse=True)
+        waterfall = sorted(
+            slowest[: self.waterfall_limit],
+            key=lambda e: e["start_ms"] if e["start_ms"] is not None else 0.0,
+        )
+        ends = [
+            e["start_ms"] + e["duration_ms"] for e in entries if e["start_ms"] is not None
+        ]
+
+        return {
+            "requests": len(entries),
+            "failed": failed,
+            "transfer_bytes": transfer_bytes,
+            "span_ms": round(max(ends), 2) if ends else 0.0,
+            "waterfall": waterfall,
+        }
+
+
+def analyze_trace(trace_path: Path, slowest: int = 5, waterfall_limit: int = 20) -> Dict[str, Any]:
+    """Analyze one trace zip; errors are reported in the summary."""
+    try:
+        return TraceAnalyzer(slowest, waterfall_limit).analyze(Path(trace_path))
+    except (OSError, zipfile.BadZipFile) as e:
+        return {"trace": Path(trace_path).name, "error": str(e)}
+
+
+def analyze_directory(
+    directory: Path,
+    workers: Optional[int] = None,
+    pattern: str = "*.zip",
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Analyze all trace zips in a directory in parallel across cores."""
+    paths = sorted(Path(directory).glob(pattern))
+    if not paths:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    analyze = partial(analyze_trace, **kwargs)
+    if workers == 1:
+        return [analyze(path) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(paths) // (workers * 4))
+        return list(executor.map(analyze, paths, chunksize=chunksize))
+
+
+def summarize_run(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate trace summaries to show where time goes across a run."""
+    by_method: Dict[str, Dict[str, Any]] = {}
+    totals = {"traces": 0, "actions": 0, "total_action_ms": 0.0, "wait_ms": 0.0,
+              "requests": 0, "failed_requests": 0, "transfer_bytes": 0, "console_errors": 0}
+
+    for summary in summaries:
+        if "error" in summary:
+            continue
+        totals["traces"] += 1
+        totals["actions"] += summary["actions"]
+        totals["total_action_ms"] += summary["total_action_ms"]
+        totals["wait_ms"] += summary["wait_ms"]
+        totals["requests"] += summary["network"]["requests"]
+        totals["failed_requests"] += summary["network"]["failed"]
+        totals["transfer_bytes"] += summary["network"]["transfer_bytes"]
+        totals["console_errors"] += len(summary["console_errors"])
+        for method, stats in summary["actions_by_method"].items():
+            merged = by_method.setdefault(method, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            merged["count"] += stats["count"]
+            merged["total_ms"] = round(merged["total_ms"] + stats["total_ms"], 2)
+            merged["max_ms"] = max(merged["max_ms"], stats["max_ms"])
+
+    totals["total_action_ms"] = round(totals["total_action_ms"], 2)
+    totals["wait_ms"] = round(totals["wait_ms"], 2)
+    totals["actions_by_method"] = dict(
+        sorted(by_method.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+    )
+    return totals
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Summarize Playwright trace zips")
+    parser.add_argument("path", type=Path, help="Trace zip or directory of trace zips")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel processes")
+    parser.add_argument("--slowest", type=int, default=5, help="Slowest actions to keep")
+    parser.add_argument("--waterfall", type=int, default=20, help="Requests kept in waterfall")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Append summaries as structured-log events to this JSONL file")
+    parser.add_argument("--run-id", default="local-run", help="Run id for structured-log events")
+    args = parser.parse_args(argv)
+
+    options = {"slowest": args.slowest, "waterfall_limit": args.waterfall}
+    if args.path.is_dir():
+        summaries = analyze_directory(args.path, workers=args.workers, **options)
+    else:
+        summaries = [analyze_trace(args.path, **options)]
+
+    if args.output:
+        from plugins.logging_plugin import StructuredLogger
+
+        logger = StructuredLogger(args.output, args.run_id)
+        for summary in summaries:
+            logger.log_trace_summary(summary["trace"], summary)
+        logger.log_event("trace_run_summary", summarize_run(summaries))
+
+    json.dump({"run": summarize_run(summaries), "traces": summaries}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
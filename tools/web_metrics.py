@@ -0,0 +1,230 @@
+"""Browser-side web performance metrics for page navigations."""
+
+import math
+import warnings
+import weakref
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional
+
+from configs import get_config_loader
+
+
+# Injected before any page script runs so buffered LCP, CLS and long task
+# entries are observed from the start of the navigation.
+PERFORMANCE_OBSERVER_SCRIPT = """
+(() => {
+    if (window.__pwPerf) return;
+    const perf = window.__pwPerf = { lcp: null, cls: 0, longTasks: [] };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({ type, buffered: true });
+        } catch (e) {
+            // Entry type not supported by this engine
+        }
+    };
+    observe('largest-contentful-paint', (e) => { perf.lcp = e.renderTime || e.startTime; });
+    observe('layout-shift', (e) => { if (!e.hadRecentInput) perf.cls += e.value; });
+    observe('longtask', (e) => { perf.longTasks.push(e.duration); });
+})();
+"""
+
+# Pages that already carry the observer init script
+_instrumented_pages: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+COLLECT_METRICS_SCRIPT = """
+() => {
+    const round = (v) => (v === null || v === undefined) ? null : Math.round(v * 100) / 100;
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = {};
+    performance.getEntriesByType('paint').forEach((p) => { paint[p.name] = p.startTime; });
+    const resources = performance.getEntriesByType('resource');
+    const perf = window.__pwPerf || { lcp: null, cls: null, longTasks: [] };
+    const transferred = resources.reduce(
+        (total, r) => total + (r.transferSize || 0), nav ? (nav.transferSize || 0) : 0);
+    return {
+        ttfb: nav ? round(nav.responseStart - nav.startTime) : null,
+        dom_content_loaded: nav ? round(nav.domContentLoadedEventEnd) : null,
+        load: nav ? round(nav.loadEventEnd) : null,
+        first_paint: round(paint['first-paint']),
+        first_contentful_paint: round(paint['first-contentful-paint']),
+        lcp: round(perf.lcp),
+        cls: perf.cls === null ? null : Math.round(perf.cls * 10000) / 10000,
+        long_tasks: perf.longTasks.length,
+        long_task_total_ms: round(perf.longTasks.reduce((a, b) => a + b, 0)),
+        long_task_max_ms: round(perf.longTasks.length ? Math.max(...perf.longTasks) : 0),
+        request_count: resources.length + (nav ? 1 : 0),
+        transfer_bytes: transferred,
+    };
+}
+"""
+
+METRIC_NAMES = [
+    "ttfb",
+    "dom_content_loaded",
+    "load",
+    "first_paint",
+    "first_contentful_paint",
+    "lcp",
+    "cls",
+    "long_tasks",
+    "long_task_total_ms",
+    "long_task_max_ms",
+    "request_count",
+    "transfer_bytes",
+]
+
+
+BUDGET_SEVERITIES = ("warn", "error")
+
+
+def install_performance_observer(page: Any) -> None:
+    """Inject the PerformanceObserver init script once per page."""
+    if page in _instrumented_pages:
+        return
+    page.add_init_script(PERFORMANCE_OBSERVER_SCRIPT)
+    _instrumented_pages.add(page)
+
+
+class PerformanceBudgetError(AssertionError):
+    """Raised when a navigation breaches an error-severity budget."""
+
+
+class PerformanceBudgetWarning(UserWarning):
+    """Warning for a navigation breaching a warn-severity budget."""
+
+
+def get_budgets(env: str) -> List[Dict[str, Any]]:
+    """Get default and environment-specific budgets from config.yaml."""
+    budgets = get_config_loader().get("performance_budgets", {})
+    return list(budgets.get("default") or []) + list(budgets.get(env) or [])
+
+
+def check_budgets(
+    url: str,
+    metrics: Dict[str, Any],
+    budgets: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Check metrics against budgets matching the URL and return breaches."""
+    breaches = []
+    for budget in budgets:
+        pattern = budget.get("url", "*")
+        if not fnmatch(url, pattern):
+            continue
+        severity = budget.get("severity", "warn")
+        if severity not in BUDGET_SEVERITIES:
+            raise ValueError(f"Unknown budget severity '{severity}' for '{pattern}'")
+        for name in METRIC_NAMES:
+            limit = budget.get(name)
+            value = metrics.get(name)
+            # Metrics an engine does not report cannot breach a budget
+            if limit is None or value is None:
+                continue
+            if value > limit:
+                breaches.append({
+                    "metric": name,
+                    "value": value,
+                    "budget": limit,
+                    "severity": severity,
+                    "url_pattern": pattern,
+                })
+    return breaches
+
+
+def enforce_budgets(url: str, env: str, breaches: List[Dict[str, Any]]) -> None:
+    """Warn on or fail for budget breaches, depending on their severity."""
+    errors = []
+    for breach in breaches:
+        message = (
+            f"{breach['metric']}={breach['value']} exceeds budget {breach['budget']} "
+            f"for {url} ({env}, {breach['url_pattern']})"
+        )
+        if breach["severity"] == "error":
+            errors.append(message)
+        else:
+            warnings.warn(message, PerformanceBudgetWarning, stacklevel=3)
+    if errors:
+        raise PerformanceBudgetError("Performance budget exceeded: " + "; ".join(errors))
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Get the nearest-rank percentile of values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class MetricsRecorder:
+    """Collect navigation metrics per test and aggregate them per URL and env."""
+
+    def __init__(self):
+        """Initialize metrics recorder."""
+        self.environment = "dev"
+        self.test_id: Optional[str] = None
+        self.records: List[Dict[str, Any]] = []
+        self._test_records: List[Dict[str, Any]] = []
+
+    def start_test(self, test_id: str) -> None:
+        """Start collecting metrics for a test."""
+        self.test_id = test_id
+        self._test_records = []
+
+    def finish_test(self) -> List[Dict[str, Any]]:
+        """Stop collecting for the current test and return its records."""
+        records, self._test_records = self._test_records, []
+        self.test_id = None
+        return records
+
+    def record(
+        self,
+        url: str,
+        metrics: Dict[str, Any],
+        breaches: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Record metrics and budget breaches for a navigation."""
+        entry = {
+            "url": url.split("#")[0],
+            "env": self.environment,
+            "test_id": self.test_id,
+            "metrics": metrics,
+        }
+        if breaches:
+            entry["budget_breaches"] = breaches
+        self.records.append(entry)
+        self._test_records.append(entry)
+        return entry
+
+    def aggregate(self, records: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Aggregate metrics per env and URL as count, p50, p95 and max."""
+        grouped: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        for entry in self.records if records is None else records:
+            by_url = grouped.setdefault(entry["env"], {}).setdefault(entry["url"], {})
+            by_url.setdefault("_navigations", []).append(1)
+            for name in METRIC_NAMES:
+                value = entry["metrics"].get(name)
+                if value is not None:
+                    by_url.setdefault(name, []).append(value)
+
+        summary: Dict[str, Any] = {}
+        for env, urls in grouped.items():
+            for url, metrics in urls.items():
+                stats: Dict[str, Any] = {"navigations": len(metrics.pop("_navigations"))}
+                for name, values in metrics.items():
+                    stats[name] = {
+                        "p50": percentile(values, 50),
+                        "p95": percentile(values, 95),
+                        "max": max(values),
+                    }
+                summary.setdefault(env, {})[url] = stats
+        return summary
+
+
+# Global instance
+metrics_recorder = MetricsRecorder()
+
+
+def get_metrics_recorder() -> MetricsRecorder:
+    """Get global metrics recorder instance."""
+    return metrics_recorder
@@ -0,0 +1,243 @@
+"""Resource-aware xdist worker sizing and memory-pressure throttling.
+
+Limits are read the way a container sees them: CPU quota and memory limit
+from cgroups (v2 or v1) before the host's cores and /proc/meminfo, and free
+space on /dev/shm, which browsers use for shared memory and which Docker
+caps at 64 MB by default. The worker count is the smallest of the CPU,
+memory and /dev/shm budgets for the engines in use.
+"""
+
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+# cgroup v1 reports "no limit" as a huge page-aligned number
+_UNLIMITED = 1 << 60
+
+# Executable path fragments of each engine's browser processes, as installed by Playwright
+ENGINE_EXECUTABLES = {
+    "chromium": ("chrom", "headless_shell"),
+    "firefox": ("firefox",),
+    "webkit": ("webkit", "pw_run", "minibrowser"),
+}
+
+
+def _read(path: Path) -> Optional[str]:
+    """Read a small system file, or None when it does not exist."""
+    try:
+        return path.read_text().strip()
+    except (OSError, ValueError):
+        return None
+
+
+class HostResources:
+    """CPU, memory and /dev/shm limits of this host or container."""
+
+    def __init__(self, root: Path = Path("/")):
+        """Initialize host resources; root is "/" except in tests."""
+        self.root = Path(root)
+        self.cgroup = self.root / "sys" / "fs" / "cgroup"
+
+    def cpu_count(self) -> int:
+        """Get usable CPUs: affinity, capped by a cgroup CPU quota."""
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+
+        quota = period = None
+        cpu_max = _read(self.cgroup / "cpu.max")
+        if cpu_max:
+            value, _, period_value = cpu_max.partition(" ")
+            if value != "max":
+                quota, period = int(value), int(period_value or 100000)
+        else:
+            quota_value = _read(self.cgroup / "cpu" / "cpu.cfs_quota_us")
+            period_value = _read(self.cgroup / "cpu" / "cpu.cfs_period_us")
+            if quota_value and period_value and int(quota_value) > 0:
+                quota, period = int(quota_value), int(period_value)
+        if quota and period:
+            cpus = min(cpus, max(1, quota // period))
+        return cpus
+
+    def _meminfo(self) -> Dict[str, int]:
+        """Get /proc/meminfo fields in bytes."""
+        fields = {}
+        for line in (_read(self.root / "proc" / "meminfo") or "").splitlines():
+            name, _, value = line.partition(":")
+            parts = value.split()
+            if parts and parts[0].isdigit():
+                fields[name] = int(parts[0]) * 1024
+        return fields
+
+    def _cgroup_memory(self) -> Optional[Tuple[int, int]]:
+        """Get (used, limit) bytes of the cgroup memory limit, or None when unlimited."""
+        limit = _read(self.cgroup / "memory.max")
+        used = _read(self.cgroup / "memory.current")
+        if limit is None:
+            limit = _read(self.cgroup / "memory" / "memory.limit_in_bytes")
+            used = _read(self.cgroup / "memory" / "memory.usage_in_bytes")
+        if not limit or limit == "max" or not used or int(limit) >= _UNLIMITED:
+            return None
+        return int(used), int(limit)
+
+    def memory(self) -> Tuple[int, int]:
+        """Get (available, total) bytes of memory, whichever of host and cgroup is tighter."""
+        meminfo = self._meminfo()
+        total = meminfo.get("MemTotal", 0)
+        available = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        cgroup = self._cgroup_memory()
+        if cgroup:
+            used, limit = cgroup
+            total = min(total, limit) if total else limit
+            available = min(available, limit - used) if meminfo else limit - used
+        return max(0, available), total
+
+    def memory_used_fraction(self) -> float:
+        """Get the fraction of memory in use, 0 when it cannot be read."""
+        available, total = self.memory()
+        return 1 - available / total if total else 0.0
+
+    def shm(self) -> Optional[Tuple[int, int]]:
+        """Get (free, total) bytes of /dev/shm, or None without one."""
+        try:
+            stats = os.statvfs(self.root / "dev" / "shm")
+        except OSError:
+            return None
+        return stats.f_bavail * stats.f_frsize, stats.f_blocks * stats.f_frsize
+
+    def shm_used_fraction(self) -> float:
+        """Get the fraction of /dev/shm in use, 0 without one."""
+        shm = self.shm()
+        return 1 - shm[0] / shm[1] if shm and shm[1] else 0.0
+
+    def _children(self) -> Dict[int, List[int]]:
+        """Get the child pids of every process."""
+        children: Dict[int, List[int]] = {}
+        for stat_path in (self.root / "proc").glob("[0-9]*/stat"):
+            stat = _read(stat_path)
+            if not stat:
+                continue
+            # Fields after the command name, which may contain spaces and parentheses
+            fields = stat.rpartition(")")[2].split()
+            children.setdefault(int(fields[1]), []).append(int(stat_path.parent.name))
+        return children
+
+    def _executable(self, pid: int) -> str:
+        """Get the lower-cased executable path a process was started with."""
+        cmdline = _read(self.root / "proc" / str(pid) / "cmdline") or ""
+        return cmdline.split("\0")[0].lower()
+
+    def process_rss(self, pid: int) -> int:
+        """Get the resident memory in bytes of one process."""
+        statm = _read(self.root / "proc" / str(pid) / "statm")
+        page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        return int(statm.split()[1]) * page_size if statm else 0
+
+    def process_tree_rss(self, pid: int, children: Optional[Dict[int, List[int]]] = None) -> int:
+        """Get the resident memory in bytes of a process and all its descendants."""
+        children = self._children() if children is None else children
+        rss, pending = 0, [pid]
+        while pending:
+            current = pending.pop()
+            rss += self.process_rss(current)
+            pending.extend(children.get(current, []))
+        return rss
+
+    def footprint(self, pid: int, engines: Iterable[str]) -> Tuple[int, Dict[str, int]]:
+        """Split the memory of a process tree into its own base and each engine's browsers.
+
+        Browsers are the top-most descendants whose executable matches an
+        engine; the base is everything else, i.e. Python and the Playwright driver.
+        """
+        children = self._children()
+        fragments = {engine: ENGINE_EXECUTABLES.get(engine, (engine,)) for engine in engines}
+        browsers = {engine: 0 for engine in fragments}
+        base, pending = 0, [pid]
+        while pending:
+            current = pending.pop()
+            executable = self._executable(current) if current != pid else ""
+            engine = next((e for e, names in fragments.items() if any(n in executable for n in names)), None)
+            if engine:
+                browsers[engine] += self.process_tree_rss(current, children)
+            else:
+                base += self.process_rss(current)
+                pending.extend(children.get(current, []))
+        return base, browsers
+
+
+def auto_worker_count(
+    resources: HostResources,
+    engines: Iterable[str],
+    footprint_mb: Mapping[str, float],
+    shm_mb: Mapping[str, float],
+    reserve_mb: float = 1024,
+    max_workers: Optional[int] = None,
+    base_mb: float = 0
+) -> Tuple[int, Dict[str, Any]]:
+    """Get the worker count the CPUs, memory and /dev/shm allow, and each limit.
+
+    Every worker runs one browser of each engine in ``engines``, so a worker
+    costs its own base memory plus the sum of the browsers' memory and
+    /dev/shm use.
+    """
+    engines = list(engines) or ["chromium"]
+    limits: Dict[str, Any] = {"cpu": resources.cpu_count()}
+
+    available, _ = resources.memory()
+    worker_mb = base_mb + sum(footprint_mb.get(engine, 0) for engine in engines)
+    if worker_mb > 0:
+        limits["memory"] = int((available / MB - reserve_mb) // worker_mb)
+
+    shm = resources.shm()
+    worker_shm_mb = sum(shm_mb.get(engine, 0) for engine in engines)
+    if shm and worker_shm_mb > 0:
+        limits["shm"] = int(shm[0] / MB // worker_shm_mb)
+
+    if max_workers:
+        limits["max_workers"] = max_workers
+    return max(1, min(limits.values())), limits
+
+
+class MemoryThrottle:
+    """Hold back test starts while memory or /dev/shm is close to full."""
+
+    def __init__(
+        self,
+        resources: HostResources,
+        max_used: float = 0.9,
+        poll_interval: float = 0.5,
+        max_wait: float = 60.0
+    ):
+        """Initialize memory throttle."""
+        self.resources = resources
+        self.max_used = max_used
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self.stats = {"throttled": 0, "waited": 0.0}
+
+    def under_pressure(self) -> bool:
+        """Check if memory or /dev/shm use is at or above the limit."""
+        return max(self.resources.memory_used_fraction(), self.resources.shm_used_fraction()) >= self.max_used
+
+    def wait(self) -> float:
+        """Wait until pressure drops or max_wait passes; return seconds waited."""
+        if not self.under_pressure():
+            return 0.0
+        started = time.monotonic()
+        self.stats["throttled"] += 1
+        while self.under_pressure():
+            if time.monotonic() - started >= self.max_wait:
+                logger.warning("Memory still above %.0f%% after %.0fs, starting test anyway",
+                               self.max_used * 100, self.max_wait)
+                break
+            time.sleep(self.poll_interval)
+        waited = time.monotonic() - started
+        self.stats["waited"] += waited
+        return waited